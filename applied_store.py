@@ -0,0 +1,150 @@
+import os
+import sys
+import time
+import sqlite3
+import threading
+
+from job_urls import job_key, extract_job_id
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "applied_jobs.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applied_jobs (
+    job_key      TEXT PRIMARY KEY,
+    platform     TEXT,
+    job_id       TEXT,
+    title        TEXT,
+    company      TEXT,
+    link         TEXT,
+    status       TEXT,
+    succeeded    INTEGER NOT NULL DEFAULT 0,
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    first_seen   REAL NOT NULL,
+    last_attempt REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class AppliedJobsStore:
+    """SQLite-backed record of every posting the bot has processed, keyed by canonical job ID.
+
+    The table is clustered on job_key, so a lookup is a single index probe regardless of
+    how many millions of rows have accumulated.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, max_attempts=2):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def get(self, url):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, succeeded, attempts, last_attempt FROM applied_jobs WHERE job_key = ?",
+                (job_key(url),)).fetchone()
+        if row is None:
+            return None
+        return {"status": row[0], "succeeded": bool(row[1]), "attempts": row[2], "last_attempt": row[3]}
+
+    def should_skip(self, url):
+        """True if the posting was already applied to, or has used up its retry attempts"""
+        entry = self.get(url)
+        return bool(entry and (entry["succeeded"] or entry["attempts"] >= self.max_attempts))
+
+    def record(self, result, final=False):
+        """Upsert one result dict (title, company, link, status) from the apply loop.
+
+        final uses up the posting's attempts without counting it as a success, for jobs that
+        must not be retried (e.g. possibly submitted before a crash).
+        """
+        link = result.get("link", "")
+        extracted = extract_job_id(link) or (None, None)
+        status = result.get("status", "")
+        succeeded = 1 if "Applied successfully" in status else 0
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """INSERT INTO applied_jobs
+                       (job_key, platform, job_id, title, company, link, status, succeeded, attempts, first_seen, last_attempt)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(job_key) DO UPDATE SET
+                       title = excluded.title, company = excluded.company, link = excluded.link,
+                       status = excluded.status,
+                       succeeded = MAX(applied_jobs.succeeded, excluded.succeeded),
+                       attempts = MAX(applied_jobs.attempts + 1, excluded.attempts),
+                       last_attempt = excluded.last_attempt""",
+                (job_key(link), extracted[0], extracted[1], result.get("title"), result.get("company"),
+                 link, status, succeeded, self.max_attempts if final else 1, now, now))
+
+    def stats(self):
+        with self._lock:
+            total, succeeded = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(succeeded), 0) FROM applied_jobs").fetchone()
+        return {"total": total, "succeeded": succeeded, "path": self.path}
+
+    def compact(self, older_than_days=None):
+        """Drop failed entries older than older_than_days (if given), then rebuild the file"""
+        removed = 0
+        with self._lock:
+            if older_than_days is not None:
+                cutoff = time.time() - older_than_days * 86400
+                removed = self._conn.execute(
+                    "DELETE FROM applied_jobs WHERE succeeded = 0 AND last_attempt < ?", (cutoff,)).rowcount
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.execute("VACUUM")
+        return removed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_applied_store():
+    """Return the process-wide store (APPLIED_STORE_PATH / APPLIED_STORE_MAX_ATTEMPTS from config.env)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = AppliedJobsStore(
+                path=os.getenv("APPLIED_STORE_PATH", DEFAULT_DB_PATH),
+                max_attempts=int(os.getenv("APPLIED_STORE_MAX_ATTEMPTS", "2")),
+            )
+        return _store
+
+
+def main():
+    usage = "Usage: python applied_store.py [stats | compact [--older-than DAYS]]"
+    args = sys.argv[1:]
+    if not args or args[0] not in ("stats", "compact"):
+        print(usage)
+        return
+
+    store = get_applied_store()
+    if args[0] == "stats":
+        stats = store.stats()
+        print(f"📦 {stats['total']} jobs recorded, {stats['succeeded']} applied successfully ({stats['path']})")
+        return
+
+    older_than = None
+    if "--older-than" in args:
+        try:
+            older_than = float(args[args.index("--older-than") + 1])
+        except (IndexError, ValueError):
+            print(usage)
+            return
+    size_before = os.path.getsize(store.path)
+    removed = store.compact(older_than)
+    size_after = os.path.getsize(store.path)
+    print(f"✓ Compacted {store.path}: removed {removed} stale entries, "
+          f"{size_before / 1024:.0f} KB -> {size_after / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
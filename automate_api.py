@@ -1,11 +1,22 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
-from danish_job_bot import run_job_automation
+from danish_job_bot import run_job_automation, resume_job_automation
+from driver_pool import get_driver_pool
+from waits import get_wait_stats
+from pacing import get_pacing_stats
+from job_queue import create_job_queue, sse_format, QueueFullError, QuotaExceededError, RunActiveError
+from run_checkpoint import RunCheckpoint, checkpoint_path, unfinished_runs
+from results_log import iter_records, summarize, GROUPINGS
+from resume_cache import get_resume_cache, UploadTooLargeError
+from uploads import read_upload_request, streaming_request_class
+from resume_profile import get_profile_cache, load_resume_profile
 import os
+import json
+import hmac
+import uuid
+import hashlib
 import logging
 from datetime import datetime
-import tempfile
-import base64
 
 app = Flask(__name__)
 
@@ -24,6 +35,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ✅ Pre-launch browsers in the background so the first /apply doesn't pay Chrome start-up
+driver_pool = get_driver_pool()
+driver_pool.start(background=True)
+
+# ✅ /apply only enqueues; a bounded worker pool runs the Selenium sessions
+job_queue = create_job_queue()
+
+# Callers without an API token run as this tenant (or as their username) and never get a saved session
+ANONYMOUS_ACCOUNT = "anonymous"
+
+def load_api_tokens(path):
+    """{account: SHA-256 hex digest of its API token} from a JSON file (API_TOKENS_PATH in config.env)"""
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as file:
+            return {account: digest.lower() for account, digest in json.load(file).items()}
+    except (OSError, ValueError, AttributeError) as e:
+        logger.error(f"Could not load API tokens from {path}: {e}")
+        return {}
+
+api_tokens = load_api_tokens(os.getenv("API_TOKENS_PATH"))
+
+def authenticated_account():
+    """The account whose API token the request carries ('Authorization: Bearer <token>'), or None"""
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token.strip():
+        return None
+    digest = hashlib.sha256(token.strip().encode("utf-8")).hexdigest()
+    for account, expected in api_tokens.items():
+        if hmac.compare_digest(digest, expected):
+            return account
+    return None
+
+def resolve_account(data, account=None):
+    """(account, use_saved_session) for a request; PermissionError if it may not act as that account.
+
+    A caller holding an account's API token runs as it and may use its saved sessions. Anyone
+    else runs as the username they sign in with (or as the anonymous tenant) and never restores
+    a saved session. account is what the request must run as, e.g. the account of a resumed run.
+    """
+    wanted = account or data.get("account")
+    authenticated = authenticated_account()
+    if authenticated:
+        if wanted and wanted != authenticated:
+            raise PermissionError(f"the API token is not valid for account '{wanted}'")
+        return authenticated, True
+    own = data.get("username") or ANONYMOUS_ACCOUNT
+    if wanted and wanted != own:
+        raise PermissionError(f"send the API token of account '{wanted}' to run as it")
+    return own, False
+
+# ✅ Uploaded CVs are stored once by SHA-256 and reused by hash across requests
+resume_cache = get_resume_cache()
+# ✅ Uploads stream to disk in chunks (multipart parts and base64 JSON fields alike), never whole in memory
+app.request_class = streaming_request_class(resume_cache)
+
 # ✅ Add explicit CORS headers to all responses
 @app.after_request
 def after_request(response):
@@ -47,28 +115,14 @@ def apply():
     try:
         logger.info(f"Received request from origin: {request.headers.get('Origin', 'Unknown')}")
         
-        # Handle both JSON and FormData requests
-        if request.is_json:
-            # Handle JSON data
-            data = request.json
-            logger.info("Received JSON request")
-        else:
-            # Handle FormData (file uploads)
-            data = request.form.to_dict()
-            logger.info("Received FormData request")
-            
-            # Handle file upload from FormData
-            resume_file = request.files.get('resume')
-            if resume_file:
-                # Save uploaded file to temporary location
-                temp_file = tempfile.NamedTemporaryFile(
-                    delete=False, 
-                    suffix='.pdf',
-                    prefix='resume_'
-                )
-                resume_file.save(temp_file.name)
-                data['resume_path'] = temp_file.name
-                logger.info(f"Saved uploaded resume to: {temp_file.name}")
+        # Handle both JSON and FormData requests; uploaded files land in the resume cache as they stream in
+        try:
+            data = read_upload_request(request, resume_cache)
+        except UploadTooLargeError as e:
+            return jsonify({"error": f"Upload too large: {e}"}), 413
+        except ValueError as e:
+            return jsonify({"error": f"Invalid request body: {e}"}), 400
+        logger.info(f"Received {'JSON' if request.is_json else 'FormData'} request")
         
         logger.info(f"Received application request: {data.get('search_term', 'unknown')}")
         
@@ -78,37 +132,76 @@ def apply():
             if field not in data or not data[field]:
                 return jsonify({"error": f"Missing or empty field: {field}"}), 400
         
-        # Handle file uploads (base64 encoded or file paths)
-        resume_path = handle_file_upload(data.get("resume_file"), data.get("resume_path"), "resume")
+        # Handle file uploads (a hash from POST /resumes, an uploaded file or a file path)
+        resume_path = handle_file_upload(data, "resume")
+        if not resume_path and data.get("resume_hash"):
+            return jsonify({"error": "Unknown resume_hash; upload the file to /resumes first"}), 404
         if not resume_path:
             return jsonify({"error": "Resume file is required"}), 400
         
-        cover_letter_path = handle_file_upload(data.get("cover_letter_file"), data.get("cover_letter_path"), "cover_letter")
+        cover_letter_path = handle_file_upload(data, "cover_letter")
         
         # Validate max_jobs is reasonable
         max_jobs = int(data.get("max_jobs", 5))
         if max_jobs < 1 or max_jobs > 5:  # Limited to 5 as requested
             return jsonify({"error": "max_jobs must be between 1 and 5"}), 400
         
-        logger.info(f"Starting job application for: {data['search_term']}")
+        platform = (data.get("platform") or "linkedin").strip().lower()
+        if platform not in ("linkedin", "indeed"):
+            return jsonify({"error": "platform must be 'linkedin' or 'indeed'"}), 400
         
-        # Run the automation
-        result = run_job_automation(
-            search_term=data["search_term"],
-            resume_path=resume_path,
-            max_jobs=max_jobs,
-            location=data.get("location", ""),
-            experience_level=data.get("experience_level", ""),
-            job_type=data.get("job_type", ""),
-            date_posted=data.get("date_posted", ""),
-            cover_letter_path=cover_letter_path or ""
-        )
+        # Requests are scheduled per account, so each tenant gets its own queue, concurrency and quota
+        try:
+            tenant, use_saved_session = resolve_account(data)
+        except PermissionError as e:
+            return jsonify({"error": f"Forbidden: {e}"}), 403
+        if platform == "linkedin" and not use_saved_session and not (data.get("username") and data.get("password")):
+            return jsonify({"error": "Send the account's API token (Authorization: Bearer ...) "
+                                     "or a LinkedIn username and password"}), 401
         
-        # Clean up temporary files
-        cleanup_temp_files([resume_path, cover_letter_path])
+        params = {
+            "search_term": data["search_term"],
+            "resume_path": resume_path,
+            "cover_letter_path": cover_letter_path or "",
+            "max_jobs": max_jobs,
+            "location": data.get("location", ""),
+            "experience_level": data.get("experience_level", ""),
+            "job_type": data.get("job_type", ""),
+            "date_posted": data.get("date_posted", ""),
+            "platform": platform,
+            "username": data.get("username"),
+            "password": data.get("password"),
+        }
+        params["account"] = tenant
+        params["use_saved_session"] = use_saved_session
+        # The run's checkpoint id, for POST /apply/<run_id>/resume after a crash or restart
+        params["run_id"] = f"run_{uuid.uuid4().hex[:12]}"
         
-        logger.info(f"Job application completed. Success: {result.get('success', False)}")
-        return jsonify(result)
+        # Keep the cached files from being evicted until the worker is done with them
+        resume_cache.pin(resume_path, cover_letter_path)
+        try:
+            job = job_queue.submit(
+                params,
+                run_queued_application,
+                on_finish=lambda job: resume_cache.unpin(resume_path, cover_letter_path),
+                tenant=tenant
+            )
+        except QuotaExceededError as e:
+            resume_cache.unpin(resume_path, cover_letter_path)
+            return jsonify({"success": False, "error": f"Daily limit reached: {e}."}), 429
+        except QueueFullError as e:
+            resume_cache.unpin(resume_path, cover_letter_path)
+            return jsonify({"success": False, "error": f"Server busy: {e}. Please retry shortly."}), 503
+        
+        logger.info(f"Queued job application {job.id} for: {data['search_term']} (tenant {tenant})")
+        return jsonify({
+            "success": True,
+            "job_id": job.id,
+            "run_id": params["run_id"],
+            "status": job.status,
+            "status_url": f"/apply/{job.id}",
+            "stream_url": f"/apply/{job.id}/stream"
+        }), 202
         
     except Exception as e:
         logger.error(f"Error in job application: {str(e)}")
@@ -120,50 +213,201 @@ def apply():
             "jobs": []  # Return empty jobs array for frontend
         }), 500
 
-def handle_file_upload(file_data, file_path, file_type):
-    """Handle file upload from base64 data or file path"""
+def run_queued_application(params, on_result):
+    """Worker-side entry point: run the automation for one queued /apply request"""
+    return run_job_automation(
+        search_term=params["search_term"],
+        resume_path=params["resume_path"],
+        max_jobs=params["max_jobs"],
+        location=params["location"],
+        experience_level=params["experience_level"],
+        job_type=params["job_type"],
+        date_posted=params["date_posted"],
+        cover_letter_path=params["cover_letter_path"],
+        platform=params["platform"],
+        account=params["account"],
+        username=params["username"],
+        # Not kept on the job once the run has it
+        password=params.pop("password", None),
+        on_result=on_result,
+        run_id=params["run_id"],
+        use_saved_session=params["use_saved_session"]
+    )
+
+@app.route("/apply/<run_id>/resume", methods=["POST"])
+def apply_resume(run_id):
+    """Queue the rest of an interrupted run from its checkpoint (no jobs are applied to twice)"""
+    path = checkpoint_path(os.path.basename(run_id))
+    if not os.path.exists(path):
+        return jsonify({"success": False, "error": f"No checkpoint for run: {run_id}"}), 404
+    checkpoint = RunCheckpoint(path, append=False)
+    if checkpoint.finished:
+        return jsonify({"success": False, "error": f"Run {run_id} already finished"}), 409
+    if checkpoint.run_id in job_queue.active_runs():
+        return jsonify({"success": False, "error": f"Run {run_id} is still queued or running"}), 409
+
     try:
-        # If base64 data is provided, save it as temp file
-        if file_data:
-            try:
-                # Decode base64 data
-                file_content = base64.b64decode(file_data)
-                
-                # Create temporary file
-                temp_file = tempfile.NamedTemporaryFile(
-                    delete=False, 
-                    suffix='.pdf',
-                    prefix=f'{file_type}_'
-                )
-                temp_file.write(file_content)
-                temp_file.close()
-                
-                logger.info(f"Created temporary {file_type} file: {temp_file.name}")
-                return temp_file.name
-                
-            except Exception as e:
-                logger.error(f"Error processing {file_type} file data: {e}")
-                return None
-        
-        # If file path is provided, validate it exists
-        elif file_path and os.path.exists(file_path):
-            return file_path
-            
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error handling {file_type} upload: {e}")
-        return None
+        data = read_upload_request(request, resume_cache) if request.content_length else {}
+    except UploadTooLargeError as e:
+        return jsonify({"error": f"Upload too large: {e}"}), 413
+    except ValueError as e:
+        return jsonify({"error": f"Invalid request body: {e}"}), 400
+    # The run's cached CV is reused unless it has since been evicted or a new one is sent
+    resume_path = handle_file_upload(data, "resume")
+    if not resume_path and not os.path.exists(checkpoint.params.get("resume_path") or ""):
+        return jsonify({"error": "Resume file is required"}), 400
+    resume_path = resume_path or checkpoint.params["resume_path"]
 
-def cleanup_temp_files(file_paths):
-    """Clean up temporary files"""
-    for file_path in file_paths:
-        if file_path and file_path.startswith(tempfile.gettempdir()):
-            try:
-                os.unlink(file_path)
-                logger.info(f"Cleaned up temp file: {file_path}")
-            except:
-                pass
+    try:
+        tenant, use_saved_session = resolve_account(data, checkpoint.params.get("account") or ANONYMOUS_ACCOUNT)
+    except PermissionError as e:
+        return jsonify({"success": False, "error": f"Forbidden: {e}"}), 403
+    if (checkpoint.params.get("platform") or "linkedin") == "linkedin" and not use_saved_session \
+            and not (data.get("username") and data.get("password")):
+        return jsonify({"success": False, "error": "Send the account's API token (Authorization: Bearer ...) "
+                                                   "or its LinkedIn username and password"}), 401
+    params = {
+        "run_id": checkpoint.run_id,
+        "resume_path": resume_path,
+        "max_jobs": max(1, int(checkpoint.params.get("max_jobs") or 1) - len(checkpoint.results)),
+        "account": tenant,
+        "username": data.get("username"),
+        "password": data.get("password"),
+        "use_saved_session": use_saved_session,
+    }
+    resume_cache.pin(resume_path)
+    try:
+        job = job_queue.submit(
+            params,
+            run_queued_resume,
+            on_finish=lambda job: resume_cache.unpin(resume_path),
+            tenant=tenant
+        )
+    except QuotaExceededError as e:
+        resume_cache.unpin(resume_path)
+        return jsonify({"success": False, "error": f"Daily limit reached: {e}."}), 429
+    except RunActiveError as e:
+        resume_cache.unpin(resume_path)
+        return jsonify({"success": False, "error": f"Cannot resume: {e}."}), 409
+    except QueueFullError as e:
+        resume_cache.unpin(resume_path)
+        return jsonify({"success": False, "error": f"Server busy: {e}. Please retry shortly."}), 503
+
+    logger.info(f"Queued resume of run {checkpoint.run_id} as job {job.id} (tenant {tenant})")
+    return jsonify({
+        "success": True,
+        "job_id": job.id,
+        "run_id": checkpoint.run_id,
+        "status": job.status,
+        "status_url": f"/apply/{job.id}",
+        "stream_url": f"/apply/{job.id}/stream"
+    }), 202
+
+def run_queued_resume(params, on_result):
+    """Worker-side entry point for a queued resume"""
+    return resume_job_automation(params["run_id"], params["resume_path"], on_result=on_result,
+                                 max_jobs=params.get("max_jobs"), username=params.get("username"),
+                                 password=params.pop("password", None),
+                                 use_saved_session=params["use_saved_session"])
+
+@app.route("/runs", methods=["GET"])
+def runs():
+    """Checkpointed runs that never finished and are not queued or running, newest first"""
+    return jsonify({"runs": [{key: value for key, value in run.items() if key != "path"}
+                             for run in unfinished_runs(active=job_queue.active_runs())]})
+
+@app.route("/apply/<job_id>", methods=["GET"])
+def apply_status(job_id):
+    """Poll the status and per-job progress of a queued application run"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": f"Unknown job id: {job_id}"}), 404
+    return jsonify(job.to_dict())
+
+@app.route("/apply/<job_id>/stream", methods=["GET"])
+def apply_stream(job_id):
+    """Server-sent events: one 'progress' event per processed job, then 'done'"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": f"Unknown job id: {job_id}"}), 404
+
+    def generate():
+        for event, data in job.events():
+            if event is None:
+                yield ": keepalive\n\n"
+            else:
+                yield sse_format(event, data)
+
+    response = Response(stream_with_context(generate()), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+def handle_file_upload(data, file_type):
+    """The file for file_type: a hash from POST /resumes, a file cached from this request, or a file path"""
+    if data.get(f"{file_type}_hash"):
+        return resume_cache.path_for(data[f"{file_type}_hash"])
+    file_path = data.get(f"{file_type}_path")
+    if file_path and os.path.exists(file_path):
+        return file_path
+    return None
+
+@app.route("/resumes", methods=["POST"])
+def upload_resume():
+    """Upload a CV once (multipart 'resume' or JSON base64 'resume_file'); later requests send its hash"""
+    try:
+        data = read_upload_request(request, resume_cache)
+    except UploadTooLargeError as e:
+        return jsonify({"error": f"Upload too large: {e}"}), 413
+    except ValueError as e:
+        return jsonify({"error": f"Invalid request body: {e}"}), 400
+    # Only a file sent with this request counts, not a path on the server
+    file_hash = resume_cache.digest_of(data.get("resume_path"))
+    if file_hash is None:
+        return jsonify({"error": "Resume file is required"}), 400
+    return jsonify({
+        "success": True,
+        "resume_hash": file_hash,
+        "filename": os.path.basename(data["resume_path"]),
+        "size": os.path.getsize(data["resume_path"]),
+        # Parsed now so applications using this hash find the profile cached
+        "profile": load_resume_profile(data["resume_path"], file_hash)
+    }), 201
+
+@app.route("/resumes/<resume_hash>", methods=["GET"])
+def resume_status(resume_hash):
+    """Lets a client check whether it still needs to upload a CV before sending only its hash"""
+    path = resume_cache.path_for(resume_hash)
+    if path is None:
+        return jsonify({"exists": False}), 404
+    return jsonify({"exists": True, "filename": os.path.basename(path), "size": os.path.getsize(path)})
+
+@app.route("/resumes/<resume_hash>/profile", methods=["GET"])
+def resume_profile(resume_hash):
+    """Skills, experience, education and contact details parsed from an uploaded CV"""
+    path = resume_cache.path_for(resume_hash)
+    if path is None:
+        return jsonify({"error": "Unknown resume_hash; upload the file to /resumes first"}), 404
+    profile = load_resume_profile(path, resume_cache.digest_of(path))
+    if profile is None:
+        return jsonify({"error": "Could not parse the resume (PDF, DOCX or TXT)"}), 422
+    return jsonify(profile)
+
+@app.route("/results/summary", methods=["GET"])
+def results_summary():
+    """Success rates from the results log, grouped by ?by= (run, day, platform, ...) since ?since="""
+    by = request.args.get("by", "run")
+    if by not in GROUPINGS:
+        return jsonify({"error": f"by must be one of: {', '.join(GROUPINGS)}"}), 400
+    return jsonify({"by": by, "groups": summarize(iter_records(since=request.args.get("since")), by)})
+
+@app.route("/tenants", methods=["GET"])
+def tenants():
+    """Per-account queue depth, wait times and daily quota usage"""
+    return jsonify({
+        "job_queue": job_queue.stats(),
+        "tenants": job_queue.tenant_stats()
+    })
 
 @app.route("/health", methods=["GET"])
 def health():
@@ -172,20 +416,23 @@ def health():
         "message": "Job bot API is running",
         "timestamp": datetime.now().isoformat(),
         "environment": "cloud" if os.getenv('RENDER') else "local",
-        "cors_enabled": True
+        "cors_enabled": True,
+        "driver_pool": driver_pool.stats(),
+        "job_queue": job_queue.stats(),
+        "waits": get_wait_stats(),
+        "pacing": get_pacing_stats(),
+        "resume_cache": resume_cache.stats(),
+        "resume_profiles": get_profile_cache().stats()
     })
 
 @app.route("/test", methods=["POST"])
 def test_endpoint():
     """Test endpoint to verify the bot setup without running full automation"""
     try:
-        from danish_job_bot import setup_driver
-        
-        # Test browser setup
-        driver = setup_driver()
-        driver.get("https://www.linkedin.com")
-        title = driver.title
-        driver.quit()
+        # Test browser setup using a pooled session
+        with driver_pool.driver() as driver:
+            driver.get("https://www.linkedin.com")
+            title = driver.title
         
         return jsonify({
             "success": True,
@@ -213,4 +460,4 @@ def cors_test():
 if __name__ == "__main__":
     port = int(os.environ.get('PORT', 5000))
     logger.info(f"Starting Flask app on port {port}")
-    app.run(host="0.0.0.0", port=port, debug=False)
\ No newline at end of file
+    app.run(host="0.0.0.0", port=port, debug=False, threaded=True)
\ No newline at end of file
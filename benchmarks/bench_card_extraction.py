@@ -0,0 +1,108 @@
+"""Micro-benchmark: per-card find_element extraction vs. the single-pass card probe.
+
+Loads saved search result pages (benchmarks/fixtures/) in headless Chrome and compares
+WebDriver round-trips and latency for reading every card's metadata on the page.
+
+    python benchmarks/bench_card_extraction.py --runs 10
+"""
+import os
+import argparse
+import pathlib
+
+from common import headless_driver, measure, report
+
+from selenium.webdriver.common.by import By
+from job_discovery import find_cards
+from page_probes import extract_cards
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGES = {"linkedin": "linkedin_results.html", "indeed": "indeed_results.html"}
+
+
+def legacy_linkedin_card(card):
+    """The pre-probe extraction: nested find_element calls with fallbacks"""
+    try:
+        job_title = card.find_element(By.XPATH, ".//h3 | .//a[contains(@class, 'job-title')]").text
+    except Exception:
+        try:
+            job_title = card.find_element(By.XPATH, ".//a").text
+        except Exception:
+            job_title = "Unknown Title"
+    try:
+        company = card.find_element(By.XPATH, ".//h4 | .//a[contains(@class, 'company')]").text
+    except Exception:
+        company = "Unknown Company"
+    try:
+        job_link = card.find_element(By.TAG_NAME, "a").get_attribute("href")
+    except Exception:
+        try:
+            job_link = card.get_attribute("href")
+        except Exception:
+            job_link = None
+    return {"title": job_title, "company": company, "link": job_link}
+
+
+def legacy_indeed_card(card):
+    try:
+        job_title_elem = card.find_element(By.XPATH, ".//h2//a | .//span[@title] | .//a[contains(@data-jk, '')]")
+        job_title = job_title_elem.get_attribute("title") or job_title_elem.text
+    except Exception:
+        try:
+            job_title = card.find_element(By.XPATH, ".//a").text
+        except Exception:
+            job_title = "Unknown Title"
+    try:
+        company = card.find_element(By.XPATH,
+            ".//span[@class='companyName'] | .//a[contains(@data-testid, 'company')] | .//span[contains(@class, 'company')]").text
+    except Exception:
+        company = "Unknown Company"
+    try:
+        job_link = card.find_element(By.XPATH, ".//h2//a | .//a[contains(@data-jk, '')]").get_attribute("href")
+    except Exception:
+        job_link = None
+    return {"title": job_title, "company": company, "link": job_link}
+
+
+LEGACY_EXTRACTORS = {"linkedin": legacy_linkedin_card, "indeed": legacy_indeed_card}
+
+
+def legacy_extract(platform):
+    def _extract(driver):
+        return [LEGACY_EXTRACTORS[platform](card) for card in find_cards(driver, platform)]
+    return _extract
+
+
+def _path_and_query(url):
+    # Fixtures load from file://, so the legacy path resolves relative links against the file URL
+    return url.split("://", 1)[-1].split("/", 1)[-1] if url else url
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    driver = headless_driver()
+    try:
+        for platform, page in PAGES.items():
+            driver.get(pathlib.Path(FIXTURES, page).as_uri())
+            cards = extract_cards(driver, platform)
+            print(f"\n--- {platform}: {page} ({len(cards)} cards) ---")
+            legacy = measure(driver, legacy_extract(platform), args.runs)
+            probe = measure(driver, lambda d: extract_cards(d, platform), args.runs)
+            report("legacy per-card find_element", *legacy)
+            report("single execute_script", *probe)
+
+            expected = legacy_extract(platform)(driver)
+            assert len(expected) == len(cards)
+            for old, new in zip(expected, cards):
+                assert (old["title"], old["company"]) == (new["title"], new["company"])
+                assert _path_and_query(old["link"]).lstrip("/") in new["link"]
+            print(f"{'':<28} with location on {sum(1 for c in cards if c['location'])}/{len(cards)} cards, "
+                  f"Easy Apply on {sum(1 for c in cards if c['easy_apply'])}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
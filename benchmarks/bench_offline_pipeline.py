@@ -0,0 +1,107 @@
+"""End-to-end benchmark: search_and_apply_for_jobs against the offline fake site.
+
+Starts benchmarks/fake_site.py on a free port, points the bot at it and runs the full
+search -> discover -> apply pipeline in headless Chrome, then reports jobs/minute,
+WebDriver calls per job and p50/p95 latency for each traced pipeline step (see tracing.py).
+
+    python benchmarks/bench_offline_pipeline.py --platform both --jobs 10 --latency-ms 50 --trace-dir traces
+"""
+import os
+import time
+import argparse
+import tempfile
+
+from common import REPO_ROOT, headless_driver, percentile, RoundTripCounter
+from fake_site import FakeSite
+
+import tracing
+from driver_metrics import InstrumentedDriver
+
+# Answers for the contact fields, so fill_form_fields does not prompt on stdin
+FIELD_MAPPING = {"phone": "+91 90000 00000", "email": "candidate@example.com", "city": "Pune"}
+
+
+def run_platform(bot, driver, platform, jobs, resume_path):
+    search_and_apply = (bot.search_and_apply_for_jobs if platform == "linkedin"
+                        else bot.search_and_apply_for_jobs_indeed)
+    tracing.reset_spans()
+    with RoundTripCounter(driver) as counter:
+        started = time.perf_counter()
+        results = search_and_apply(driver, "python developer", resume_path, max_jobs=jobs,
+                                   skip_processed=False)
+        elapsed = time.perf_counter() - started
+    return results, elapsed, counter.count, tracing.get_spans()
+
+
+def print_report(platform, results, elapsed, round_trips, spans, submitted):
+    applied = sum(1 for result in results if "Applied successfully" in result["status"])
+    per_job = round_trips / len(results) if results else 0.0
+    print(f"\n=== {platform}: {len(results)} jobs processed, {applied} applied, "
+          f"{submitted} submissions received by the fake site ===")
+    print(f"throughput        {len(results) / (elapsed / 60):>8.2f} jobs/min ({elapsed:.1f}s total, "
+          f"includes pacing waits)")
+    print(f"WebDriver calls   {per_job:>8.1f} per job ({round_trips} total, including search and discovery)")
+    job_calls = [result["webdriver"]["calls"] for result in results if result.get("webdriver")]
+    if job_calls:
+        print(f"apply_for_job     p50 {percentile(job_calls, 50)} / p95 {percentile(job_calls, 95)} calls per job")
+    samples = {}
+    for record in spans:
+        samples.setdefault(record["name"], []).append(record)
+    print(f"{'step':<16} {'count':>6} {'p50 ms':>10} {'p95 ms':>10} {'total s':>9} {'calls/step':>11}")
+    for step, records in sorted(samples.items()):
+        durations = [record["duration_ms"] for record in records]
+        calls = sum(record["webdriver_calls"] for record in records) / len(records)
+        print(f"{step:<16} {len(records):>6} {percentile(durations, 50):>10.1f} "
+              f"{percentile(durations, 95):>10.1f} {sum(durations) / 1000:>9.2f} {calls:>11.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--platform", choices=("linkedin", "indeed", "both"), default="both")
+    parser.add_argument("--jobs", type=int, default=10, help="applications per platform")
+    parser.add_argument("--total-jobs", type=int, default=60, help="postings the fake site lists")
+    parser.add_argument("--latency-ms", type=int, default=0, help="delay added to every page response")
+    parser.add_argument("--wait-profile", default="fast", help="WAIT_PROFILE for the run")
+    parser.add_argument("--pace-per-hour", type=int, default=1200,
+                        help="pacer start and ceiling rate (1200/h = the old fixed 3s pause)")
+    parser.add_argument("--resume", default=os.path.join(REPO_ROOT, "Danish_CV.pdf"))
+    parser.add_argument("--trace-dir", help="also write each platform's spans as JSONL + Chrome trace files")
+    args = parser.parse_args()
+
+    site = FakeSite(total_jobs=args.total_jobs, latency_ms=args.latency_ms).start()
+    # The bot reads its site roots at import time
+    os.environ["LINKEDIN_BASE_URL"] = site.linkedin_url
+    os.environ["INDEED_BASE_URL"] = site.indeed_url
+    os.environ["WAIT_PROFILE"] = args.wait_profile
+    os.environ["PACING_START_RATE_PER_HOUR"] = os.environ["PACING_MAX_RATE_PER_HOUR"] = str(args.pace_per_hour)
+    import danish_job_bot
+    danish_job_bot.get_user_field_mapping = lambda: dict(FIELD_MAPPING)
+
+    platforms = ("linkedin", "indeed") if args.platform == "both" else (args.platform,)
+    resume_path = os.path.abspath(args.resume)
+    tracing.enable()
+    driver = InstrumentedDriver(headless_driver())
+    trace_dir = os.path.abspath(args.trace_dir) if args.trace_dir else None
+    cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as scratch:
+            os.chdir(scratch)  # The bot drops debugging screenshots into the working directory
+            try:
+                for platform in platforms:
+                    before = len(site.applications)
+                    results, elapsed, round_trips, spans = run_platform(
+                        danish_job_bot, driver, platform, args.jobs, resume_path)
+                    print_report(platform, results, elapsed, round_trips, spans,
+                                 len(site.applications) - before)
+                    if trace_dir:
+                        paths = tracing.export_trace(trace_dir, prefix=f"bench_{platform}")
+                        print(f"trace: {paths[1]}")
+            finally:
+                os.chdir(cwd)
+    finally:
+        driver.quit()
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark: relevance scoring throughput for batches of result cards.
+
+Builds synthetic cards (title, company, snippet) from a mix of on- and off-profile job
+titles, scores them against the profile parsed from the sample CV in one batch, and
+reports time per batch and per card plus how many would be skipped before opening.
+
+    python benchmarks/bench_relevance.py --cards 1000 5000 20000 --runs 5
+"""
+import os
+import random
+import argparse
+import statistics
+import time
+
+from common import REPO_ROOT
+
+from relevance import RelevanceScorer, relevance_settings
+from resume_profile import ProfileCache
+
+ON_PROFILE = ["Python Developer", "Senior Python Engineer", "Machine Learning Engineer", "Django Developer",
+              "Data Scientist", "Deep Learning Researcher", "Java Backend Developer", "Cloud Engineer (AWS)",
+              "AI Engineer", "Software Engineer, ML Platform"]
+OFF_PROFILE = ["Sales Manager", "Registered Nurse", "Accountant", "Warehouse Operative", "HR Business Partner",
+               "Chef de Partie", "Marketing Coordinator", "Truck Driver", "Legal Counsel", "Receptionist"]
+SNIPPET_WORDS = ["Python", "TensorFlow", "Kubernetes", "Excel", "customer", "PostgreSQL", "team", "PyTorch",
+                 "budget", "Linux", "shifts", "React", "Spring", "negotiation", "MySQL", "patients"]
+
+
+def build_cards(count, seed=7):
+    rng = random.Random(seed)
+    return [{
+        "title": rng.choice(ON_PROFILE if rng.random() < 0.4 else OFF_PROFILE),
+        "company": f"Company {rng.randrange(500)}",
+        "snippet": " ".join(rng.sample(SNIPPET_WORDS, 3)),
+    } for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--resume", default=os.path.join(REPO_ROOT, "Danish_CV_NO_GIT.docx"))
+    args = parser.parse_args()
+
+    profile = ProfileCache(directory=None).get(args.resume)
+    scorer = RelevanceScorer.for_profile(profile, "Python Developer")
+    _, threshold, _ = relevance_settings()
+    print(f"{len(scorer.query)} query terms from {len(profile['skills'])} resume skills, threshold {threshold:g}\n")
+    for count in args.cards:
+        cards = build_cards(count)
+        timings = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            selected, skipped = scorer.select(cards, threshold=threshold)
+            timings.append((time.perf_counter() - started) * 1000)
+        median = statistics.median(timings)
+        print(f"{count:>7} cards: {median:8.2f} ms/batch  {median * 1000 / count:6.2f} µs/card  "
+              f"{len(selected)} kept, {len(skipped)} skipped without opening")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark: page weight and load time with and without the CDP resource filter.
+
+Starts benchmarks/fake_site.py, whose pages carry a tracking script, a banner image, a web
+font and a video, and loads the LinkedIn and Indeed results and job pages first unfiltered
+(the baseline) and then with each platform's rules from data/resource_filters.json.
+Reports bytes transferred, load time and what the filter saved per kind of page.
+
+    python benchmarks/bench_resource_filter.py --runs 5 --asset-kb 400 --asset-latency-ms 150
+"""
+import argparse
+
+from common import headless_driver, percentile
+from fake_site import FakeSite
+
+import resource_filter
+
+
+def page_urls(site, platform, runs):
+    """A results page plus `runs` distinct job pages for a platform"""
+    if platform == "linkedin":
+        results = f"{site.linkedin_url}/jobs/search/?keywords=python"
+        jobs = [f"{site.linkedin_url}/jobs/view/job-{4000000000 + index}/" for index in range(runs)]
+    else:
+        results = f"{site.indeed_url}/jobs?q=python"
+        jobs = [f"{site.indeed_url}/viewjob?jk=fa4e{index:012x}" for index in range(runs)]
+    return [results] * runs + jobs
+
+
+def load_all(driver, urls):
+    pages = []
+    for url in urls:
+        driver.get(url)
+        pages += resource_filter.collect_pages(driver)
+    return pages
+
+
+def print_report(platform, baseline, filtered):
+    print(f"\n--- {platform} ---")
+    print(f"{'page':<28} {'mode':<10} {'pages':>5} {'KB/page':>9} {'p50 load ms':>12} "
+          f"{'p95 load ms':>12} {'blocked':>8}")
+    for kind in sorted({page["kind"] for page in baseline + filtered}):
+        for mode, pages in (("baseline", baseline), ("filtered", filtered)):
+            pages = [page for page in pages if page["kind"] == kind and page["load_ms"] is not None]
+            if not pages:
+                continue
+            loads = [page["load_ms"] for page in pages]
+            print(f"{kind:<28} {mode:<10} {len(pages):>5} "
+                  f"{sum(page['bytes'] for page in pages) / len(pages) / 1024:>9.1f} "
+                  f"{percentile(loads, 50):>12.1f} {percentile(loads, 95):>12.1f} "
+                  f"{sum(page['blocked'] for page in pages) / len(pages):>8.1f}")
+        saved = [page for page in filtered if page["kind"] == kind and page["load_ms_saved"] is not None]
+        if saved:
+            print(f"{'':<28} saved {sum(page['bytes_saved'] for page in saved) / len(saved) / 1024:.1f} KB "
+                  f"and {sum(page['load_ms_saved'] for page in saved) / len(saved):.1f} ms per page")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="loads per page kind and mode")
+    parser.add_argument("--platform", choices=("linkedin", "indeed", "both"), default="both")
+    parser.add_argument("--asset-kb", type=int, default=200)
+    parser.add_argument("--asset-latency-ms", type=int, default=100)
+    args = parser.parse_args()
+
+    platforms = ("linkedin", "indeed") if args.platform == "both" else (args.platform,)
+    site = FakeSite(asset_kb=args.asset_kb, asset_latency_ms=args.asset_latency_ms).start()
+    driver = headless_driver(performance_log=True)
+    try:
+        for platform in platforms:
+            urls = page_urls(site, platform, args.runs)
+            resource_filter.disable_filter(driver)
+            driver.get_log("performance")  # Drop what the log holds from the previous platform
+            baseline = load_all(driver, urls)
+            resource_filter.apply_filter(driver, platform)
+            filtered = load_all(driver, urls)
+            print_report(platform, baseline, filtered)
+        resource_filter.print_filter_summary()
+    finally:
+        driver.quit()
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Micro-benchmark: per-XPath success detection vs. the single in-page probe.
+
+Loads a synthetic job page (with and without a success banner) in headless Chrome and
+compares WebDriver round-trips and latency per success check.
+
+    python benchmarks/bench_success_probe.py --runs 20
+"""
+import argparse
+import urllib.parse
+
+from common import headless_driver, measure, report
+
+from selenium.webdriver.common.by import By
+from page_probes import detect_application_result, load_success_indicators
+
+
+def legacy_is_application_successful(driver):
+    """The pre-probe implementation: one find_elements per indicator plus is_displayed per match"""
+    table = load_success_indicators()
+    for indicator in table["indicators"]:
+        try:
+            elements = driver.find_elements(By.XPATH, indicator["xpath"])
+            if elements and any(element.is_displayed() for element in elements):
+                return True
+        except Exception:
+            continue
+    try:
+        for button in driver.find_elements(By.XPATH, table["apply_button"]["xpath"]):
+            if "applied" in button.text.lower() or "applied" in (button.get_attribute("aria-label") or "").lower():
+                return True
+    except Exception:
+        pass
+    return False
+
+
+def build_page(success):
+    # A modal-sized DOM with plenty of divs/spans so the XPaths have real work to do
+    filler = "".join(f"<div class='row'><span>Question {i}</span><p>Answer text {i}</p></div>" for i in range(300))
+    banner = "<div class='artdeco-inline-feedback--success'>Your application was sent</div>" if success else ""
+    html = (f"<html><body><div role='dialog'>{filler}"
+            f"<button aria-label='Apply to job'>Apply</button>{banner}</div></body></html>")
+    return "data:text/html;charset=utf-8," + urllib.parse.quote(html)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    driver = headless_driver()
+    try:
+        for label, success in (("no banner (worst case)", False), ("success banner", True)):
+            driver.get(build_page(success))
+            print(f"\n--- page: {label} ---")
+            legacy = measure(driver, legacy_is_application_successful, args.runs)
+            probe = measure(driver, detect_application_result, args.runs)
+            report("legacy find_elements loop", *legacy)
+            report("single execute_script", *probe)
+            assert legacy_is_application_successful(driver) == detect_application_result(driver)["success"]
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
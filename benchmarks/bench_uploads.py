@@ -0,0 +1,144 @@
+"""Benchmark: peak server memory for concurrent resume uploads, legacy vs streaming.
+
+Serves two Flask endpoints on a local port: the old handling (request.json, then one
+base64.b64decode of the whole field and a temp-file write, or werkzeug's default multipart
+parsing) and uploads.read_upload_request, which streams both encodings into the resume cache.
+Clients stream their bodies from disk and one warm-up request runs before tracing starts,
+so the peak traced by tracemalloc is what the server holds for the uploads themselves.
+Werkzeug's development server allocates a 10 MB buffer when it drains a finished request,
+so roughly 10 MB is a floor in every row; production WSGI servers do not do this.
+
+    python benchmarks/bench_uploads.py --size-mb 5 --concurrency 8
+"""
+import os
+import json
+import time
+import logging
+import base64
+import shutil
+import argparse
+import tempfile
+import threading
+import tracemalloc
+import http.client
+
+from common import REPO_ROOT  # noqa: F401  (puts the bot modules on sys.path)
+
+from flask import Flask, request, jsonify
+from werkzeug.serving import make_server
+
+from resume_cache import ResumeCache
+from uploads import read_upload_request, streaming_request_class
+
+BOUNDARY = "----benchboundary"
+
+
+def build_app(cache, streaming):
+    app = Flask(__name__)
+    if streaming:
+        app.request_class = streaming_request_class(cache)
+
+    @app.route("/upload", methods=["POST"])
+    def upload():
+        if streaming:
+            data = read_upload_request(request, cache)
+            return jsonify({"path": data.get("resume_path")})
+        # The pre-streaming handler
+        if request.is_json:
+            content = base64.b64decode(request.json["resume_file"])
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf", prefix="resume_")
+            temp_file.write(content)
+            temp_file.close()
+        else:
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf", prefix="resume_")
+            request.files["resume"].save(temp_file.name)
+        os.unlink(temp_file.name)
+        return jsonify({"path": temp_file.name})
+    return app
+
+
+def write_bodies(directory, size_mb):
+    """One JSON (base64) and one multipart request body with a random payload, written to disk"""
+    payload = b"%PDF-1.4\n" + os.urandom(int(size_mb * 1024 * 1024))
+    json_path = os.path.join(directory, "body.json")
+    with open(json_path, "wb") as file:
+        file.write(b'{"search_term": "Python Developer", "resume_file": "')
+        file.write(base64.b64encode(payload))
+        file.write(b'", "resume_filename": "cv.pdf"}')
+    multipart_path = os.path.join(directory, "body.multipart")
+    with open(multipart_path, "wb") as file:
+        file.write(f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"search_term\"\r\n\r\n"
+                   f"Python Developer\r\n--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"resume\"; "
+                   f"filename=\"cv.pdf\"\r\nContent-Type: application/pdf\r\n\r\n".encode())
+        file.write(payload)
+        file.write(f"\r\n--{BOUNDARY}--\r\n".encode())
+    return {"json": (json_path, "application/json"),
+            "multipart": (multipart_path, f"multipart/form-data; boundary={BOUNDARY}")}
+
+
+def post(port, body_path, content_type):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+    with open(body_path, "rb") as body:
+        connection.request("POST", "/upload", body=body, headers={
+            "Content-Type": content_type, "Content-Length": str(os.path.getsize(body_path))})
+    response = connection.getresponse()
+    response.read()
+    connection.close()
+    return response.status
+
+
+def run(app, body_path, content_type, concurrency):
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    post(server.port, body_path, content_type)
+    statuses = []
+    go = threading.Event()
+
+    def client():
+        go.wait()
+        statuses.append(post(server.port, body_path, content_type))
+
+    # Client threads start before tracing so only the requests themselves are measured
+    clients = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread_ in clients:
+        thread_.start()
+    tracemalloc.start()
+    started = time.perf_counter()
+    go.set()
+    for thread_ in clients:
+        thread_.join()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    server.shutdown()
+    return peak, elapsed, statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    workdir = tempfile.mkdtemp(prefix="bench_uploads_")
+    try:
+        bodies = write_bodies(workdir, args.size_mb)
+        cache = ResumeCache(os.path.join(workdir, "cache"), max_bytes=1024 ** 3)
+        print(f"{args.concurrency} concurrent uploads of a {args.size_mb:g} MB resume\n")
+        for encoding, (body_path, content_type) in bodies.items():
+            for label, streaming in (("legacy", False), ("streaming", True)):
+                peak, elapsed, statuses = run(build_app(cache, streaming), body_path, content_type,
+                                              args.concurrency)
+                ok = sum(1 for status in statuses if status == 200)
+                print(f"{encoding:>9} {label:>9}: peak {peak / (1024 * 1024):7.1f} MB "
+                      f"({peak / (args.size_mb * 1024 * 1024 * args.concurrency):4.2f}x payload)  "
+                      f"{elapsed:5.2f}s  {ok}/{len(statuses)} ok")
+        print("\n" + json.dumps(cache.stats()))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import statistics
+
+# Benchmarks run from the repo root or from benchmarks/; make the bot modules importable either way
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def headless_driver(performance_log=False):
+    """A plain headless Chrome for benchmarks (no stealth patching, nothing to log in to)"""
+    from selenium import webdriver
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1280,900")
+    if performance_log:
+        # The DevTools network log resource_filter.collect_pages() reads
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return webdriver.Chrome(options=options)
+
+
+class RoundTripCounter:
+    """Counts WebDriver commands sent by a driver (and its elements) while active"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.count = 0
+        self._original = driver.execute
+
+    def __enter__(self):
+        def counting_execute(command, params=None):
+            self.count += 1
+            return self._original(command, params)
+        self.driver.execute = counting_execute
+        self.count = 0
+        return self
+
+    def __exit__(self, *exc):
+        self.driver.execute = self._original
+
+
+def measure(driver, fn, runs):
+    """Run fn(driver) `runs` times; return (round-trips per call, latencies in ms)"""
+    latencies = []
+    with RoundTripCounter(driver) as counter:
+        for _ in range(runs):
+            started = time.perf_counter()
+            fn(driver)
+            latencies.append((time.perf_counter() - started) * 1000)
+    return counter.count / runs, latencies
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def report(name, round_trips, latencies):
+    print(f"{name:<28} round-trips/call {round_trips:>7.1f}   "
+          f"mean {statistics.mean(latencies):>8.1f} ms   p95 {percentile(latencies, 95):>8.1f} ms")
@@ -0,0 +1,310 @@
+"""Offline stand-in for the LinkedIn and Indeed pages the bot drives.
+
+Serves the search page, paginated result cards, job pages, the multi-step Easy Apply
+flow (with a resume file input), a LinkedIn login form and the success banners from the templates in
+benchmarks/fixtures/site/, so search_and_apply_for_jobs can run without a network.
+Pages also pull in the kind of weight the real sites carry (a tracking script, a banner
+image, a web font and a video) so the resource filter can be measured offline.
+Point the bot at it with LINKEDIN_BASE_URL=<url>/linkedin and INDEED_BASE_URL=<url>/indeed.
+
+    python benchmarks/fake_site.py --port 8800 --total-jobs 60
+"""
+import os
+import re
+import json
+import html
+import time
+import argparse
+import threading
+from string import Template
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, urlencode
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "site")
+
+TITLES = ["Python Developer", "Backend Engineer", "Data Engineer", "Full Stack Developer", "DevOps Engineer",
+          "Machine Learning Engineer", "QA Automation Engineer", "Software Engineer II", "Platform Engineer",
+          "Junior Web Developer"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Hooli", "Vandelay Industries", "Stark Analytics",
+             "Wayne Systems", "Soylent Data", "Tyrell Robotics"]
+LOCATIONS = ["Bengaluru, Karnataka, India", "Pune, Maharashtra, India", "Hyderabad, Telangana, India", "Remote",
+             "Mumbai, Maharashtra, India"]
+
+# Results per page, matching job_discovery.PAGE_PARAMS
+PAGE_SIZES = {"linkedin": 25, "indeed": 10}
+
+# Heavy page assets: path prefix -> (content type, size as a multiple of asset_kb)
+ASSETS = {
+    "/static/media/banner": ("image/jpeg", 1),
+    "/static/media/intro": ("video/mp4", 4),
+    "/static/fonts/": ("font/woff2", 0.25),
+    "/linkedin/li/track": ("application/javascript", 0.5),
+    "/indeed/rpc/log": ("application/javascript", 0.5),
+}
+
+LINKEDIN_ID_OFFSET = 4000000000
+_LINKEDIN_VIEW_RE = re.compile(r"^/linkedin/jobs/view/(?:[^/]*-)?(\d+)/?$")
+
+
+def _slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def job_fields(index):
+    """Template fields for catalogue job `index` (the same posting on both platforms)"""
+    title = TITLES[index % len(TITLES)]
+    company = COMPANIES[(index * 3) % len(COMPANIES)]
+    return {
+        "title": title,
+        "company": company,
+        "location": LOCATIONS[index % len(LOCATIONS)],
+        "slug": f"{_slug(title)}-at-{_slug(company)}",
+        "company_slug": _slug(company),
+        "job_id": str(LINKEDIN_ID_OFFSET + index),
+        "jk": f"fa4e{index:012x}",
+        "ref": f"r{index:06d}",
+    }
+
+
+def _index_from_jk(jk):
+    try:
+        return int(jk[4:], 16)
+    except (TypeError, ValueError):
+        return None
+
+
+class FakeSite:
+    """A local HTTP server for the fake job sites; use as a context manager or start()/stop()"""
+
+    def __init__(self, host="127.0.0.1", port=0, total_jobs=60, latency_ms=0, asset_kb=200, asset_latency_ms=0):
+        self.host = host
+        self.port = port
+        self.total_jobs = total_jobs
+        self.latency_ms = latency_ms
+        self.asset_kb = asset_kb
+        self.asset_latency_ms = asset_latency_ms
+        self.applications = []
+        self._lock = threading.Lock()
+        self._templates = {}
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def linkedin_url(self):
+        return f"{self.base_url}/linkedin"
+
+    @property
+    def indeed_url(self):
+        return f"{self.base_url}/indeed"
+
+    def start(self):
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self._server.site = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-site", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def record_application(self, payload):
+        with self._lock:
+            self.applications.append(payload)
+
+    def render(self, name, **fields):
+        if name not in self._templates:
+            with open(os.path.join(SITE_DIR, name), encoding="utf-8") as file:
+                self._templates[name] = Template(file.read())
+        escaped = {key: value if key in ("cards", "pagination") else html.escape(str(value))
+                   for key, value in fields.items()}
+        return self._templates[name].safe_substitute(escaped)
+
+    # ----- pages -----
+
+    def results_page(self, platform, query):
+        keywords = (query.get("keywords") or query.get("q") or [""])[0]
+        start = int((query.get("start") or ["0"])[0] or 0)
+        page_size = PAGE_SIZES[platform]
+        base = self.linkedin_url if platform == "linkedin" else self.indeed_url
+
+        cards = []
+        for position, index in enumerate(range(start, min(start + page_size, self.total_jobs))):
+            cards.append(self.render(f"{platform}_card.html", base=base, position=position + 1,
+                                     page=start // page_size, **job_fields(index)))
+
+        pagination = ""
+        if start + page_size < self.total_jobs:
+            next_query = {key: values[0] for key, values in query.items()}
+            next_query["start"] = str(start + page_size)
+            path = "/jobs/search/" if platform == "linkedin" else "/jobs"
+            next_url = html.escape(f"{base}{path}?{urlencode(next_query)}")
+            if platform == "linkedin":
+                pagination = f'<button aria-label="View next page" data-href="{next_url}">Next</button>'
+            else:
+                pagination = (f'<a data-testid="pagination-page-next" aria-label="Next Page" '
+                              f'href="{next_url}">Next</a>')
+        return self.render(f"{platform}_results.html", base=base, keywords=keywords,
+                           cards="\n".join(cards), pagination=pagination)
+
+    def asset(self, path):
+        """(content type, padding bytes) for a heavy asset path, or None"""
+        for prefix, (content_type, scale) in ASSETS.items():
+            if path.startswith(prefix):
+                size = int(self.asset_kb * 1024 * scale)
+                if content_type == "application/javascript":
+                    return content_type, b"/*" + b"x" * max(0, size - 4) + b"*/"
+                return content_type, bytes(size)
+        return None
+
+    def route(self, path, query, signed_in=False):
+        """(status, content type, body or redirect location) for a GET request"""
+        if path == "/static/apply_flow.js":
+            with open(os.path.join(SITE_DIR, "apply_flow.js"), encoding="utf-8") as file:
+                return 200, "application/javascript", file.read()
+        if path == "/static/brand.css":
+            with open(os.path.join(SITE_DIR, "brand.css"), encoding="utf-8") as file:
+                return 200, "text/css", file.read()
+        if path == "/api/applications":
+            with self._lock:
+                return 200, "application/json", json.dumps(self.applications)
+
+        if path == "/linkedin/login":
+            return 200, "text/html", self.render("linkedin_login.html", base=self.linkedin_url)
+        if path in ("/linkedin/feed", "/linkedin/feed/"):
+            # Members-only: the session probe expects a redirect to the login page without li_at
+            if not signed_in:
+                return 302, "text/html", f"{self.linkedin_url}/login"
+            return 200, "text/html", "<html><body><h1>Feed</h1></body></html>"
+        if path in ("/linkedin/jobs", "/linkedin/jobs/"):
+            return 200, "text/html", self.render("linkedin_jobs.html", base=self.linkedin_url)
+        if path in ("/linkedin/jobs/search", "/linkedin/jobs/search/"):
+            return 200, "text/html", self.results_page("linkedin", query)
+        match = _LINKEDIN_VIEW_RE.match(path)
+        if match:
+            index = int(match.group(1)) - LINKEDIN_ID_OFFSET
+            if 0 <= index < self.total_jobs:
+                return 200, "text/html", self.render("linkedin_view.html", base=self.linkedin_url,
+                                                     **job_fields(index))
+
+        if path in ("/indeed", "/indeed/"):
+            return 200, "text/html", self.render("indeed_home.html", base=self.indeed_url)
+        if path == "/indeed/jobs":
+            return 200, "text/html", self.results_page("indeed", query)
+        jk = (query.get("jk") or [None])[0]
+        index = _index_from_jk(jk)
+        if index is not None and 0 <= index < self.total_jobs:
+            if path == "/indeed/rc/clk":
+                return 302, "text/html", f"{self.indeed_url}/viewjob?jk={jk}"
+            if path == "/indeed/viewjob":
+                return 200, "text/html", self.render("indeed_view.html", base=self.indeed_url,
+                                                     **job_fields(index))
+            if path == "/indeed/apply":
+                return 200, "text/html", self.render("indeed_apply.html", base=self.indeed_url,
+                                                     **job_fields(index))
+        return 404, "text/html", "<html><body><h1>Page not found</h1></body></html>"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output clean
+
+    def _send(self, status, content_type, body, cookie=None):
+        if status in (301, 302):
+            self.send_response(status)
+            self.send_header("Location", body)
+            if cookie:
+                self.send_header("Set-Cookie", cookie)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        data = body if isinstance(body, bytes) else body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type if isinstance(body, bytes) else f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        site = self.server.site
+        parsed = urlparse(self.path)
+        if parsed.path == "/favicon.ico":
+            self.send_response(204)
+            self.end_headers()
+            return
+        asset = site.asset(parsed.path)
+        if asset is not None:
+            if site.asset_latency_ms:
+                time.sleep(site.asset_latency_ms / 1000)
+            self._send(200, *asset)
+            return
+        if site.latency_ms and not parsed.path.startswith(("/static/", "/api/")):
+            time.sleep(site.latency_ms / 1000)
+        signed_in = "li_at=" in (self.headers.get("Cookie") or "")
+        self._send(*site.route(parsed.path, parse_qs(parsed.query), signed_in))
+
+    def do_POST(self):
+        site = self.server.site
+        path = urlparse(self.path).path
+        if path == "/linkedin/login":
+            length = int(self.headers.get("Content-Length") or 0)
+            form = parse_qs(self.rfile.read(length).decode("utf-8"))
+            if not (form.get("session_key") and form.get("session_password")):
+                self._send(302, "text/html", f"{site.linkedin_url}/login")
+                return
+            self._send(302, "text/html", f"{site.linkedin_url}/feed/",
+                       cookie=f"li_at=fake-{form['session_key'][0]}; Path=/; HttpOnly")
+            return
+        if path != "/api/applications":
+            self._send(404, "application/json", json.dumps({"error": "not found"}))
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send(400, "application/json", json.dumps({"error": "invalid JSON"}))
+            return
+        payload["received_at"] = time.time()
+        site.record_application(payload)
+        self._send(201, "application/json", json.dumps({"success": True}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--total-jobs", type=int, default=60)
+    parser.add_argument("--latency-ms", type=int, default=0, help="delay added to every page response")
+    parser.add_argument("--asset-kb", type=int, default=200, help="size of the banner image (other assets scale from it)")
+    parser.add_argument("--asset-latency-ms", type=int, default=0, help="delay added to every heavy asset")
+    args = parser.parse_args()
+
+    site = FakeSite(args.host, args.port, args.total_jobs, args.latency_ms, args.asset_kb,
+                    args.asset_latency_ms).start()
+    print(f"Fake LinkedIn: {site.linkedin_url}/jobs/")
+    print(f"Fake Indeed:   {site.indeed_url}/")
+    print(f"Run the bot with LINKEDIN_BASE_URL={site.linkedin_url} INDEED_BASE_URL={site.indeed_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
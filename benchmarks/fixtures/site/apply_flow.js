@@ -0,0 +1,84 @@
+// Behaviour for the offline fake LinkedIn/Indeed pages (served by benchmarks/fake_site.py).
+// Multi-step application flows are <section data-step> blocks shown one at a time.
+(function () {
+    function steps(root) {
+        return Array.prototype.slice.call(root.querySelectorAll('[data-step]'));
+    }
+
+    function show(root, index) {
+        var all = steps(root);
+        all.forEach(function (section, i) { section.hidden = i !== index; });
+        root.setAttribute('data-current', String(index));
+        var progress = root.querySelector('progress');
+        if (progress) progress.value = Math.round(100 * index / Math.max(1, all.length - 1));
+    }
+
+    function current(root) {
+        return parseInt(root.getAttribute('data-current') || '0', 10);
+    }
+
+    function collect(root) {
+        var values = {};
+        root.querySelectorAll('input, select, textarea').forEach(function (el) {
+            var key = el.id || el.name;
+            if (!key) return;
+            if (el.type === 'file') values[key] = el.files.length ? el.files[0].name : '';
+            else if (el.type === 'checkbox') values[key] = el.checked;
+            else values[key] = el.value;
+        });
+        return values;
+    }
+
+    function submit(root) {
+        var payload = {
+            platform: document.body.getAttribute('data-platform'),
+            job_id: root.getAttribute('data-job-id'),
+            fields: collect(root)
+        };
+        var done = function () { show(root, steps(root).length - 1); };
+        fetch('/api/applications', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify(payload)
+        }).then(done, done);
+    }
+
+    document.addEventListener('click', function (event) {
+        var target = event.target.closest('[data-action], [data-open], [data-href]');
+        if (!target) return;
+        event.preventDefault();
+
+        if (target.hasAttribute('data-href')) {
+            window.location.href = target.getAttribute('data-href');
+            return;
+        }
+        if (target.hasAttribute('data-open')) {
+            var modal = document.querySelector(target.getAttribute('data-open'));
+            modal.hidden = false;
+            if (modal.hasAttribute('data-job-id')) show(modal, 0);
+            return;
+        }
+
+        var root = target.closest('[data-flow]');
+        var action = target.getAttribute('data-action');
+        if (action === 'next') show(root, current(root) + 1);
+        else if (action === 'submit') submit(root);
+        else if (action === 'dismiss') root.hidden = true;
+        else if (action === 'filter') {
+            // Results are refreshed in place, as on the live site
+            var url = new URL(window.location.href);
+            url.searchParams.set('f_AL', 'true');
+            window.history.replaceState(null, '', url.toString());
+            root.hidden = true;
+        }
+    });
+
+    document.addEventListener('change', function (event) {
+        var input = event.target;
+        if (input.type !== 'file' || !input.files.length) return;
+        var chip = input.closest('[data-flow]').querySelector('.file-chip');
+        if (chip) chip.textContent = input.files[0].name;
+    });
+
+    document.querySelectorAll('[data-flow][data-job-id]:not([hidden])').forEach(function (root) { show(root, 0); });
+})();
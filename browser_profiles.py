@@ -0,0 +1,65 @@
+import os
+
+from selenium import webdriver
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+
+# desktop: a visible, maximised window for watching the bot / logging in by hand
+# server: headless and trimmed down so several sessions fit in one container
+PROFILES = ("desktop", "server")
+
+# Chrome content settings (2 = block) applied in the server profile; trackers, fonts and
+# video are dropped by the resource filter (resource_filter.py) in every profile
+SERVER_CONTENT_SETTINGS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.managed_default_content_settings.notifications": 2,
+    "profile.managed_default_content_settings.geolocation": 2,
+    "profile.managed_default_content_settings.plugins": 2,
+    "profile.managed_default_content_settings.popups": 2,
+}
+
+
+def resolve_profile(profile=None):
+    """The profile to use: the argument, else BROWSER_PROFILE, else desktop"""
+    profile = (profile or os.getenv("BROWSER_PROFILE") or "desktop").strip().lower()
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown browser profile '{profile}' (expected one of: {', '.join(PROFILES)})")
+    return profile
+
+
+def chrome_options(profile):
+    """ChromeOptions for a profile; both keep the anti-detection flags"""
+    options = webdriver.ChromeOptions()
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument(f"--user-agent={USER_AGENT}")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+
+    if profile == "desktop":
+        options.add_argument("--incognito")
+        options.add_argument("--start-maximized")
+        return options
+
+    window_size = os.getenv("SERVER_WINDOW_SIZE", "1280,800")
+    for argument in (
+        "--headless=new",
+        f"--window-size={window_size}",
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-component-update",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--metrics-recording-only",
+        "--no-first-run",
+        "--mute-audio",
+        "--autoplay-policy=user-gesture-required",
+        "--blink-settings=imagesEnabled=false",
+        "--renderer-process-limit=2",
+    ):
+        options.add_argument(argument)
+    options.add_experimental_option("prefs", SERVER_CONTENT_SETTINGS)
+    return options
@@ -1,21 +1,48 @@
 import time
 import os
+import sys
+import threading
+from itertools import islice
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium_stealth import stealth
+from applied_store import get_applied_store
+from job_discovery import discover_jobs
+from job_urls import DedupIndex
+from browser_profiles import resolve_profile, chrome_options
+from resource_filter import (enable_performance_log, apply_filter, apply_filter_for_url, collect_pages,
+                             platform_for_url, print_filter_summary)
+from driver_pool import driver_rss_mb
+from session_store import capture_session, restore_session, probe_session, clear_session, session_account
+from driver_metrics import InstrumentedDriver, begin_job, end_job, print_command_summary
+from tracing import span, traced, print_trace_summary, export_trace
+from pacing import get_pacer, print_pacing_summary
+from results_log import get_results_writer
+from selector_registry import get_selector_registry, print_selector_summary
+from resume_profile import load_resume_profile, profile_field_mapping
+from relevance import filter_relevant_jobs
+from run_checkpoint import (RunCheckpoint, checkpoint_path, unfinished_runs, tracking, mark_step,
+                            INTERRUPTED_AFTER_SUBMIT)
+from page_probes import detect_application_result, detect_throttle, snapshot_form, match_form_fields, fill_planned_fields
+from waits import (wait_for, document_ready, any_present, any_visible, search_results_present,
+                   page_reloaded, easy_apply_modal_open, step_signature, step_advanced,
+                   file_chip_attached, field_has_value, print_wait_summary)
 
-def setup_driver():
+# Site roots; overridden to point the bot at the offline fake site (benchmarks/fake_site.py)
+LINKEDIN_BASE_URL = os.getenv("LINKEDIN_BASE_URL", "https://www.linkedin.com").rstrip("/")
+INDEED_BASE_URL = os.getenv("INDEED_BASE_URL", "https://www.indeed.com").rstrip("/")
+
+LINKEDIN_SEARCH_INPUT_XPATH = "//input[contains(@placeholder, 'Search') or contains(@id, 'jobs-search') or contains(@name, 'keywords')]"
+INDEED_WHAT_INPUT_XPATH = "//input[@id='text-input-what' or @name='q' or contains(@placeholder, 'Job title') or contains(@placeholder, 'what')]"
+
+def setup_driver(profile=None):
     """Set up the Chrome WebDriver with anti-detection settings"""
-    options = webdriver.ChromeOptions()
-    options.add_argument("--incognito")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--start-maximized")
-    options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36')
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
+    profile = resolve_profile(profile)
+    options = chrome_options(profile)
+    enable_performance_log(options)
     driver = webdriver.Chrome(options=options)
     # Apply stealth settings
     stealth(driver,
@@ -27,8 +54,86 @@ def setup_driver():
             fix_hairline=True,
             )
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-    return driver
+    # Drop trackers, ads and heavy media before they are downloaded (data/resource_filters.json)
+    apply_filter(driver)
+    rss = driver_rss_mb(driver)
+    if rss is not None:
+        print(f"🧠 Browser session started ({profile} profile, {rss:.0f} MB RSS)")
+    # Counts and times every WebDriver command (per job, per call site) and feeds trace spans
+    return InstrumentedDriver(driver)
+
+_login_locks = {}
+_login_locks_guard = threading.Lock()
+
+
+def login_linkedin(driver, username, password, timeout=60):
+    """Sign in through the LinkedIn login form; True once the session cookie is set"""
+    try:
+        driver.get(f"{LINKEDIN_BASE_URL}/login")
+        wait_for(driver, "page_load", any_present("//input[@id='username']"), legacy_sleep=3)
+        driver.find_element(By.ID, "username").send_keys(username)
+        driver.find_element(By.ID, "password").send_keys(password)
+        driver.find_element(By.XPATH, "//button[@type='submit']").click()
+        # A security checkpoint (captcha, PIN e-mail) leaves us without li_at and times out here
+        WebDriverWait(driver, timeout).until(lambda d: d.get_cookie("li_at"))
+        print("✓ Logged in to LinkedIn")
+        return True
+    except Exception as e:
+        print(f"❌ LinkedIn login failed: {str(e)[:100]}")
+        return False
+
+
+def ensure_session(driver, platform="linkedin", account=None, username=None, password=None, use_saved=True):
+    """Make sure driver is signed in: reuse its session, restore a saved one, or log in and save it.
+
+    A browser already restored for this account within SESSION_REVALIDATE_SECONDS is trusted
+    without a probe, so pooled drivers pay for the check once. Logins are serialised per
+    account, so parallel workers wait for one login and then restore it. With use_saved=False
+    (a caller not authenticated for the account) only a login with username and password counts.
+    """
+    account = session_account(platform, account or username)
+    revalidate_after = float(os.getenv("SESSION_REVALIDATE_SECONDS", "600"))
+    if use_saved and getattr(driver, "_session_key", None) == (platform, account):
+        if time.time() - driver._session_checked_at < revalidate_after:
+            return True
+        if probe_session(driver, platform):
+            driver._session_checked_at = time.time()
+            return True
+    else:
+        # Pooled browsers keep their logins; whatever this one holds belongs to someone else
+        clear_session(driver)
+
+    with _login_locks_guard:
+        lock = _login_locks.setdefault((platform, account), threading.Lock())
+    with lock:
+        if use_saved and restore_session(driver, platform, account):
+            print(f"✓ Restored saved {platform} session for {account}")
+            return True
+        if platform != "linkedin" or not (username and password):
+            return False
+        if not login_linkedin(driver, username, password):
+            return False
+        if use_saved:
+            capture_session(driver, platform, account)
+        driver._session_key = (platform, account)
+        driver._session_checked_at = time.time()
+        return True
+
+
+def require_session(driver, platform, account=None, username=None, password=None, use_saved=True):
+    """ensure_session() for a run: LinkedIn runs fail without a session, Indeed runs go on signed out.
+
+    Either way the pooled browser never keeps whatever login it had before.
+    """
+    if ensure_session(driver, platform, account, username, password, use_saved):
+        return
+    if platform == "linkedin":
+        raise RuntimeError(f"No LinkedIn session for account '{account or 'default'}'; "
+                           "save one by running the bot once or send username and password")
+    print(f"⚠️ No saved {platform} session for {account or 'default'}; applying signed out")
 
+
+@traced("upload")
 def upload_file(driver, file_path, retry_attempts=3):
     """Upload a file to a file input field with retry logic"""
     for attempt in range(retry_attempts):
@@ -40,7 +145,7 @@ def upload_file(driver, file_path, retry_attempts=3):
                     if input_elem.is_displayed():
                         input_elem.send_keys(file_path)
                         print(f"✓ File uploaded: {os.path.basename(file_path)}")
-                        time.sleep(1)
+                        wait_for(driver, "file_attached", file_chip_attached(input_elem, file_path), legacy_sleep=1)
                         return True
                 except:
                     continue
@@ -51,7 +156,7 @@ def upload_file(driver, file_path, retry_attempts=3):
                     driver.execute_script("arguments[0].style.display = 'block';", input_elem)
                     input_elem.send_keys(file_path)
                     print(f"✓ File uploaded (hidden input): {os.path.basename(file_path)}")
-                    time.sleep(1)
+                    wait_for(driver, "file_attached", file_chip_attached(input_elem, file_path), legacy_sleep=1)
                     return True
                 except:
                     continue
@@ -66,7 +171,7 @@ def upload_file(driver, file_path, retry_attempts=3):
                     try:
                         button.click()
                         print("✓ Clicked upload button")
-                        time.sleep(1)
+                        wait_for(driver, "upload_retry", any_present("//input[@type='file']"), legacy_sleep=1)
                         
                         # Try to find file inputs again
                         file_inputs = driver.find_elements(By.XPATH, "//input[@type='file']")
@@ -74,7 +179,7 @@ def upload_file(driver, file_path, retry_attempts=3):
                             try:
                                 input_elem.send_keys(file_path)
                                 print(f"✓ File uploaded after button click: {os.path.basename(file_path)}")
-                                time.sleep(1)
+                                wait_for(driver, "file_attached", file_chip_attached(input_elem, file_path), legacy_sleep=1)
                                 return True
                             except:
                                 continue
@@ -83,7 +188,7 @@ def upload_file(driver, file_path, retry_attempts=3):
             
             if attempt < retry_attempts - 1:
                 print(f"⚠️ Upload attempt {attempt+1} failed, retrying...")
-                time.sleep(1)
+                wait_for(driver, "upload_retry", any_present("//input[@type='file']"), legacy_sleep=1)
             else:
                 print(f"⚠️ Upload failed after {retry_attempts} attempts")
                 return False
@@ -91,7 +196,7 @@ def upload_file(driver, file_path, retry_attempts=3):
         except Exception as e:
             if attempt < retry_attempts - 1:
                 print(f"❌ Upload error: {str(e)[:100]}, retrying...")
-                time.sleep(1)
+                wait_for(driver, "upload_retry", document_ready, legacy_sleep=1)
             else:
                 print(f"❌ Upload error: {str(e)[:100]}")
                 return False
@@ -126,6 +231,7 @@ def get_user_field_mapping():
     
     return field_mapping
 
+@traced("fill_form")
 def fill_form_fields(driver, field_mapping=None):
     """Fill common application form fields with user-provided or default values"""
     
@@ -140,41 +246,37 @@ def fill_form_fields(driver, field_mapping=None):
     
     print(f"\nUsing field mapping: {field_mapping}")
     
-    # Fill text inputs
-    inputs = driver.find_elements(By.TAG_NAME, "input")
-    for field in inputs:
-        try:
-            field_id = (field.get_attribute("id") or "").lower()
-            field_name = (field.get_attribute("name") or "").lower()
-            placeholder = (field.get_attribute("placeholder") or "").lower()
-            
-            # Skip hidden or file inputs
-            if field.get_attribute("type") in ["file", "hidden"] or not field.is_displayed():
-                continue
-                
-            # Fill matching fields
-            for key, value in field_mapping.items():
-                if (key in field_id or key in field_name or key in placeholder) and field.is_enabled():
-                    field.clear()
-                    field.send_keys(value)
-                    print(f"✓ Filled field: {key} = {value}")
-                    time.sleep(0.5)
-                    break  # Break after first match to avoid duplicate fills
-        except Exception as e:
-            print(f"Error filling field: {e}")
-            continue
+    # Snapshot every input/select/textarea in one round-trip and match in Python
+    try:
+        fields = snapshot_form(driver)
+    except Exception as e:
+        print(f"Error reading form: {e}")
+        return
+    planned = match_form_fields(fields, field_mapping)
+    if not planned:
+        return
     
-    # Handle checkboxes (usually for terms agreement)
-    checkboxes = driver.find_elements(By.XPATH, "//input[@type='checkbox']")
-    for checkbox in checkboxes:
-        try:
-            if checkbox.is_displayed() and not checkbox.is_selected():
-                checkbox.click()
-                print("✓ Checked a checkbox")
-                time.sleep(0.5)
-        except Exception as e:
-            print(f"Error checking checkbox: {e}")
-            continue
+    # Fill all matched fields in one batched pass
+    try:
+        filled = fill_planned_fields(driver, planned)
+    except Exception as e:
+        print(f"Error filling fields: {e}")
+        filled = []
+    
+    for i, (field, action, value) in enumerate(planned):
+        ok = filled[i] if i < len(filled) else False
+        if not ok and action == "text":
+            # Fall back to real keystrokes for inputs that reject scripted values
+            try:
+                field["element"].clear()
+                field["element"].send_keys(value)
+                ok = True
+            except Exception as e:
+                print(f"Error filling field: {e}")
+        if ok and action == "check":
+            print("✓ Checked a checkbox")
+        elif ok:
+            print(f"✓ Filled field: {field['name'] or field['id'] or field['label']} = {value}")
 
 # Alternative version: Pass field mapping as parameter
 def fill_form_fields_with_mapping(driver, phone="", mobile="", city="", location="", 
@@ -201,52 +303,19 @@ def fill_form_fields_with_mapping(driver, phone="", mobile="", city="", location
     # Use the main function
     fill_form_fields(driver, field_mapping)
 
+@traced("success_check")
 def is_application_successful(driver):
     """Check if the application was submitted successfully"""
-    # More comprehensive list of success indicators with broader selectors
-    success_indicators = [
-        # Text-based indicators
-        "//span[contains(text(), 'Application submitted')]",
-        "//span[contains(text(), 'Applied')]",
-        "//div[contains(text(), 'Application submitted')]",
-        "//div[contains(text(), 'Applied')]",
-        "//p[contains(text(), 'Application submitted')]",
-        "//p[contains(text(), 'Applied')]",
-        "//h1[contains(text(), 'Application submitted')]",
-        "//h2[contains(text(), 'Application submitted')]",
-        "//div[contains(text(), 'Your application was sent')]",
-        "//div[contains(text(), 'application was sent')]",
-        "//div[contains(text(), 'Application sent')]",
-        "//div[contains(text(), 'Thank you for applying')]",
-        "//div[contains(text(), 'successfully applied')]",
-        
-        # Class-based indicators
-        "//div[contains(@class, 'success')]",
-        "//div[contains(@class, 'applied')]",
-        "//div[contains(@class, 'confirmation')]",
-        
-        # LinkedIn-specific
-        "//div[contains(@class, 'artdeco-inline-feedback--success')]",
-        "//div[contains(@class, 'jobs-apply-button--applied')]",
-        "//button[contains(@class, 'applied')]"
-    ]
-    
-    for indicator in success_indicators:
-        try:
-            elements = driver.find_elements(By.XPATH, indicator)
-            if elements and any(element.is_displayed() for element in elements):
-                return True
-        except:
-            continue
-    
-    # Check if the apply button text has changed to "Applied"
+    # All indicators (data/success_indicators.json) are checked in one in-page probe
     try:
-        apply_buttons = driver.find_elements(By.XPATH, "//button[contains(@aria-label, 'Apply') or contains(text(), 'Apply')]")
-        for button in apply_buttons:
-            if "applied" in button.text.lower() or "applied" in (button.get_attribute("aria-label") or "").lower():
-                return True
-    except:
-        pass
+        verdict = detect_application_result(driver)
+        if verdict["success"]:
+            print(f"✓ Success indicator: {verdict['indicator']} (confidence {verdict['confidence']})")
+            return True
+        if verdict["status"] == "failure":
+            print(f"⚠️ Failure indicator: {verdict['indicator']}")
+    except Exception as e:
+        print(f"⚠️ Success probe failed: {str(e)[:100]}")
         
     # Take a screenshot for debugging
     try:
@@ -260,143 +329,130 @@ def is_application_successful(driver):
 
 def apply_for_job(driver, job_url, resume_path):#cover_letter
     """Apply for a single job"""
-    try:
-        # Navigate to job page
-        driver.get(job_url)
-        print(f"✓ Navigated to job page")
-        time.sleep(3)
-        
-        # Save the page title for better job identification
+    # Fallback selectors are tried in the order that has worked best so far (data/selectors.json)
+    selectors = get_selector_registry()
+    platform = platform_for_url(job_url)
+    with span("apply_job", url=job_url):
         try:
-            job_title_element = driver.find_element(By.XPATH, "//h1[contains(@class, 'job-title')]")
-            job_title = job_title_element.text
-            print(f"✓ Job title: {job_title}")
-        except:
-            job_title = "Unknown Title"
-            
-        # Find and click apply button
-        apply_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Apply') or contains(@aria-label, 'Apply') or contains(@class, 'jobs-apply')]")
-        apply_clicked = False
+            # Navigate to job page
+            with span("navigate"):
+                apply_filter_for_url(driver, job_url)
+                driver.get(job_url)
+                print(f"✓ Navigated to job page")
+                wait_for(driver, "page_load", document_ready, legacy_sleep=3)
+                mark_step("navigated")
+                pages = collect_pages(driver)
+                if pages and pages[-1]["blocked"]:
+                    print(f"🧹 Blocked {pages[-1]['blocked']} requests (~{pages[-1]['bytes_saved'] / 1024:.0f} KB saved)")
         
-        for button in apply_buttons:
-            if button.is_displayed() and button.is_enabled():
-                # Save button state for later comparison
-                original_text = button.text
-                print(f"✓ Found apply button: '{original_text}'")
-                
-                button.click()
-                print("✓ Clicked apply button")
-                apply_clicked = True
-                time.sleep(3)
-                break
-                
-        if not apply_clicked:
-            print("⚠️ Could not find standard apply button, trying alternative selectors")
+            # Save the page title for better job identification
+            try:
+                job_title_element = selectors.find(driver, platform, "job_page", "job_title")
+                job_title = job_title_element.text
+                print(f"✓ Job title: {job_title}")
+            except:
+                job_title = "Unknown Title"
             
-            # Try alternative button selectors
-            alt_buttons = driver.find_elements(By.XPATH, "//a[contains(@href, 'apply') or contains(@class, 'apply')] | //div[contains(@role, 'button')][contains(text(), 'Apply')]")
-            for button in alt_buttons:
-                if button.is_displayed() and button.is_enabled():
+            # Find and click apply button
+            with span("apply_button"):
+                apply_clicked = False
+                button = selectors.find_clickable(driver, platform, "job_page", "apply_button")
+                if button is not None:
+                    print(f"✓ Found apply button: '{button.text}'")
                     button.click()
-                    print("✓ Clicked alternative apply button")
+                    print("✓ Clicked apply button")
                     apply_clicked = True
-                    time.sleep(3)
-                    break
+                    wait_for(driver, "easy_apply_modal", easy_apply_modal_open, legacy_sleep=3)
                     
-        if not apply_clicked:
-            print("❌ Could not find any apply button")
-            driver.save_screenshot(f"no_apply_button_{int(time.time())}.png")
-            return "Failed to find apply button"
+            if apply_clicked:
+                mark_step("apply_clicked")
+            if not apply_clicked:
+                print("❌ Could not find any apply button")
+                driver.save_screenshot(f"no_apply_button_{int(time.time())}.png")
+                return "Failed to find apply button"
             
-        # Upload resume
-        upload_success = upload_file(driver, resume_path)
-        if not upload_success:
-            print("⚠️ Resume upload failed or wasn't needed")
+            # Upload resume
+            upload_success = upload_file(driver, resume_path)
+            if not upload_success:
+                print("⚠️ Resume upload failed or wasn't needed")
             
-        # Look for cover letter field
-        #cover_letter_indicators = driver.find_elements(By.XPATH, "//label[contains(text(), 'Cover') or contains(text(), 'cover')] | //h3[contains(text(), 'Cover') or contains(text(), 'cover')]")
-        #if cover_letter_indicators:
-            #upload_file(driver, cover_letter_path)
-            #print("✓ Cover letter upload attempted")
+            # Look for cover letter field
+            #cover_letter_indicators = driver.find_elements(By.XPATH, "//label[contains(text(), 'Cover') or contains(text(), 'cover')] | //h3[contains(text(), 'Cover') or contains(text(), 'cover')]")
+            #if cover_letter_indicators:
+                #upload_file(driver, cover_letter_path)
+                #print("✓ Cover letter upload attempted")
             
-        # Fill form fields
-        fill_form_fields(driver)
+            # Fill form fields from the parsed resume (cached by file hash; asks only if nothing was parsed)
+            fill_form_fields(driver, profile_field_mapping(load_resume_profile(resume_path)) or None)
         
-        # Click through application steps (next/submit buttons)
-        for attempt in range(10):  # Try up to 10 steps in the application process
-            time.sleep(2)  # Wait for page to update
+            # Click through application steps (next/submit buttons)
+            for attempt in range(10):  # Try up to 10 steps in the application process
+                if attempt == 0:
+                    # Later iterations already waited for the step to advance after their click
+                    wait_for(driver, "modal_settle", document_ready, legacy_sleep=2)
             
-            # Check if application is already successful after last click
-            if is_application_successful(driver):
-                print("✓ Application success detected!")
-                return "Applied successfully!"
-            
-            # Look for next/submit buttons
-            next_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Submit') or contains(text(), 'submit') or contains(text(), 'Next') or contains(text(), 'next') or contains(text(), 'Continue') or contains(text(), 'continue')] | //button[@type='submit']")
-            submit_clicked = False
+                # Check if application is already successful after last click
+                if is_application_successful(driver):
+                    print("✓ Application success detected!")
+                    return "Applied successfully!"
             
-            for button in next_buttons:
-                if button.is_displayed() and button.is_enabled():
+                # Look for next/submit buttons (footer buttons are the fallback, common in LinkedIn)
+                submit_clicked = False
+                button = selectors.find_clickable(driver, platform, "job_page", "step_button", with_text=True)
+                if button is not None:
                     button_text = button.text.strip()
-                    if button_text:  # Only click if button has text
+                    with span("step_click", step=attempt + 1, button=button_text):
+                        signature = step_signature(driver)
+                        # Journalled before the click: a crash mid-submit must not lead to a re-apply
+                        mark_step("submit_clicked" if "submit" in button_text.lower() else f"step_{attempt + 1}")
                         button.click()
                         print(f"✓ Clicked button: '{button_text}'")
                         submit_clicked = True
-                        time.sleep(2)
-                        break
-                    
-            if not submit_clicked:
-                # If no standard buttons found, try footer buttons (common in LinkedIn)
-                footer_buttons = driver.find_elements(By.XPATH, "//footer//button | //div[contains(@class, 'footer')]//button")
-                for button in footer_buttons:
-                    if button.is_displayed() and button.is_enabled() and button.text.strip():
-                        button.click()
-                        print(f"✓ Clicked footer button: '{button.text}'")
-                        submit_clicked = True
-                        time.sleep(2)
-                        break
+                        # Replaces the post-click sleep and the next iteration's settle sleep
+                        wait_for(driver, "step_advanced", step_advanced(signature), legacy_sleep=4)
                         
-            if not submit_clicked:
-                # If no more buttons, we're probably done or stuck
-                print("⚠️ No more buttons found")
-                break
+                if not submit_clicked:
+                    # If no more buttons, we're probably done or stuck
+                    print("⚠️ No more buttons found")
+                    break
                 
-        # Final check for success
-        if is_application_successful(driver):
-            print("✓ Application success detected!")
-            return "Applied successfully!"
-        else:
-            print("⚠️ Could not confirm application success")
-            # Capture screenshot for review
+            # Final check for success
+            if is_application_successful(driver):
+                print("✓ Application success detected!")
+                return "Applied successfully!"
+            else:
+                print("⚠️ Could not confirm application success")
+                # Capture screenshot for review
+                try:
+                    screenshot_path = f"application_result_{int(time.time())}.png"
+                    driver.save_screenshot(screenshot_path)
+                    print(f"✓ Final screenshot saved: {screenshot_path}")
+                except:
+                    pass
+                
+                return "Application completed, but success uncertain"
+            
+        except Exception as e:
+            print(f"❌ Error: {str(e)[:100]}")
+            # Take error screenshot
             try:
-                screenshot_path = f"application_result_{int(time.time())}.png"
-                driver.save_screenshot(screenshot_path)
-                print(f"✓ Final screenshot saved: {screenshot_path}")
+                driver.save_screenshot(f"error_{int(time.time())}.png")
             except:
                 pass
-                
-            return "Application completed, but success uncertain"
-            
-    except Exception as e:
-        print(f"❌ Error: {str(e)[:100]}")
-        # Take error screenshot
-        try:
-            driver.save_screenshot(f"error_{int(time.time())}.png")
-        except:
-            pass
-        return f"Error: {str(e)[:100]}"
+            return f"Error: {str(e)[:100]}"
 
-def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5, 
-                             location="", experience_level="", job_type="", date_posted=""):#cover_letter
-    """Search for jobs and apply to them with additional filters"""
+@traced("search.linkedin")
+def perform_search(driver, search_term, location="", experience_level="", job_type="", date_posted=""):
+    """Run a LinkedIn job search with additional filters; True once results are on screen"""
     try:
         # Navigate to LinkedIn jobs page
-        driver.get("https://www.linkedin.com/jobs/")
+        apply_filter(driver, "linkedin")
+        driver.get(f"{LINKEDIN_BASE_URL}/jobs/")
         print("✓ Navigated to LinkedIn Jobs page")
-        time.sleep(3)
+        wait_for(driver, "page_load", any_present(LINKEDIN_SEARCH_INPUT_XPATH), legacy_sleep=3)
         
         # Find and fill the search input
-        search_inputs = driver.find_elements(By.XPATH, "//input[contains(@placeholder, 'Search') or contains(@id, 'jobs-search') or contains(@name, 'keywords')]")
+        search_inputs = driver.find_elements(By.XPATH, LINKEDIN_SEARCH_INPUT_XPATH)
         search_performed = False
         
         for search_input in search_inputs:
@@ -406,7 +462,7 @@ def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5,
                 search_input.send_keys(Keys.RETURN)
                 print(f"✓ Searching for: {search_term}")
                 search_performed = True
-                time.sleep(5)  # Wait for search results
+                wait_for(driver, "search_results", search_results_present("linkedin"), legacy_sleep=5)
                 break
                 
         if not search_performed:
@@ -416,191 +472,287 @@ def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5,
             for box in search_boxes:
                 if box.is_displayed():
                     box.click()
-                    time.sleep(1)
+                    wait_for(driver, "filter_option", any_visible("//input[contains(@placeholder, 'Search')]"), legacy_sleep=1)
                     search_inputs = driver.find_elements(By.XPATH, "//input[contains(@placeholder, 'Search')]")
                     if search_inputs:
                         search_inputs[0].send_keys(search_term)
                         search_inputs[0].send_keys(Keys.RETURN)
                         print(f"✓ Searching for: {search_term} (alternative method)")
                         search_performed = True
-                        time.sleep(5)
+                        wait_for(driver, "search_results", search_results_present("linkedin"), legacy_sleep=5)
                         break
         
         if not search_performed:
             print("❌ Could not perform search")
-            return []
+            return False
             
         # Apply filters (expanded filtering section)
-        try:
-            filter_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Filters') or contains(@aria-label, 'Filter')]")
-            for button in filter_buttons:
-                if button.is_displayed():
-                    button.click()
-                    print("✓ Clicked on filters")
-                    time.sleep(2)
+        with span("filters", platform="linkedin"):
+            try:
+                filter_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Filters') or contains(@aria-label, 'Filter')]")
+                for button in filter_buttons:
+                    if button.is_displayed():
+                        button.click()
+                        print("✓ Clicked on filters")
+                        wait_for(driver, "filters", easy_apply_modal_open, legacy_sleep=2)
                     
-                    # Apply Easy Apply filter
-                    easy_apply_checkboxes = driver.find_elements(By.XPATH, "//label[contains(text(), 'Easy Apply')]")
-                    for checkbox in easy_apply_checkboxes:
-                        if checkbox.is_displayed():
-                            checkbox.click()
-                            print("✓ Selected Easy Apply filter")
-                            time.sleep(1)
+                        # Apply Easy Apply filter
+                        easy_apply_checkboxes = driver.find_elements(By.XPATH, "//label[contains(text(), 'Easy Apply')]")
+                        for checkbox in easy_apply_checkboxes:
+                            if checkbox.is_displayed():
+                                checkbox.click()
+                                print("✓ Selected Easy Apply filter")
+                                wait_for(driver, "filter_option", document_ready, legacy_sleep=1)
                     
-                    # Apply Location filter
-                    if location:
-                        location_inputs = driver.find_elements(By.XPATH, "//input[contains(@id, 'location') or contains(@name, 'location')]")
-                        for loc_input in location_inputs:
-                            if loc_input.is_displayed():
-                                loc_input.clear()
-                                loc_input.send_keys(location)
-                                print(f"✓ Set location filter: {location}")
-                                time.sleep(1)
+                        # Apply Location filter
+                        if location:
+                            location_inputs = driver.find_elements(By.XPATH, "//input[contains(@id, 'location') or contains(@name, 'location')]")
+                            for loc_input in location_inputs:
+                                if loc_input.is_displayed():
+                                    loc_input.clear()
+                                    loc_input.send_keys(location)
+                                    print(f"✓ Set location filter: {location}")
+                                    wait_for(driver, "filter_option", field_has_value(loc_input, location), legacy_sleep=1)
                     
-                    # Apply Experience Level filter
-                    if experience_level:
-                        exp_dropdowns = driver.find_elements(By.XPATH, "//button[contains(text(), 'Experience Level')]")
-                        for dropdown in exp_dropdowns:
-                            if dropdown.is_displayed():
-                                dropdown.click()
-                                time.sleep(1)
-                                exp_options = driver.find_elements(By.XPATH, f"//label[contains(text(), '{experience_level}')]")
-                                for option in exp_options:
-                                    if option.is_displayed():
-                                        option.click()
-                                        print(f"✓ Set experience level: {experience_level}")
-                                        time.sleep(1)
-                                        break
+                        # Apply Experience Level filter
+                        if experience_level:
+                            exp_dropdowns = driver.find_elements(By.XPATH, "//button[contains(text(), 'Experience Level')]")
+                            for dropdown in exp_dropdowns:
+                                if dropdown.is_displayed():
+                                    dropdown.click()
+                                    wait_for(driver, "filter_option", any_visible(f"//label[contains(text(), '{experience_level}')]"), legacy_sleep=1)
+                                    exp_options = driver.find_elements(By.XPATH, f"//label[contains(text(), '{experience_level}')]")
+                                    for option in exp_options:
+                                        if option.is_displayed():
+                                            option.click()
+                                            print(f"✓ Set experience level: {experience_level}")
+                                            wait_for(driver, "filter_option", document_ready, legacy_sleep=1)
+                                            break
                     
-                    # Apply Job Type filter
-                    if job_type:
-                        type_dropdowns = driver.find_elements(By.XPATH, "//button[contains(text(), 'Job Type')]")
-                        for dropdown in type_dropdowns:
-                            if dropdown.is_displayed():
-                                dropdown.click()
-                                time.sleep(1)
-                                type_options = driver.find_elements(By.XPATH, f"//label[contains(text(), '{job_type}')]")
-                                for option in type_options:
-                                    if option.is_displayed():
-                                        option.click()
-                                        print(f"✓ Set job type: {job_type}")
-                                        time.sleep(1)
-                                        break
+                        # Apply Job Type filter
+                        if job_type:
+                            type_dropdowns = driver.find_elements(By.XPATH, "//button[contains(text(), 'Job Type')]")
+                            for dropdown in type_dropdowns:
+                                if dropdown.is_displayed():
+                                    dropdown.click()
+                                    wait_for(driver, "filter_option", any_visible(f"//label[contains(text(), '{job_type}')]"), legacy_sleep=1)
+                                    type_options = driver.find_elements(By.XPATH, f"//label[contains(text(), '{job_type}')]")
+                                    for option in type_options:
+                                        if option.is_displayed():
+                                            option.click()
+                                            print(f"✓ Set job type: {job_type}")
+                                            wait_for(driver, "filter_option", document_ready, legacy_sleep=1)
+                                            break
                     
-                    # Apply Date Posted filter
-                    if date_posted:
-                        date_dropdowns = driver.find_elements(By.XPATH, "//button[contains(text(), 'Date Posted')]")
-                        for dropdown in date_dropdowns:
-                            if dropdown.is_displayed():
-                                dropdown.click()
-                                time.sleep(1)
-                                date_options = driver.find_elements(By.XPATH, f"//label[contains(text(), '{date_posted}')]")
-                                for option in date_options:
-                                    if option.is_displayed():
-                                        option.click()
-                                        print(f"✓ Set date posted: {date_posted}")
-                                        time.sleep(1)
-                                        break
+                        # Apply Date Posted filter
+                        if date_posted:
+                            date_dropdowns = driver.find_elements(By.XPATH, "//button[contains(text(), 'Date Posted')]")
+                            for dropdown in date_dropdowns:
+                                if dropdown.is_displayed():
+                                    dropdown.click()
+                                    wait_for(driver, "filter_option", any_visible(f"//label[contains(text(), '{date_posted}')]"), legacy_sleep=1)
+                                    date_options = driver.find_elements(By.XPATH, f"//label[contains(text(), '{date_posted}')]")
+                                    for option in date_options:
+                                        if option.is_displayed():
+                                            option.click()
+                                            print(f"✓ Set date posted: {date_posted}")
+                                            wait_for(driver, "filter_option", document_ready, legacy_sleep=1)
+                                            break
                     
-                    # Click show results button
-                    show_results = driver.find_elements(By.XPATH, "//button[contains(text(), 'Show') or contains(text(), 'Apply') or contains(text(), 'Done')]")
-                    if show_results:
-                        for button in show_results:
-                            if button.is_displayed() and button.is_enabled():
-                                button.click()
-                                print("✓ Applied filters")
-                                time.sleep(3)
-                                break
-                    break
-        except Exception as e:
-            print(f"⚠️ Could not apply filters: {str(e)[:100]}")
-            
-        # Find job listings
-        job_cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'job-card-container') or contains(@class, 'job-search-card')]")
-        if not job_cards:
-            job_cards = driver.find_elements(By.XPATH, "//a[contains(@href, '/jobs/view/')]")
-            
-        if not job_cards:
-            # Try a more generic approach
-            job_cards = driver.find_elements(By.XPATH, "//li[contains(@class, 'job-result-card') or contains(@class, 'jobs-search-result-item')]")
+                        # Click show results button
+                        show_results = driver.find_elements(By.XPATH, "//button[contains(text(), 'Show') or contains(text(), 'Apply') or contains(text(), 'Done')]")
+                        if show_results:
+                            for button in show_results:
+                                if button.is_displayed() and button.is_enabled():
+                                    button.click()
+                                    print("✓ Applied filters")
+                                    wait_for(driver, "search_results", search_results_present("linkedin"), legacy_sleep=3)
+                                    break
+                        break
+            except Exception as e:
+                print(f"⚠️ Could not apply filters: {str(e)[:100]}")
             
-        if len(job_cards) > 0:
-            print(f"✓ Found {len(job_cards)} job listings")
-        else:
-            print("❌ No job listings found")
-            driver.save_screenshot("no_jobs_found.png")
-            return []
-        
-        results = []
-        applied_count = 0
+        return True
         
-        # Process each job
-        for i, card in enumerate(job_cards[:max_jobs]):
+    except Exception as e:
+        print(f"❌ Search error: {str(e)}")
+        return False
+
+def iter_search_jobs(driver, search_term, location="", experience_level="", job_type="", date_posted="",
+                     skip_job=None, dedup=None):
+    """Search LinkedIn and lazily yield jobs (title, company, link), walking result pages as needed.
+
+    Links are canonicalized; cards already in the dedup index or whose link satisfies
+    skip_job(link) (e.g. already applied to) are passed over.
+    """
+    if not perform_search(driver, search_term, location, experience_level, job_type, date_posted):
+        return
+    try:
+        yield from discover_jobs(driver, "linkedin", skip_job=skip_job, dedup=dedup)
+    except Exception as e:
+        print(f"❌ Search error: {str(e)}")
+
+def search_jobs(driver, search_term, max_jobs=5, location="", experience_level="", job_type="", date_posted="",
+                skip_job=None, dedup=None):
+    """Search LinkedIn with additional filters and collect up to max_jobs jobs (title, company, link)"""
+    return list(islice(iter_search_jobs(driver, search_term, location, experience_level, job_type, date_posted,
+                                        skip_job, dedup), max_jobs))
+
+def pacer_for(driver, job_url):
+    """The pacer shared by everything applying on this job's platform with driver's account"""
+    account = getattr(driver, "_session_key", (None, None))[1]
+    return get_pacer(platform_for_url(job_url), account)
+
+def record_pacing(driver, pacer):
+    """Check the page the application ended on for captcha/throttle signals and adapt the pace"""
+    signal = detect_throttle(driver)
+    cooldown = pacer.record(signal)
+    if signal:
+        print(f"🐢 {signal['signal']} detected ({signal['detail']}), slowing to "
+              f"{pacer.rate:.0f}/h after a {cooldown:.0f}s cool-down")
+
+def apply_to_jobs(driver, jobs, resume_path, on_result=None, separate_tab=False, checkpoint=None):
+    """Apply to each job in order on a single driver.
+
+    With separate_tab, applications run in a second tab and the driver is switched back
+    to the original tab before the next job is drawn from jobs, so a lazy discovery
+    generator can keep reading the results page between applications. With a checkpoint,
+    the steps each application reaches are journalled (see run_checkpoint.py).
+    """
+    results = []
+    applied_count = 0
+    results_handle = driver.current_window_handle if separate_tab else None
+    apply_handle = None
+    
+    try:
+        for i, job in enumerate(jobs):
             try:
-                # Extract job info
-                try:
-                    job_title_elem = card.find_element(By.XPATH, ".//h3 | .//a[contains(@class, 'job-title')]")
-                    job_title = job_title_elem.text
-                except:
-                    try:
-                        job_title_elem = card.find_element(By.XPATH, ".//a")
-                        job_title = job_title_elem.text
-                    except:
-                        job_title = "Unknown Title"
-                    
-                try:
-                    company_elem = card.find_element(By.XPATH, ".//h4 | .//a[contains(@class, 'company')]")
-                    company = company_elem.text
-                except:
-                    company = "Unknown Company"
-                    
-                # Get job link
-                try:
-                    job_link = card.find_element(By.TAG_NAME, "a").get_attribute("href")
-                except:
-                    try:
-                        job_link = card.get_attribute("href")
-                    except:
-                        print(f"⚠️ Could not get link for job {i+1}")
-                        continue
-                        
-                print(f"\n🔶 Job {i+1}: {job_title} at {company}")
+                print(f"\n🔶 Job {i+1}: {job['title']} at {job['company']}")
+                if separate_tab:
+                    if apply_handle is None:
+                        driver.switch_to.new_window("tab")
+                        apply_handle = driver.current_window_handle
+                    else:
+                        driver.switch_to.window(apply_handle)
+                
+                # Wait for the platform's pacer instead of a fixed pause between applications
+                pacer = pacer_for(driver, job["link"])
+                pacer.acquire()
                 
                 # Apply for the job
-                status = apply_for_job(driver, job_link, resume_path)#cover_letter
-                results.append({"title": job_title, "company": company, "link": job_link, "status": status})
+                begin_job(driver)
+                try:
+                    with tracking(checkpoint, job["link"]):
+                        status = apply_for_job(driver, job["link"], resume_path)#cover_letter
+                finally:
+                    webdriver_summary = end_job(driver)
+                    # Also after a crash: a captcha or throttle page is the likeliest cause
+                    record_pacing(driver, pacer)
+                result = {**job, "status": status}
+                if webdriver_summary:
+                    result["webdriver"] = webdriver_summary
+                results.append(result)
+                if on_result:
+                    on_result(result)
                 
                 if "Applied successfully" in status:
                     applied_count += 1
                     
                 print(f"📊 Status: {status}")
-                time.sleep(3)  # Wait between applications
+                if webdriver_summary:
+                    print(f"📡 WebDriver calls: {webdriver_summary['calls']} ({webdriver_summary['time_ms'] / 1000:.1f}s)")
                 
             except Exception as e:
                 print(f"❌ Error processing job {i+1}: {str(e)[:100]}")
-                
-        print(f"\n✅ Applied to {applied_count} out of {len(results)} processed jobs")
-        return results
-        
-    except Exception as e:
-        print(f"❌ Search error: {str(e)}")
-        return []
+            finally:
+                if separate_tab:
+                    driver.switch_to.window(results_handle)
+    finally:
+        if apply_handle is not None:
+            try:
+                driver.switch_to.window(apply_handle)
+                driver.close()
+            except:
+                pass
+            driver.switch_to.window(results_handle)
+            
+    print(f"\n✅ Applied to {applied_count} out of {len(results)} processed jobs")
+    return results
+
+def _apply_collected_jobs(driver, jobs, resume_path, on_result=None, workers=1, pool=None, store=None,
+                          checkpoint=None):
+    """Apply sequentially, or fan the jobs out to several browsers when workers > 1.
+
+    jobs may be a lazy iterator straight from discovery: the sequential path applies to
+    each job as soon as it is found, the parallel path collects them first.
+    """
+    writer = get_results_writer()
+    if store is not None or checkpoint is not None or writer is not None:
+        # Remember every processed posting so later runs skip it and an interrupted run can resume,
+        # and append it to the results log as soon as it is done
+        caller_on_result = on_result
+        run_id = checkpoint.run_id if checkpoint is not None else None
+        search_term = checkpoint.params.get("search_term") if checkpoint is not None else None
+        def on_result(result):
+            if checkpoint is not None:
+                checkpoint.record_result(result)
+            if store is not None:
+                store.record(result)
+            if writer is not None:
+                writer.write_result(result, run_id, search_term)
+            if caller_on_result:
+                caller_on_result(result)
+    if workers > 1:
+        jobs = list(jobs)
+        if len(jobs) > 1:
+            from parallel_apply import apply_in_parallel
+            return apply_in_parallel(jobs, resume_path, workers=workers, primary_driver=driver,
+                                     pool=pool, on_result=on_result, checkpoint=checkpoint)
+    return apply_to_jobs(driver, jobs, resume_path, on_result, separate_tab=not isinstance(jobs, list),
+                         checkpoint=checkpoint)
+
+def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5, 
+                             location="", experience_level="", job_type="", date_posted="",
+                             on_result=None, workers=1, pool=None, skip_processed=True,
+                             checkpoint=None):#cover_letter
+    """Search for jobs and apply to them with additional filters.
+
+    on_result, if given, is called with each job's result dict as soon as it is processed.
+    Sequentially, each job is applied to (in a second tab) as soon as discovery yields it;
+    with workers > 1 the collected jobs are applied to concurrently (see parallel_apply.py).
+    With skip_processed, postings recorded in the applied-jobs store are not re-opened.
+    With a checkpoint, discovered jobs and results are journalled so the run can be resumed.
+    """
+    store = get_applied_store() if skip_processed else None
+    dedup = DedupIndex()
+    # Jobs are discovered lazily: the first application starts once the first window of cards is ranked
+    found = iter_search_jobs(driver, search_term, location, experience_level, job_type, date_posted,
+                             skip_job=store.should_skip if store else None, dedup=dedup)
+    # Best matches for the resume first; poor fits are never opened (relevance.py)
+    found = filter_relevant_jobs(found, resume_path, search_term, top_k=max_jobs)
+    if checkpoint is not None:
+        found = checkpoint.track_discovery(found)
+    jobs = islice(found, max_jobs)
+    results = _apply_collected_jobs(driver, jobs, resume_path, on_result, workers, pool, store, checkpoint)
+    if dedup.duplicates:
+        print(f"🔁 Avoided {dedup.duplicates} duplicate navigations ({len(dedup)} unique postings)")
+    return results
     
-def search_and_apply_for_jobs_indeed(driver, search_term, resume_path, max_jobs=5,
-                                    location="", experience_level="", job_type="", date_posted=""):
-    """Search for jobs on Indeed and apply to them with additional filters"""
+@traced("search.indeed")
+def perform_search_indeed(driver, search_term, location="", experience_level="", job_type="", date_posted=""):
+    """Run an Indeed job search with additional filters; True once results are on screen"""
     try:
         # Navigate to Indeed jobs page
-        driver.get("https://www.indeed.com/")
+        apply_filter(driver, "indeed")
+        driver.get(f"{INDEED_BASE_URL}/")
         print("✓ Navigated to Indeed.com")
-        time.sleep(3)
+        wait_for(driver, "page_load", any_present(INDEED_WHAT_INPUT_XPATH), legacy_sleep=3)
         
         # Find and fill the search inputs
         search_performed = False
         
         # Find the "what" (job title) input field
-        what_inputs = driver.find_elements(By.XPATH, 
-            "//input[@id='text-input-what' or @name='q' or contains(@placeholder, 'Job title') or contains(@placeholder, 'what')]")
+        what_inputs = driver.find_elements(By.XPATH, INDEED_WHAT_INPUT_XPATH)
         
         # Find the "where" (location) input field  
         where_inputs = driver.find_elements(By.XPATH,
@@ -630,159 +782,213 @@ def search_and_apply_for_jobs_indeed(driver, search_term, resume_path, max_jobs=
                 print("✓ Pressed Enter to search")
                 search_performed = True
                 
-            time.sleep(5)  # Wait for search results
+            wait_for(driver, "search_results", search_results_present("indeed"), legacy_sleep=5)
             
         if not search_performed:
             print("❌ Could not perform search")
-            return []
+            return False
             
         # Apply filters if specified
-        try:
-            # Look for filter dropdowns
-            if experience_level:
-                exp_buttons = driver.find_elements(By.XPATH,
-                    "//button[contains(@aria-label, 'Experience Level') or contains(text(), 'Experience')]")
-                for button in exp_buttons:
-                    if button.is_displayed():
-                        button.click()
-                        time.sleep(1)
-                        exp_links = driver.find_elements(By.XPATH, 
-                            f"//a[contains(text(), '{experience_level}')]")
-                        for link in exp_links:
-                            if link.is_displayed():
-                                link.click()
-                                print(f"✓ Applied experience filter: {experience_level}")
-                                time.sleep(2)
-                                break
-                        break
-                        
-            if job_type:
-                type_buttons = driver.find_elements(By.XPATH,
-                    "//button[contains(@aria-label, 'Job Type') or contains(text(), 'Job Type')]")
-                for button in type_buttons:
-                    if button.is_displayed():
-                        button.click()
-                        time.sleep(1)
-                        type_links = driver.find_elements(By.XPATH,
-                            f"//a[contains(text(), '{job_type}')]")
-                        for link in type_links:
-                            if link.is_displayed():
-                                link.click()
-                                print(f"✓ Applied job type filter: {job_type}")
-                                time.sleep(2)
-                                break
-                        break
-                        
-            if date_posted:
-                date_buttons = driver.find_elements(By.XPATH,
-                    "//button[contains(@aria-label, 'Date Posted') or contains(text(), 'Date')]")
-                for button in date_buttons:
-                    if button.is_displayed():
-                        button.click()
-                        time.sleep(1)
-                        # Map common date filters
-                        date_map = {
-                            "Past 24 hours": "1",
-                            "Past 3 days": "3", 
-                            "Past week": "7",
-                            "Past 2 weeks": "14",
-                            "Past month": "30"
-                        }
-                        date_value = date_map.get(date_posted, date_posted)
-                        date_links = driver.find_elements(By.XPATH,
-                            f"//a[contains(@href, 'fromage={date_value}') or contains(text(), '{date_posted}')]")
-                        for link in date_links:
-                            if link.is_displayed():
-                                link.click()
-                                print(f"✓ Applied date filter: {date_posted}")
-                                time.sleep(2)
-                                break
-                        break
-                        
-        except Exception as e:
-            print(f"⚠️ Could not apply filters: {str(e)[:100]}")
-            
-        # Find job listings
-        job_cards = driver.find_elements(By.XPATH,
-            "//div[contains(@class, 'job_seen_beacon')] | //div[contains(@class, 'slider_container')] | //div[contains(@class, 'jobsearch-SerpJobCard')]")
-        
-        if not job_cards:
-            # Try alternative selectors
-            job_cards = driver.find_elements(By.XPATH,
-                "//a[contains(@data-jk, '')] | //h2[contains(@class, 'jobTitle')]/parent::* | //span[@title]//parent::h2//parent::*")
-                
-        if not job_cards:
-            # Generic approach for job cards
-            job_cards = driver.find_elements(By.XPATH,
-                "//div[contains(@class, 'result')] | //article | //li[contains(@class, 'result')]")
-                
-        if len(job_cards) > 0:
-            print(f"✓ Found {len(job_cards)} job listings")
-        else:
-            print("❌ No job listings found")
-            driver.save_screenshot("no_indeed_jobs_found.png")
-            return []
-            
-        results = []
-        applied_count = 0
-        
-        # Process each job
-        for i, card in enumerate(job_cards[:max_jobs]):
+        with span("filters", platform="indeed"):
             try:
-                # Extract job info
-                try:
-                    job_title_elem = card.find_element(By.XPATH, 
-                        ".//h2//a | .//span[@title] | .//a[contains(@data-jk, '')]")
-                    job_title = job_title_elem.get_attribute("title") or job_title_elem.text
-                except:
-                    try:
-                        job_title_elem = card.find_element(By.XPATH, ".//a")
-                        job_title = job_title_elem.text
-                    except:
-                        job_title = "Unknown Title"
+                # Look for filter dropdowns
+                if experience_level:
+                    exp_buttons = driver.find_elements(By.XPATH,
+                        "//button[contains(@aria-label, 'Experience Level') or contains(text(), 'Experience')]")
+                    for button in exp_buttons:
+                        if button.is_displayed():
+                            button.click()
+                            wait_for(driver, "filter_option", any_visible(f"//a[contains(text(), '{experience_level}')]"), legacy_sleep=1)
+                            exp_links = driver.find_elements(By.XPATH, 
+                                f"//a[contains(text(), '{experience_level}')]")
+                            for link in exp_links:
+                                if link.is_displayed():
+                                    link.click()
+                                    print(f"✓ Applied experience filter: {experience_level}")
+                                    wait_for(driver, "search_results", page_reloaded(link, search_results_present("indeed")), legacy_sleep=2)
+                                    break
+                            break
                         
-                try:
-                    company_elem = card.find_element(By.XPATH,
-                        ".//span[@class='companyName'] | .//a[contains(@data-testid, 'company')] | .//span[contains(@class, 'company')]")
-                    company = company_elem.text
-                except:
-                    company = "Unknown Company"
-                    
-                # Get job link
-                try:
-                    job_link_elem = card.find_element(By.XPATH, 
-                        ".//h2//a | .//a[contains(@data-jk, '')]")
-                    job_link = job_link_elem.get_attribute("href")
-                    
-                    # Convert relative URLs to absolute URLs
-                    if job_link and job_link.startswith("/"):
-                        job_link = "https://www.indeed.com" + job_link
+                if job_type:
+                    type_buttons = driver.find_elements(By.XPATH,
+                        "//button[contains(@aria-label, 'Job Type') or contains(text(), 'Job Type')]")
+                    for button in type_buttons:
+                        if button.is_displayed():
+                            button.click()
+                            wait_for(driver, "filter_option", any_visible(f"//a[contains(text(), '{job_type}')]"), legacy_sleep=1)
+                            type_links = driver.find_elements(By.XPATH,
+                                f"//a[contains(text(), '{job_type}')]")
+                            for link in type_links:
+                                if link.is_displayed():
+                                    link.click()
+                                    print(f"✓ Applied job type filter: {job_type}")
+                                    wait_for(driver, "search_results", page_reloaded(link, search_results_present("indeed")), legacy_sleep=2)
+                                    break
+                            break
+                        
+                if date_posted:
+                    date_buttons = driver.find_elements(By.XPATH,
+                        "//button[contains(@aria-label, 'Date Posted') or contains(text(), 'Date')]")
+                    for button in date_buttons:
+                        if button.is_displayed():
+                            button.click()
+                            wait_for(driver, "filter_option", any_visible("//a[contains(@href, 'fromage=')]"), legacy_sleep=1)
+                            # Map common date filters
+                            date_map = {
+                                "Past 24 hours": "1",
+                                "Past 3 days": "3", 
+                                "Past week": "7",
+                                "Past 2 weeks": "14",
+                                "Past month": "30"
+                            }
+                            date_value = date_map.get(date_posted, date_posted)
+                            date_links = driver.find_elements(By.XPATH,
+                                f"//a[contains(@href, 'fromage={date_value}') or contains(text(), '{date_posted}')]")
+                            for link in date_links:
+                                if link.is_displayed():
+                                    link.click()
+                                    print(f"✓ Applied date filter: {date_posted}")
+                                    wait_for(driver, "search_results", page_reloaded(link, search_results_present("indeed")), legacy_sleep=2)
+                                    break
+                            break
                         
-                except:
-                    print(f"⚠️ Could not get link for job {i+1}")
-                    continue
-                    
-                print(f"\n🔶 Job {i+1}: {job_title} at {company}")
-                
-                # Apply for the job using the existing apply_for_job function
-                status = apply_for_job(driver, job_link, resume_path)
-                results.append({"title": job_title, "company": company, "link": job_link, "status": status})
-                
-                if "Applied successfully" in status:
-                    applied_count += 1
-                    
-                print(f"📊 Status: {status}")
-                time.sleep(3)  # Wait between applications
-                
             except Exception as e:
-                print(f"❌ Error processing job {i+1}: {str(e)[:100]}")
-                
-        print(f"\n✅ Applied to {applied_count} out of {len(results)} processed jobs")
-        return results
+                print(f"⚠️ Could not apply filters: {str(e)[:100]}")
+            
+        return True
         
     except Exception as e:
         print(f"❌ Indeed search error: {str(e)}")
-        return []
+        return False
+
+def iter_search_jobs_indeed(driver, search_term, location="", experience_level="", job_type="", date_posted="",
+                            skip_job=None, dedup=None):
+    """Search Indeed and lazily yield jobs (title, company, link), walking result pages as needed.
+
+    Links are canonicalized; cards already in the dedup index or whose link satisfies
+    skip_job(link) (e.g. already applied to) are passed over.
+    """
+    if not perform_search_indeed(driver, search_term, location, experience_level, job_type, date_posted):
+        return
+    try:
+        yield from discover_jobs(driver, "indeed", skip_job=skip_job, dedup=dedup)
+    except Exception as e:
+        print(f"❌ Indeed search error: {str(e)}")
+
+def search_jobs_indeed(driver, search_term, max_jobs=5, location="", experience_level="", job_type="", date_posted="",
+                       skip_job=None, dedup=None):
+    """Search Indeed with additional filters and collect up to max_jobs jobs (title, company, link)"""
+    return list(islice(iter_search_jobs_indeed(driver, search_term, location, experience_level, job_type,
+                                               date_posted, skip_job, dedup), max_jobs))
+
+def search_and_apply_for_jobs_indeed(driver, search_term, resume_path, max_jobs=5,
+                                    location="", experience_level="", job_type="", date_posted="",
+                                    on_result=None, workers=1, pool=None, skip_processed=True,
+                                    checkpoint=None):
+    """Search for jobs on Indeed and apply to them with additional filters.
+
+    on_result, if given, is called with each job's result dict as soon as it is processed.
+    Sequentially, each job is applied to (in a second tab) as soon as discovery yields it;
+    with workers > 1 the collected jobs are applied to concurrently (see parallel_apply.py).
+    With skip_processed, postings recorded in the applied-jobs store are not re-opened.
+    With a checkpoint, discovered jobs and results are journalled so the run can be resumed.
+    """
+    store = get_applied_store() if skip_processed else None
+    dedup = DedupIndex()
+    # Jobs are discovered lazily: the first application starts once the first window of cards is ranked
+    found = iter_search_jobs_indeed(driver, search_term, location, experience_level, job_type, date_posted,
+                                    skip_job=store.should_skip if store else None, dedup=dedup)
+    # Best matches for the resume first; poor fits are never opened (relevance.py)
+    found = filter_relevant_jobs(found, resume_path, search_term, top_k=max_jobs)
+    if checkpoint is not None:
+        found = checkpoint.track_discovery(found)
+    jobs = islice(found, max_jobs)
+    results = _apply_collected_jobs(driver, jobs, resume_path, on_result, workers, pool, store, checkpoint)
+    if dedup.duplicates:
+        print(f"🔁 Avoided {dedup.duplicates} duplicate navigations ({len(dedup)} unique postings)")
+    return results
+
+def resume_run(driver, checkpoint, resume_path=None, on_result=None, workers=1, pool=None, skip_processed=True,
+               max_jobs=None):
+    """Finish an interrupted run from its checkpoint without re-searching or re-applying.
+
+    Jobs with a journalled result keep it; jobs whose application got as far as the submit
+    click are reported, not re-applied; the other discovered jobs are applied to. The search
+    only runs again if the run had not yet discovered max_jobs postings. max_jobs, when given
+    (the caller's remaining quota), caps the applications this call makes; if it stops the run
+    short, the checkpoint is left open so the rest can be resumed later.
+    """
+    params = checkpoint.params
+    resume_path = resume_path or params.get("resume_path")
+    results = checkpoint.ordered_results()
+    writer = get_results_writer()
+    store = get_applied_store() if skip_processed else None
+    for job in checkpoint.interrupted_after_submit():
+        result = {**job, "status": INTERRUPTED_AFTER_SUBMIT}
+        checkpoint.record_result(result)
+        if store is not None:
+            # May have been submitted: never retried by this or a later run
+            store.record(result, final=True)
+        if writer is not None:
+            writer.write_result(result, checkpoint.run_id, params.get("search_term"))
+        results.append(result)
+        if on_result:
+            on_result(result)
+    pending = checkpoint.pending_jobs()
+    budget = len(pending) + max(0, int(params.get("max_jobs") or 0) - len(checkpoint.jobs))
+    if max_jobs is not None and max_jobs < budget:
+        print(f"🚦 Applying to at most {max_jobs} more jobs this time (quota)")
+        budget = max_jobs
+    print(f"♻️ Resuming {checkpoint.run_id}: {len(results)} jobs already processed, {len(pending)} left to apply")
+
+    if pending:
+        results += _apply_collected_jobs(driver, pending[:budget], resume_path, on_result, workers, pool, store,
+                                         checkpoint)
+    remaining = min(int(params.get("max_jobs") or 0) - len(checkpoint.jobs), budget - len(pending))
+    if remaining > 0 and not checkpoint.discovery_done:
+        search_and_apply = (search_and_apply_for_jobs_indeed if params.get("platform") == "indeed"
+                            else search_and_apply_for_jobs)
+        results += search_and_apply(driver, params["search_term"], resume_path, remaining,
+                                    location=params.get("location", ""),
+                                    experience_level=params.get("experience_level", ""),
+                                    job_type=params.get("job_type", ""),
+                                    date_posted=params.get("date_posted", ""),
+                                    on_result=on_result, workers=workers, pool=pool,
+                                    skip_processed=skip_processed, checkpoint=checkpoint)
+    if checkpoint.pending_jobs() or (len(checkpoint.jobs) < int(params.get("max_jobs") or 0)
+                                     and not checkpoint.discovery_done):
+        checkpoint.close()  # Stopped short by the quota: resumable later
+    else:
+        checkpoint.finish()
+    return results
+
+def report_results(driver, results):
+    """Print the run's results and summaries"""
+    print("\n=== Application Results ===")
+    successful_applications = 0
+    for i, job in enumerate(results):
+        print(f"{i+1}. {job['title']} at {job['company']}: {job['status']}")
+        if "Applied successfully" in job['status']:
+            successful_applications += 1
+    
+    # Final summary
+    print(f"\n🎯 Successfully applied to {successful_applications} out of {len(results)} jobs")
+    print_wait_summary()
+    print_pacing_summary()
+    print_filter_summary()
+    print_selector_summary()
+    print_command_summary(driver)
+    print_trace_summary()
+    trace_files = export_trace(prefix="run")
+    if trace_files:
+        print(f"🧭 Trace written to {trace_files[0]} and {trace_files[1]}")
+    print("\n🏁 Process complete!")
+    
+    # Each result was appended to the results log as it finished; make sure the tail is on disk
+    writer = get_results_writer()
+    if writer is not None:
+        writer.flush()
+        print(f"✓ Results appended to {writer.path} (python results_log.py summary for totals across runs)")
 
 def main():
     print("\n=== LinkedIn Job Application Bot ===\n")
@@ -798,6 +1004,10 @@ def main():
         if not os.path.exists(resume_path):
             print("Invalid path. Exiting.")
             return
+    profile = load_resume_profile(resume_path)
+    if profile:
+        print(f"📄 Resume: {profile['name'] or os.path.basename(resume_path)}, {len(profile['skills'])} skills, "
+              f"{len(profile['experience'])} experience entries")
             
     #if not os.path.exists(cover_letter_path):
      #   print(f"❌ Cover letter not found: {cover_letter_path}")
@@ -810,10 +1020,27 @@ def main():
     print("🌐 Setting up browser...")
     driver = setup_driver()
     
-    # Login to LinkedIn
-    driver.get("https://www.linkedin.com/login")
-    print("\n⚠️ Please log in to LinkedIn manually")
-    input("Press Enter once you've logged in...")
+    # Reuse the LinkedIn login saved by an earlier run, or log in by hand and save it
+    account = os.getenv("LINKEDIN_ACCOUNT") or None
+    if not ensure_session(driver, "linkedin", account):
+        driver.get(f"{LINKEDIN_BASE_URL}/login")
+        print("\n⚠️ Please log in to LinkedIn manually")
+        input("Press Enter once you've logged in...")
+        capture_session(driver, "linkedin", account)
+    
+    # Offer to finish a run that was interrupted (crash, closed window, Ctrl+C)
+    unfinished = unfinished_runs()
+    if unfinished:
+        latest = unfinished[0]
+        print(f"\n♻️ Unfinished run {latest['run_id']} for '{latest['search_term']}': "
+              f"{latest['processed']} processed, {latest['pending']} discovered but not applied")
+        if "--resume" in sys.argv or input("Resume it? (y/n): ").strip().lower() == "y":
+            checkpoint = RunCheckpoint(latest["path"])
+            results = resume_run(driver, checkpoint, resume_path)
+            report_results(driver, results)
+            input("Press Enter to close the browser...")
+            driver.quit()
+            return
     
     # Job search parameters
     search_term = input("\nEnter job search term (e.g., 'Python Developer'): ")
@@ -880,6 +1107,13 @@ def main():
         print("Invalid number, defaulting to 5")
         max_jobs = 5
     
+    # Journal the run so it can be resumed if it is interrupted
+    checkpoint = RunCheckpoint.create({
+        "search_term": search_term, "location": location, "experience_level": experience_level,
+        "job_type": job_type, "date_posted": date_posted, "max_jobs": max_jobs,
+        "platform": "linkedin", "resume_path": resume_path,
+    })
+    
     # Execute search and application
     print(f"\n🚀 Searching and applying for '{search_term}' jobs...")
     results = search_and_apply_for_jobs(
@@ -890,52 +1124,76 @@ def main():
         location=location,
         experience_level=experience_level,
         job_type=job_type,
-        date_posted=date_posted
+        date_posted=date_posted,
+        checkpoint=checkpoint
     )
+    checkpoint.finish()
     
-    # Display results
-    print("\n=== Application Results ===")
-    successful_applications = 0
-    for i, job in enumerate(results):
-        print(f"{i+1}. {job['title']} at {job['company']}: {job['status']}")
-        if "Applied successfully" in job['status']:
-            successful_applications += 1
-    
-    # Final summary
-    print(f"\n🎯 Successfully applied to {successful_applications} out of {len(results)} jobs")
-    print("\n🏁 Process complete!")
-    
-    # Save results to file
-    try:
-        with open("application_results.txt", "w") as file:
-            file.write(f"LinkedIn Job Applications - {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            file.write(f"Search Term: {search_term}\n\n")
-            for i, job in enumerate(results):
-                file.write(f"{i+1}. {job['title']} at {job['company']}\n")
-                file.write(f"   Status: {job['status']}\n")
-                file.write(f"   Link: {job['link']}\n\n")
-        print("✓ Results saved to application_results.txt")
-    except:
-        print("⚠️ Could not save results to file")
+    report_results(driver, results)
     
     input("Press Enter to close the browser...")
     driver.quit()
 
 # Wrap main execution in a callable function
-def run_job_automation(search_term, resume_path, cover_letter_path, max_jobs, location, experience_level, job_type, date_posted, platform=None, username=None, password=None):
+def run_job_automation(search_term, resume_path, cover_letter_path, max_jobs, location, experience_level, job_type, date_posted, platform=None, username=None, password=None, on_result=None, workers=None, browser_profile=None, account=None, run_id=None, use_saved_session=True):
+    platform = (platform or "linkedin").strip().lower()
+    if platform not in ("linkedin", "indeed"):
+        raise ValueError(f"Unsupported platform '{platform}'; use 'linkedin' or 'indeed'")
+    # Borrow a warm browser from the pool instead of paying Chrome start-up on every call
+    from driver_pool import get_driver_pool
+    pool = get_driver_pool(browser_profile)
+    if workers is None:
+        workers = int(os.getenv("APPLY_PARALLEL_WORKERS", "1"))
+    with pool.driver() as driver:
+        # Pooled browsers keep their cookies, so only the first run per browser restores or logs in;
+        # no account means the server's own (LINKEDIN_ACCOUNT), the same as the API's "default" tenant
+        account = account or username
+        require_session(driver, platform, account, username, password, use_saved_session)
+        # Never journal the password; a resume logs in again from the session store
+        checkpoint = RunCheckpoint.create({
+            "search_term": search_term, "location": location, "experience_level": experience_level,
+            "job_type": job_type, "date_posted": date_posted, "max_jobs": max_jobs,
+            "platform": platform, "resume_path": resume_path, "account": account,
+        }, run_id=run_id)
+        search_and_apply = search_and_apply_for_jobs_indeed if platform == "indeed" else search_and_apply_for_jobs
+        results = search_and_apply(
+            driver,
+            search_term,
+            resume_path,
+            max_jobs,
+            location,
+            experience_level,
+            job_type,
+            date_posted,
+            on_result=on_result,
+            workers=workers,
+            pool=pool,
+            checkpoint=checkpoint
+        )
+        checkpoint.finish()
+        if workers <= 1:
+            # apply_in_parallel records per-driver job counts itself
+            pool.record_jobs(driver, len(results))
+    # No-op unless TRACE_DIR is set
+    export_trace(prefix="apply")
+    return results
 
-    driver = setup_driver()
-    results = search_and_apply_for_jobs(
-        driver,
-        search_term,
-        resume_path,
-        max_jobs,
-        location,
-        experience_level,
-        job_type,
-        date_posted
-    )
-    driver.quit()
+def resume_job_automation(run_id, resume_path=None, on_result=None, workers=None, browser_profile=None,
+                          max_jobs=None, username=None, password=None, use_saved_session=True):
+    """Finish an interrupted run_job_automation() call from its checkpoint, applying to at most max_jobs more"""
+    path = checkpoint_path(run_id)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No checkpoint for run {run_id}")
+    from driver_pool import get_driver_pool
+    pool = get_driver_pool(browser_profile)
+    if workers is None:
+        workers = int(os.getenv("APPLY_PARALLEL_WORKERS", "1"))
+    checkpoint = RunCheckpoint(path)
+    with pool.driver() as driver:
+        require_session(driver, checkpoint.params.get("platform") or "linkedin", checkpoint.params.get("account"),
+                        username, password, use_saved_session)
+        results = resume_run(driver, checkpoint, resume_path, on_result, workers, pool, max_jobs=max_jobs)
+    export_trace(prefix="apply")
     return results
 
 if __name__ == "__main__":
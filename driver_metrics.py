@@ -0,0 +1,166 @@
+import os
+import sys
+import time
+
+import selenium
+
+from tracing import note_command
+
+_SELENIUM_DIR = os.path.dirname(os.path.abspath(selenium.__file__))
+_THIS_FILE = os.path.abspath(__file__)
+
+
+class RoundTripBudgetExceeded(Exception):
+    """Raised when a job issues more WebDriver commands than its round-trip budget allows"""
+
+
+def _call_site():
+    """'file.py:line function' of the first caller outside Selenium and this module"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if not filename.startswith(_SELENIUM_DIR) and filename != _THIS_FILE:
+            return f"{os.path.basename(filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+def _add(table, key, elapsed_ms):
+    entry = table.get(key)
+    if entry is None:
+        entry = table[key] = [0, 0.0]
+    entry[0] += 1
+    entry[1] += elapsed_ms
+
+
+def _ranked(table, top=None):
+    rows = sorted(table.items(), key=lambda item: (-item[1][0], -item[1][1]))
+    if top is not None:
+        rows = rows[:top]
+    return {key: {"count": count, "total_ms": round(total_ms, 3)} for key, (count, total_ms) in rows}
+
+
+class InstrumentedDriver:
+    """WebDriver wrapper that counts and times every command by type and call site.
+
+    Attribute access and assignment pass through to the wrapped driver. The counting hook
+    sits on the wrapped driver's execute(), so commands issued through WebElements are
+    counted too. Between begin_job() and end_job() commands are also tallied per job,
+    and the job_budget (WEBDRIVER_JOB_BUDGET, 0 = unlimited) is enforced.
+    """
+
+    def __init__(self, driver, job_budget=None):
+        if job_budget is None:
+            job_budget = int(os.getenv("WEBDRIVER_JOB_BUDGET", "0"))
+        own = {
+            "wrapped_driver": driver,
+            "job_budget": job_budget,
+            "_by_command": {},
+            "_by_call_site": {},
+            "_calls": 0,
+            "_total_ms": 0.0,
+            "_job": None,
+            "_original_execute": driver.execute,
+        }
+        for name, value in own.items():
+            object.__setattr__(self, name, value)
+        driver.execute = self._execute
+
+    def __getattr__(self, name):
+        if name == "wrapped_driver":
+            raise AttributeError(name)  # Not initialised yet (e.g. during copy)
+        return getattr(self.wrapped_driver, name)
+
+    def __setattr__(self, name, value):
+        if name in self.__dict__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.wrapped_driver, name, value)
+
+    def __repr__(self):
+        return f"<InstrumentedDriver {self.wrapped_driver!r} calls={self._calls}>"
+
+    def _execute(self, driver_command, params=None):
+        note_command()
+        job = self._job
+        if job is not None and self.job_budget and job["calls"] >= self.job_budget:
+            job["budget_exceeded"] = True
+            raise RoundTripBudgetExceeded(
+                f"WebDriver round-trip budget of {self.job_budget} calls exceeded ({driver_command})")
+        site = _call_site()
+        started = time.perf_counter()
+        try:
+            return self._original_execute(driver_command, params)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._calls += 1
+            self._total_ms += elapsed_ms
+            _add(self._by_command, driver_command, elapsed_ms)
+            _add(self._by_call_site, site, elapsed_ms)
+            if job is not None:
+                job["calls"] += 1
+                job["total_ms"] += elapsed_ms
+                _add(job["by_command"], driver_command, elapsed_ms)
+                _add(job["by_call_site"], site, elapsed_ms)
+
+    # ----- per-job accounting -----
+
+    def begin_job(self):
+        self._job = {"calls": 0, "total_ms": 0.0, "by_command": {}, "by_call_site": {}, "budget_exceeded": False}
+
+    def end_job(self):
+        """Stop per-job accounting and return the job's summary (None if no job was open)"""
+        job, self._job = self._job, None
+        if job is None:
+            return None
+        return {
+            "calls": job["calls"],
+            "time_ms": round(job["total_ms"], 1),
+            "by_command": {command: entry["count"] for command, entry in _ranked(job["by_command"]).items()},
+            "top_call_sites": _ranked(job["by_call_site"], top=5),
+            "budget": self.job_budget or None,
+            "budget_exceeded": job["budget_exceeded"],
+        }
+
+    # ----- lifetime totals -----
+
+    def command_stats(self, top=20):
+        return {
+            "calls": self._calls,
+            "time_ms": round(self._total_ms, 1),
+            "by_command": _ranked(self._by_command),
+            "by_call_site": _ranked(self._by_call_site, top=top),
+        }
+
+    def reset_command_stats(self):
+        self._by_command.clear()
+        self._by_call_site.clear()
+        self._calls = 0
+        self._total_ms = 0.0
+
+
+def begin_job(driver):
+    """Start per-job command accounting on driver (no-op for plain WebDrivers)"""
+    if isinstance(driver, InstrumentedDriver):
+        driver.begin_job()
+
+
+def end_job(driver):
+    """Finish per-job accounting; the job's summary dict, or None for plain WebDrivers"""
+    if isinstance(driver, InstrumentedDriver):
+        return driver.end_job()
+    return None
+
+
+def print_command_summary(driver, top=10):
+    if not isinstance(driver, InstrumentedDriver):
+        return
+    stats = driver.command_stats(top=top)
+    if not stats["calls"]:
+        return
+    print(f"\n=== WebDriver Commands ({stats['calls']} calls, {stats['time_ms'] / 1000:.1f}s) ===")
+    for command, entry in stats["by_command"].items():
+        print(f"{command:>28}: {entry['count']:>5}x  {entry['total_ms'] / 1000:>7.2f}s")
+    print("--- busiest call sites ---")
+    for site, entry in stats["by_call_site"].items():
+        print(f"{entry['count']:>5}x  {entry['total_ms'] / 1000:>7.2f}s  {site}")
@@ -0,0 +1,345 @@
+import os
+import time
+import logging
+import functools
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+def process_tree_rss_mb(pid):
+    """Return the resident memory (MB) of a process and all its children, or None if unavailable"""
+    if not pid:
+        return None
+    try:
+        import psutil
+        root = psutil.Process(pid)
+        total = root.memory_info().rss
+        for child in root.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+    except ImportError:
+        pass
+    except Exception:
+        return None
+
+    # Fallback for Linux hosts without psutil: walk /proc
+    if not os.path.isdir("/proc"):
+        return None
+    total_kb = 0
+    pending = [pid]
+    seen = set()
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        try:
+            with open(f"/proc/{current}/status") as status:
+                for line in status:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as children:
+                    pending.extend(int(child) for child in children.read().split())
+        except (OSError, ValueError):
+            continue
+    return total_kb / 1024 if seen else None
+
+
+def driver_rss_mb(driver):
+    """Resident memory of the chromedriver process tree (chromedriver + Chrome) behind a driver"""
+    try:
+        return process_tree_rss_mb(driver.service.process.pid)
+    except Exception:
+        return None
+
+
+class _PooledDriver:
+    """Bookkeeping for a single pooled WebDriver session"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.time()
+        self.jobs_done = 0
+        self.baseline_rss_mb = driver_rss_mb(driver)
+
+
+class DriverPool:
+    """A warm pool of pre-launched WebDriver sessions with checkout/return semantics"""
+
+    def __init__(self, factory, min_size=1, max_size=2, max_jobs_per_driver=25,
+                 max_rss_growth_mb=400, checkout_timeout=300, profile=None):
+        self.factory = factory
+        self.profile = profile
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.max_jobs_per_driver = max_jobs_per_driver
+        self.max_rss_growth_mb = max_rss_growth_mb
+        self.checkout_timeout = checkout_timeout
+
+        self._lock = threading.Condition()
+        self._idle = []
+        self._busy = {}
+        self._launching = 0
+        self._closed = False
+
+        self._created = 0
+        self._recycled = 0
+        self._failed_health_checks = 0
+        self._checkouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    # ----- lifecycle -----
+
+    def start(self, background=True):
+        """Pre-launch drivers until the pool holds min_size sessions"""
+        if background:
+            threading.Thread(target=self._fill_to_min, name="driver-pool-warmup", daemon=True).start()
+        else:
+            self._fill_to_min()
+
+    def shutdown(self):
+        """Quit every idle driver; busy drivers are quit when they are returned"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._lock.notify_all()
+        for pooled in idle:
+            self._quit(pooled)
+
+    def _fill_to_min(self):
+        while True:
+            with self._lock:
+                if self._closed or self._size() >= self.min_size:
+                    return
+                self._launching += 1
+            pooled = self._launch()
+            with self._lock:
+                self._launching -= 1
+                if pooled is None:
+                    return
+                self._idle.append(pooled)
+                self._lock.notify()
+
+    def _size(self):
+        return len(self._idle) + len(self._busy) + self._launching
+
+    def _launch(self):
+        try:
+            driver = self.factory()
+        except Exception as e:
+            logger.error(f"Driver pool could not launch a browser: {e}")
+            return None
+        with self._lock:
+            self._created += 1
+        logger.info("Driver pool launched a new browser session")
+        return _PooledDriver(driver)
+
+    def _quit(self, pooled):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+    # ----- health / recycling -----
+
+    def _is_healthy(self, pooled):
+        """Cheap liveness probe: a single execute_script round-trip"""
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _needs_recycle(self, pooled):
+        if self.max_jobs_per_driver and pooled.jobs_done >= self.max_jobs_per_driver:
+            return f"served {pooled.jobs_done} jobs"
+        if self.max_rss_growth_mb and pooled.baseline_rss_mb is not None:
+            rss = driver_rss_mb(pooled.driver)
+            if rss is not None and rss - pooled.baseline_rss_mb > self.max_rss_growth_mb:
+                return f"memory grew {rss - pooled.baseline_rss_mb:.0f} MB"
+        return None
+
+    # ----- checkout / return -----
+
+    def checkout(self, timeout=None):
+        """Borrow a healthy driver, launching one if the pool is below max_size"""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            pooled = None
+            launch = False
+            with self._lock:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Driver pool is shut down")
+                    if self._idle:
+                        pooled = self._idle.pop()
+                        break
+                    if self._size() < self.max_size:
+                        self._launching += 1
+                        launch = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No browser available after {timeout}s")
+                    self._lock.wait(remaining)
+
+            if launch:
+                pooled = self._launch()
+                with self._lock:
+                    self._launching -= 1
+                    if pooled is not None:
+                        # Register before releasing the lock so the pool never overshoots max_size
+                        self._busy[id(pooled.driver)] = pooled
+                    self._lock.notify()
+                if pooled is None:
+                    raise RuntimeError("Driver pool could not launch a browser")
+            elif not self._is_healthy(pooled):
+                logger.warning("Pooled browser failed its health check, replacing it")
+                with self._lock:
+                    self._failed_health_checks += 1
+                    self._recycled += 1
+                self._quit(pooled)
+                continue
+
+            waited = time.monotonic() - started
+            with self._lock:
+                self._busy[id(pooled.driver)] = pooled
+                self._checkouts += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+            return pooled.driver
+
+    def checkin(self, driver, jobs_completed=0, discard=False):
+        """Return a driver to the pool, recycling it if it is worn out or broken"""
+        with self._lock:
+            # Stays registered as busy until we decide its fate, so size() stays accurate
+            pooled = self._busy.get(id(driver))
+        if pooled is None:
+            # Not one of ours - just close it
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            return
+
+        pooled.jobs_done += jobs_completed
+        reason = "discarded by caller" if discard else None
+        if reason is None and not self._is_healthy(pooled):
+            reason = "failed health check"
+        if reason is None:
+            reason = self._needs_recycle(pooled)
+
+        if reason is None:
+            try:
+                # Drop the previous page so the next borrower starts clean
+                driver.get("about:blank")
+            except Exception:
+                reason = "could not reset page"
+
+        if reason is not None or self._closed:
+            if reason:
+                logger.info(f"Recycling pooled browser: {reason}")
+            self._quit(pooled)
+            with self._lock:
+                self._busy.pop(id(driver), None)
+                if reason:
+                    self._recycled += 1
+                self._lock.notify()
+            if not self._closed:
+                self.start(background=True)
+            return
+
+        with self._lock:
+            self._busy.pop(id(driver), None)
+            self._idle.append(pooled)
+            self._lock.notify()
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Context manager around checkout()/checkin()"""
+        driver = self.checkout(timeout)
+        try:
+            yield driver
+        finally:
+            # checkin() health-checks the session, so a crashed browser is recycled there
+            self.checkin(driver)
+
+    def record_jobs(self, driver, count):
+        """Count jobs processed on a borrowed driver towards its recycling budget"""
+        with self._lock:
+            pooled = self._busy.get(id(driver))
+            if pooled is not None:
+                pooled.jobs_done += count
+
+    # ----- metrics -----
+
+    def session_rss(self):
+        """Current resident memory (MB) of each pooled browser session, busy ones first"""
+        with self._lock:
+            sessions = [("busy", pooled) for pooled in self._busy.values()]
+            sessions += [("idle", pooled) for pooled in self._idle]
+        report = []
+        for state, pooled in sessions:
+            rss = driver_rss_mb(pooled.driver)
+            report.append({
+                "state": state,
+                "rss_mb": round(rss, 1) if rss is not None else None,
+                "baseline_rss_mb": round(pooled.baseline_rss_mb, 1) if pooled.baseline_rss_mb is not None else None,
+                "jobs_done": pooled.jobs_done,
+                "age_s": round(time.time() - pooled.created_at),
+            })
+        return report
+
+    def stats(self):
+        sessions = self.session_rss()
+        measured = [session["rss_mb"] for session in sessions if session["rss_mb"] is not None]
+        with self._lock:
+            return {
+                "profile": self.profile,
+                "idle": len(self._idle),
+                "busy": len(self._busy),
+                "launching": self._launching,
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "created": self._created,
+                "recycled": self._recycled,
+                "failed_health_checks": self._failed_health_checks,
+                "checkouts": self._checkouts,
+                "avg_checkout_wait_s": round(self._total_wait / self._checkouts, 3) if self._checkouts else 0.0,
+                "max_checkout_wait_s": round(self._max_wait, 3),
+                "sessions": sessions,
+                "total_rss_mb": round(sum(measured), 1) if measured else None,
+            }
+
+
+_pools = {}
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool(profile=None):
+    """Return the process-wide driver pool for a browser profile, configured from the environment (see config.env)"""
+    from browser_profiles import resolve_profile
+    profile = resolve_profile(profile)
+    with _pool_lock:
+        if profile not in _pools:
+            from danish_job_bot import setup_driver
+            _pools[profile] = DriverPool(
+                factory=functools.partial(setup_driver, profile=profile),
+                min_size=int(os.getenv("DRIVER_POOL_MIN", "1")),
+                max_size=int(os.getenv("DRIVER_POOL_MAX", "2")),
+                max_jobs_per_driver=int(os.getenv("DRIVER_POOL_MAX_JOBS", "25")),
+                max_rss_growth_mb=int(os.getenv("DRIVER_POOL_MAX_RSS_GROWTH_MB", "400")),
+                checkout_timeout=int(os.getenv("DRIVER_POOL_CHECKOUT_TIMEOUT", "300")),
+                profile=profile,
+            )
+        return _pools[profile]
@@ -6,6 +6,16 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium_stealth import stealth
+from waits import (wait_for, document_ready, any_present, any_visible, search_results_present,
+                   page_reloaded, easy_apply_modal_open, step_signature, step_advanced,
+                   file_chip_attached, field_has_value, element_selected, print_wait_summary)
+from resource_filter import platform_for_url
+from selector_registry import get_selector_registry
+from job_discovery import find_cards
+from danish_job_bot import pacer_for, record_pacing
+
+LINKEDIN_SEARCH_INPUT_XPATH = "//input[contains(@placeholder, 'Search') or contains(@id, 'jobs-search') or contains(@name, 'keywords')]"
+INDEED_WHAT_INPUT_XPATH = "//input[@id='text-input-what' or @name='q' or contains(@placeholder, 'Job title') or contains(@placeholder, 'what')]"
 
 def setup_driver():
     """Set up the Chrome WebDriver with anti-detection settings"""
@@ -40,7 +50,7 @@ def upload_file(driver, file_path, retry_attempts=3):
                     if input_elem.is_displayed():
                         input_elem.send_keys(file_path)
                         print(f"✓ File uploaded: {os.path.basename(file_path)}")
-                        time.sleep(1)
+                        wait_for(driver, "file_attached", file_chip_attached(input_elem, file_path), legacy_sleep=1)
                         return True
                 except:
                     continue
@@ -51,7 +61,7 @@ def upload_file(driver, file_path, retry_attempts=3):
                     driver.execute_script("arguments[0].style.display = 'block';", input_elem)
                     input_elem.send_keys(file_path)
                     print(f"✓ File uploaded (hidden input): {os.path.basename(file_path)}")
-                    time.sleep(1)
+                    wait_for(driver, "file_attached", file_chip_attached(input_elem, file_path), legacy_sleep=1)
                     return True
                 except:
                     continue
@@ -66,7 +76,7 @@ def upload_file(driver, file_path, retry_attempts=3):
                     try:
                         button.click()
                         print("✓ Clicked upload button")
-                        time.sleep(1)
+                        wait_for(driver, "upload_retry", any_present("//input[@type='file']"), legacy_sleep=1)
                         
                         # Try to find file inputs again
                         file_inputs = driver.find_elements(By.XPATH, "//input[@type='file']")
@@ -74,7 +84,7 @@ def upload_file(driver, file_path, retry_attempts=3):
                             try:
                                 input_elem.send_keys(file_path)
                                 print(f"✓ File uploaded after button click: {os.path.basename(file_path)}")
-                                time.sleep(1)
+                                wait_for(driver, "file_attached", file_chip_attached(input_elem, file_path), legacy_sleep=1)
                                 return True
                             except:
                                 continue
@@ -83,7 +93,7 @@ def upload_file(driver, file_path, retry_attempts=3):
             
             if attempt < retry_attempts - 1:
                 print(f"⚠️ Upload attempt {attempt+1} failed, retrying...")
-                time.sleep(1)
+                wait_for(driver, "upload_retry", any_present("//input[@type='file']"), legacy_sleep=1)
             else:
                 print(f"⚠️ Upload failed after {retry_attempts} attempts")
                 return False
@@ -91,7 +101,7 @@ def upload_file(driver, file_path, retry_attempts=3):
         except Exception as e:
             if attempt < retry_attempts - 1:
                 print(f"❌ Upload error: {str(e)[:100]}, retrying...")
-                time.sleep(1)
+                wait_for(driver, "upload_retry", document_ready, legacy_sleep=1)
             else:
                 print(f"❌ Upload error: {str(e)[:100]}")
                 return False
@@ -126,8 +136,8 @@ def fill_form_fields(driver):
                 if (key in field_id or key in field_name or key in placeholder) and field.is_enabled():
                     field.clear()
                     field.send_keys(value)
+                    wait_for(driver, "field_filled", field_has_value(field, value), legacy_sleep=0.5)
                     print(f"✓ Filled field: {key}")
-                    time.sleep(0.5)
         except:
             continue
     
@@ -138,7 +148,7 @@ def fill_form_fields(driver):
             if checkbox.is_displayed() and not checkbox.is_selected():
                 checkbox.click()
                 print("✓ Checked a checkbox")
-                time.sleep(0.5)
+                wait_for(driver, "field_filled", element_selected(checkbox), legacy_sleep=0.5)
         except:
             continue
 
@@ -201,48 +211,31 @@ def is_application_successful(driver):
 
 def apply_for_job(driver, job_url, resume_path):#cover_letter
     """Apply for a single job"""
+    selectors = get_selector_registry()
+    platform = platform_for_url(job_url)
     try:
         # Navigate to job page
         driver.get(job_url)
         print(f"✓ Navigated to job page")
-        time.sleep(3)
+        wait_for(driver, "page_load", document_ready, legacy_sleep=3)
         
         # Save the page title for better job identification
         try:
-            job_title_element = driver.find_element(By.XPATH, "//h1[contains(@class, 'job-title')]")
+            job_title_element = selectors.find(driver, platform, "job_page", "job_title")
             job_title = job_title_element.text
             print(f"✓ Job title: {job_title}")
         except:
             job_title = "Unknown Title"
             
         # Find and click apply button
-        apply_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Apply') or contains(@aria-label, 'Apply') or contains(@class, 'jobs-apply')]")
         apply_clicked = False
-        
-        for button in apply_buttons:
-            if button.is_displayed() and button.is_enabled():
-                # Save button state for later comparison
-                original_text = button.text
-                print(f"✓ Found apply button: '{original_text}'")
-                
-                button.click()
-                print("✓ Clicked apply button")
-                apply_clicked = True
-                time.sleep(3)
-                break
-                
-        if not apply_clicked:
-            print("⚠️ Could not find standard apply button, trying alternative selectors")
-            
-            # Try alternative button selectors
-            alt_buttons = driver.find_elements(By.XPATH, "//a[contains(@href, 'apply') or contains(@class, 'apply')] | //div[contains(@role, 'button')][contains(text(), 'Apply')]")
-            for button in alt_buttons:
-                if button.is_displayed() and button.is_enabled():
-                    button.click()
-                    print("✓ Clicked alternative apply button")
-                    apply_clicked = True
-                    time.sleep(3)
-                    break
+        button = selectors.find_clickable(driver, platform, "job_page", "apply_button")
+        if button is not None:
+            print(f"✓ Found apply button: '{button.text}'")
+            button.click()
+            print("✓ Clicked apply button")
+            apply_clicked = True
+            wait_for(driver, "easy_apply_modal", easy_apply_modal_open, legacy_sleep=3)
                     
         if not apply_clicked:
             print("❌ Could not find any apply button")
@@ -265,37 +258,26 @@ def apply_for_job(driver, job_url, resume_path):#cover_letter
         
         # Click through application steps (next/submit buttons)
         for attempt in range(10):  # Try up to 10 steps in the application process
-            time.sleep(2)  # Wait for page to update
+            if attempt == 0:
+                # Later iterations already waited for the step to advance after their click
+                wait_for(driver, "modal_settle", document_ready, legacy_sleep=2)
             
             # Check if application is already successful after last click
             if is_application_successful(driver):
                 print("✓ Application success detected!")
                 return "Applied successfully!"
             
-            # Look for next/submit buttons
-            next_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Submit') or contains(text(), 'submit') or contains(text(), 'Next') or contains(text(), 'next') or contains(text(), 'Continue') or contains(text(), 'continue')] | //button[@type='submit']")
+            # Look for next/submit buttons (footer buttons are the fallback, common in LinkedIn)
             submit_clicked = False
-            
-            for button in next_buttons:
-                if button.is_displayed() and button.is_enabled():
-                    button_text = button.text.strip()
-                    if button_text:  # Only click if button has text
-                        button.click()
-                        print(f"✓ Clicked button: '{button_text}'")
-                        submit_clicked = True
-                        time.sleep(2)
-                        break
-                    
-            if not submit_clicked:
-                # If no standard buttons found, try footer buttons (common in LinkedIn)
-                footer_buttons = driver.find_elements(By.XPATH, "//footer//button | //div[contains(@class, 'footer')]//button")
-                for button in footer_buttons:
-                    if button.is_displayed() and button.is_enabled() and button.text.strip():
-                        button.click()
-                        print(f"✓ Clicked footer button: '{button.text}'")
-                        submit_clicked = True
-                        time.sleep(2)
-                        break
+            button = selectors.find_clickable(driver, platform, "job_page", "step_button", with_text=True)
+            if button is not None:
+                button_text = button.text.strip()
+                signature = step_signature(driver)
+                button.click()
+                print(f"✓ Clicked button: '{button_text}'")
+                submit_clicked = True
+                # Replaces the post-click sleep and the next iteration's settle sleep
+                wait_for(driver, "step_advanced", step_advanced(signature), legacy_sleep=4)
                         
             if not submit_clicked:
                 # If no more buttons, we're probably done or stuck
@@ -334,10 +316,10 @@ def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5,
         # Navigate to LinkedIn jobs page
         driver.get("https://www.linkedin.com/jobs/")
         print("✓ Navigated to LinkedIn Jobs page")
-        time.sleep(3)
+        wait_for(driver, "page_load", any_present(LINKEDIN_SEARCH_INPUT_XPATH), legacy_sleep=3)
         
         # Find and fill the search input
-        search_inputs = driver.find_elements(By.XPATH, "//input[contains(@placeholder, 'Search') or contains(@id, 'jobs-search') or contains(@name, 'keywords')]")
+        search_inputs = driver.find_elements(By.XPATH, LINKEDIN_SEARCH_INPUT_XPATH)
         search_performed = False
         
         for search_input in search_inputs:
@@ -347,7 +329,7 @@ def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5,
                 search_input.send_keys(Keys.RETURN)
                 print(f"✓ Searching for: {search_term}")
                 search_performed = True
-                time.sleep(5)  # Wait for search results
+                wait_for(driver, "search_results", search_results_present("linkedin"), legacy_sleep=5)
                 break
                 
         if not search_performed:
@@ -357,14 +339,14 @@ def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5,
             for box in search_boxes:
                 if box.is_displayed():
                     box.click()
-                    time.sleep(1)
+                    wait_for(driver, "filter_option", any_visible("//input[contains(@placeholder, 'Search')]"), legacy_sleep=1)
                     search_inputs = driver.find_elements(By.XPATH, "//input[contains(@placeholder, 'Search')]")
                     if search_inputs:
                         search_inputs[0].send_keys(search_term)
                         search_inputs[0].send_keys(Keys.RETURN)
                         print(f"✓ Searching for: {search_term} (alternative method)")
                         search_performed = True
-                        time.sleep(5)
+                        wait_for(driver, "search_results", search_results_present("linkedin"), legacy_sleep=5)
                         break
         
         if not search_performed:
@@ -378,7 +360,7 @@ def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5,
                 if button.is_displayed():
                     button.click()
                     print("✓ Clicked on filters")
-                    time.sleep(2)
+                    wait_for(driver, "filters", easy_apply_modal_open, legacy_sleep=2)
                     
                     # Apply Easy Apply filter
                     easy_apply_checkboxes = driver.find_elements(By.XPATH, "//label[contains(text(), 'Easy Apply')]")
@@ -386,7 +368,7 @@ def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5,
                         if checkbox.is_displayed():
                             checkbox.click()
                             print("✓ Selected Easy Apply filter")
-                            time.sleep(1)
+                            wait_for(driver, "filter_option", document_ready, legacy_sleep=1)
                     
                     # Apply Location filter
                     if location:
@@ -396,7 +378,7 @@ def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5,
                                 loc_input.clear()
                                 loc_input.send_keys(location)
                                 print(f"✓ Set location filter: {location}")
-                                time.sleep(1)
+                                wait_for(driver, "filter_option", field_has_value(loc_input, location), legacy_sleep=1)
                     
                     # Apply Experience Level filter
                     if experience_level:
@@ -404,13 +386,13 @@ def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5,
                         for dropdown in exp_dropdowns:
                             if dropdown.is_displayed():
                                 dropdown.click()
-                                time.sleep(1)
+                                wait_for(driver, "filter_option", any_visible(f"//label[contains(text(), '{experience_level}')]"), legacy_sleep=1)
                                 exp_options = driver.find_elements(By.XPATH, f"//label[contains(text(), '{experience_level}')]")
                                 for option in exp_options:
                                     if option.is_displayed():
                                         option.click()
                                         print(f"✓ Set experience level: {experience_level}")
-                                        time.sleep(1)
+                                        wait_for(driver, "filter_option", document_ready, legacy_sleep=1)
                                         break
                     
                     # Apply Job Type filter
@@ -419,13 +401,13 @@ def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5,
                         for dropdown in type_dropdowns:
                             if dropdown.is_displayed():
                                 dropdown.click()
-                                time.sleep(1)
+                                wait_for(driver, "filter_option", any_visible(f"//label[contains(text(), '{job_type}')]"), legacy_sleep=1)
                                 type_options = driver.find_elements(By.XPATH, f"//label[contains(text(), '{job_type}')]")
                                 for option in type_options:
                                     if option.is_displayed():
                                         option.click()
                                         print(f"✓ Set job type: {job_type}")
-                                        time.sleep(1)
+                                        wait_for(driver, "filter_option", document_ready, legacy_sleep=1)
                                         break
                     
                     # Apply Date Posted filter
@@ -434,13 +416,13 @@ def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5,
                         for dropdown in date_dropdowns:
                             if dropdown.is_displayed():
                                 dropdown.click()
-                                time.sleep(1)
+                                wait_for(driver, "filter_option", any_visible(f"//label[contains(text(), '{date_posted}')]"), legacy_sleep=1)
                                 date_options = driver.find_elements(By.XPATH, f"//label[contains(text(), '{date_posted}')]")
                                 for option in date_options:
                                     if option.is_displayed():
                                         option.click()
                                         print(f"✓ Set date posted: {date_posted}")
-                                        time.sleep(1)
+                                        wait_for(driver, "filter_option", document_ready, legacy_sleep=1)
                                         break
                     
                     # Click show results button
@@ -450,20 +432,14 @@ def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5,
                             if button.is_displayed() and button.is_enabled():
                                 button.click()
                                 print("✓ Applied filters")
-                                time.sleep(3)
+                                wait_for(driver, "search_results", search_results_present("linkedin"), legacy_sleep=3)
                                 break
                     break
         except Exception as e:
             print(f"⚠️ Could not apply filters: {str(e)[:100]}")
             
         # Find job listings
-        job_cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'job-card-container') or contains(@class, 'job-search-card')]")
-        if not job_cards:
-            job_cards = driver.find_elements(By.XPATH, "//a[contains(@href, '/jobs/view/')]")
-            
-        if not job_cards:
-            # Try a more generic approach
-            job_cards = driver.find_elements(By.XPATH, "//li[contains(@class, 'job-result-card') or contains(@class, 'jobs-search-result-item')]")
+        job_cards = find_cards(driver, "linkedin")
             
         if len(job_cards) > 0:
             print(f"✓ Found {len(job_cards)} job listings")
@@ -507,15 +483,21 @@ def search_and_apply_for_jobs(driver, search_term, resume_path, max_jobs=5,
                         
                 print(f"\n🔶 Job {i+1}: {job_title} at {company}")
                 
+                # Wait for the platform's pacer instead of a fixed pause between applications
+                pacer = pacer_for(driver, job_link)
+                pacer.acquire()
+                
                 # Apply for the job
-                status = apply_for_job(driver, job_link, resume_path)#cover_letter
+                try:
+                    status = apply_for_job(driver, job_link, resume_path)#cover_letter
+                finally:
+                    record_pacing(driver, pacer)
                 results.append({"title": job_title, "company": company, "link": job_link, "status": status})
                 
                 if "Applied successfully" in status:
                     applied_count += 1
                     
                 print(f"📊 Status: {status}")
-                time.sleep(3)  # Wait between applications
                 
             except Exception as e:
                 print(f"❌ Error processing job {i+1}: {str(e)[:100]}")
@@ -534,14 +516,13 @@ def search_and_apply_for_jobs_indeed(driver, search_term, resume_path, max_jobs=
         # Navigate to Indeed jobs page
         driver.get("https://www.indeed.com/")
         print("✓ Navigated to Indeed.com")
-        time.sleep(3)
+        wait_for(driver, "page_load", any_present(INDEED_WHAT_INPUT_XPATH), legacy_sleep=3)
         
         # Find and fill the search inputs
         search_performed = False
         
         # Find the "what" (job title) input field
-        what_inputs = driver.find_elements(By.XPATH, 
-            "//input[@id='text-input-what' or @name='q' or contains(@placeholder, 'Job title') or contains(@placeholder, 'what')]")
+        what_inputs = driver.find_elements(By.XPATH, INDEED_WHAT_INPUT_XPATH)
         
         # Find the "where" (location) input field  
         where_inputs = driver.find_elements(By.XPATH,
@@ -571,7 +552,7 @@ def search_and_apply_for_jobs_indeed(driver, search_term, resume_path, max_jobs=
                 print("✓ Pressed Enter to search")
                 search_performed = True
                 
-            time.sleep(5)  # Wait for search results
+            wait_for(driver, "search_results", search_results_present("indeed"), legacy_sleep=5)
             
         if not search_performed:
             print("❌ Could not perform search")
@@ -586,14 +567,14 @@ def search_and_apply_for_jobs_indeed(driver, search_term, resume_path, max_jobs=
                 for button in exp_buttons:
                     if button.is_displayed():
                         button.click()
-                        time.sleep(1)
+                        wait_for(driver, "filter_option", any_visible(f"//a[contains(text(), '{experience_level}')]"), legacy_sleep=1)
                         exp_links = driver.find_elements(By.XPATH, 
                             f"//a[contains(text(), '{experience_level}')]")
                         for link in exp_links:
                             if link.is_displayed():
                                 link.click()
                                 print(f"✓ Applied experience filter: {experience_level}")
-                                time.sleep(2)
+                                wait_for(driver, "search_results", page_reloaded(link, search_results_present("indeed")), legacy_sleep=2)
                                 break
                         break
                         
@@ -603,14 +584,14 @@ def search_and_apply_for_jobs_indeed(driver, search_term, resume_path, max_jobs=
                 for button in type_buttons:
                     if button.is_displayed():
                         button.click()
-                        time.sleep(1)
+                        wait_for(driver, "filter_option", any_visible(f"//a[contains(text(), '{job_type}')]"), legacy_sleep=1)
                         type_links = driver.find_elements(By.XPATH,
                             f"//a[contains(text(), '{job_type}')]")
                         for link in type_links:
                             if link.is_displayed():
                                 link.click()
                                 print(f"✓ Applied job type filter: {job_type}")
-                                time.sleep(2)
+                                wait_for(driver, "search_results", page_reloaded(link, search_results_present("indeed")), legacy_sleep=2)
                                 break
                         break
                         
@@ -620,7 +601,7 @@ def search_and_apply_for_jobs_indeed(driver, search_term, resume_path, max_jobs=
                 for button in date_buttons:
                     if button.is_displayed():
                         button.click()
-                        time.sleep(1)
+                        wait_for(driver, "filter_option", any_visible("//a[contains(@href, 'fromage=')]"), legacy_sleep=1)
                         # Map common date filters
                         date_map = {
                             "Past 24 hours": "1",
@@ -636,7 +617,7 @@ def search_and_apply_for_jobs_indeed(driver, search_term, resume_path, max_jobs=
                             if link.is_displayed():
                                 link.click()
                                 print(f"✓ Applied date filter: {date_posted}")
-                                time.sleep(2)
+                                wait_for(driver, "search_results", page_reloaded(link, search_results_present("indeed")), legacy_sleep=2)
                                 break
                         break
                         
@@ -644,18 +625,7 @@ def search_and_apply_for_jobs_indeed(driver, search_term, resume_path, max_jobs=
             print(f"⚠️ Could not apply filters: {str(e)[:100]}")
             
         # Find job listings
-        job_cards = driver.find_elements(By.XPATH,
-            "//div[contains(@class, 'job_seen_beacon')] | //div[contains(@class, 'slider_container')] | //div[contains(@class, 'jobsearch-SerpJobCard')]")
-        
-        if not job_cards:
-            # Try alternative selectors
-            job_cards = driver.find_elements(By.XPATH,
-                "//a[contains(@data-jk, '')] | //h2[contains(@class, 'jobTitle')]/parent::* | //span[@title]//parent::h2//parent::*")
-                
-        if not job_cards:
-            # Generic approach for job cards
-            job_cards = driver.find_elements(By.XPATH,
-                "//div[contains(@class, 'result')] | //article | //li[contains(@class, 'result')]")
+        job_cards = find_cards(driver, "indeed")
                 
         if len(job_cards) > 0:
             print(f"✓ Found {len(job_cards)} job listings")
@@ -705,15 +675,21 @@ def search_and_apply_for_jobs_indeed(driver, search_term, resume_path, max_jobs=
                     
                 print(f"\n🔶 Job {i+1}: {job_title} at {company}")
                 
+                # Wait for the platform's pacer instead of a fixed pause between applications
+                pacer = pacer_for(driver, job_link)
+                pacer.acquire()
+                
                 # Apply for the job using the existing apply_for_job function
-                status = apply_for_job(driver, job_link, resume_path)
+                try:
+                    status = apply_for_job(driver, job_link, resume_path)
+                finally:
+                    record_pacing(driver, pacer)
                 results.append({"title": job_title, "company": company, "link": job_link, "status": status})
                 
                 if "Applied successfully" in status:
                     applied_count += 1
                     
                 print(f"📊 Status: {status}")
-                time.sleep(3)  # Wait between applications
                 
             except Exception as e:
                 print(f"❌ Error processing job {i+1}: {str(e)[:100]}")
@@ -876,6 +852,7 @@ def main():
     
     # Final summary
     print(f"\n🎯 Successfully applied to {successful_applications} out of {len(results)} jobs")
+    print_wait_summary()
     print("\n🏁 Process complete!")
     
     # Save results to file
@@ -0,0 +1,140 @@
+import os
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from job_urls import canonicalize_job_url, DedupIndex
+from page_probes import extract_cards, load_card_selectors
+from selector_registry import get_selector_registry
+from tracing import span, traced
+from waits import wait_for, search_results_present, page_reloaded
+
+NEXT_PAGE_XPATHS = {
+    "linkedin": "//button[@aria-label='View next page'] | "
+                "//li[contains(@class, 'artdeco-pagination__indicator--number') and contains(@class, 'active')]"
+                "/following-sibling::li[1]/button",
+    "indeed": "//a[@data-testid='pagination-page-next'] | //a[@aria-label='Next Page'] | //a[@aria-label='Next']",
+}
+
+# Fallback when there is no Next control: (query parameter, results per page, search-query parameter)
+PAGE_PARAMS = {
+    "linkedin": ("start", 25, "keywords"),
+    "indeed": ("start", 10, "q"),
+}
+
+NO_RESULTS_SCREENSHOTS = {"linkedin": "no_jobs_found.png", "indeed": "no_indeed_jobs_found.png"}
+
+
+def find_cards(driver, platform):
+    """Card elements on the results page, using the card selector (card_selectors.json) that has matched most often"""
+    return get_selector_registry().find_all(driver, platform, "results", "cards",
+                                            load_card_selectors()[platform]["cards"])
+
+
+def _scroll_for_more(driver, platform, last_card, known_count):
+    """Scroll the results list past its last card; True if more cards rendered"""
+    try:
+        driver.execute_script("arguments[0].scrollIntoView({block: 'end'});", last_card)
+    except StaleElementReferenceException:
+        return True  # List re-rendered under us; re-read it
+    return bool(wait_for(driver, "results_scroll",
+                         lambda d: len(find_cards(d, platform)) > known_count, legacy_sleep=0))
+
+
+@traced("next_page")
+def go_to_next_page(driver, platform, page_index):
+    """Advance the results to page page_index + 1 via the Next control or the page URL parameter"""
+    first_cards = find_cards(driver, platform)
+    for button in driver.find_elements(By.XPATH, NEXT_PAGE_XPATHS[platform]):
+        try:
+            if button.is_displayed() and button.is_enabled():
+                button.click()
+                if first_cards:
+                    wait_for(driver, "search_results",
+                             page_reloaded(first_cards[0], search_results_present(platform)), legacy_sleep=3)
+                else:
+                    wait_for(driver, "search_results", search_results_present(platform), legacy_sleep=3)
+                return True
+        except StaleElementReferenceException:
+            continue
+
+    param, page_size, query_param = PAGE_PARAMS[platform]
+    parsed = urlparse(driver.current_url)
+    query = parse_qs(parsed.query)
+    if query_param not in query:
+        return False  # Not a URL-addressable search page
+    query[param] = [str((page_index + 1) * page_size)]
+    driver.get(urlunparse(parsed._replace(query=urlencode(query, doseq=True))))
+    return bool(wait_for(driver, "search_results", search_results_present(platform), legacy_sleep=3))
+
+
+def discover_jobs(driver, platform, skip_job=None, dedup=None, max_pages=None):
+    """Lazily yield jobs (title, company, link, location, easy_apply) from the current results
+    page, then the following pages.
+
+    Cards are read as the results list is scrolled, so the caller can start applying on
+    the first card immediately; stop iterating (e.g. with itertools.islice) and no further
+    pages are fetched. Links are canonicalized, and cards already in the dedup index or
+    matching skip_job(link) are passed over.
+    """
+    if max_pages is None:
+        max_pages = int(os.getenv("DISCOVERY_MAX_PAGES", "40"))
+    if dedup is None:
+        dedup = DedupIndex()  # Still needed to notice when pagination wraps around
+    found = 0
+
+    for page_index in range(max_pages):
+        processed = set()
+        retries = {}
+        page_cards = 0
+        page_unique = 0
+
+        while True:
+            # One execute_script reads every card on the page, rather than several find_elements per card
+            with span("card_extraction", platform=platform, page=page_index + 1) as extraction:
+                cards = extract_cards(driver, platform)
+                extraction.set(cards=len(cards))
+            pending = [card for card in cards if card["element"].id not in processed]
+            if not pending:
+                if cards and _scroll_for_more(driver, platform, cards[-1]["element"], len(cards)):
+                    continue
+                break
+
+            for card in pending:
+                element = card.pop("element")
+                if not card["link"]:
+                    # Lazily rendered cards have no link until scrolled into view; give them one more pass
+                    retries[element.id] = retries.get(element.id, 0) + 1
+                    if retries[element.id] > 1:
+                        print(f"⚠️ Could not get link for a job card on results page {page_index + 1}")
+                        processed.add(element.id)
+                    else:
+                        try:
+                            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+                        except StaleElementReferenceException:
+                            pass
+                    continue
+                processed.add(element.id)
+                page_cards += 1
+
+                # Drop tracking parameters so the same posting always has the same URL
+                job = dict(card, link=canonicalize_job_url(card["link"]))
+                if not dedup.add(job["link"]):
+                    continue
+                page_unique += 1
+                if skip_job and skip_job(job["link"]):
+                    print(f"⏭️ Skipping already-processed job: {job['title']}")
+                    continue
+                found += 1
+                yield job
+
+        if page_index == 0 and page_cards == 0:
+            print("❌ No job listings found")
+            driver.save_screenshot(NO_RESULTS_SCREENSHOTS[platform])
+            return
+        print(f"✓ Read {page_cards} job listings from results page {page_index + 1}")
+
+        # A page with nothing new means pagination has wrapped around or run out
+        if page_unique == 0 or not go_to_next_page(driver, platform, page_index):
+            return
@@ -0,0 +1,380 @@
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATES = ("completed", "failed")
+
+
+class QueueFullError(Exception):
+    """Raised when the application queue has no room for another job"""
+
+
+class QuotaExceededError(Exception):
+    """Raised when an account has used up its daily application quota"""
+
+
+class RunActiveError(Exception):
+    """Raised when a job is submitted for a run that is already queued or running"""
+
+
+class ApplicationJob:
+    """State of one queued /apply request, updated by the worker as jobs are processed"""
+
+    def __init__(self, params, tenant="default"):
+        self.id = uuid.uuid4().hex
+        self.params = params
+        self.tenant = tenant
+        self.quota_reserved = 0
+        self._runner = None
+        self._on_finish = None
+        self.status = "queued"
+        self.error = None
+        self.results = []
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._events = []
+        self._cond = threading.Condition()
+
+    # ----- updates from the worker -----
+
+    def _emit(self, event, data):
+        with self._cond:
+            self._events.append((event, data))
+            self._cond.notify_all()
+
+    def mark_running(self):
+        self.status = "running"
+        self.started_at = time.time()
+        self._emit("status", self.summary())
+
+    def add_result(self, result):
+        """Progress callback passed down to search_and_apply_for_jobs"""
+        with self._cond:
+            self.results.append(result)
+        self._emit("progress", {"index": len(self.results) - 1, "job": result, **self.counts()})
+
+    def mark_finished(self, results=None, error=None):
+        with self._cond:
+            if results is not None:
+                # The final list is authoritative (covers jobs reported without a callback)
+                self.results = list(results)
+            self.error = error
+            self.status = "failed" if error else "completed"
+            self.finished_at = time.time()
+        self._emit("done", self.to_dict())
+
+    # ----- views -----
+
+    def counts(self):
+        applied = sum(1 for r in self.results if "Applied successfully" in r.get("status", ""))
+        return {
+            "applied_count": applied,
+            "total_processed": len(self.results),
+            "max_jobs": self.params.get("max_jobs"),
+        }
+
+    def summary(self):
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "tenant": self.tenant,
+            "search_term": self.params.get("search_term"),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "queue_wait_s": round(self.started_at - self.created_at, 3) if self.started_at else None,
+            "finished_at": self.finished_at,
+            **self.counts(),
+        }
+
+    def to_dict(self):
+        data = self.summary()
+        data["success"] = self.status == "completed"
+        data["jobs"] = list(self.results)
+        if self.error:
+            data["error"] = self.error
+        return data
+
+    def is_finished(self):
+        return self.status in TERMINAL_STATES
+
+    def events(self, keepalive=15):
+        """Yield (event, data) pairs from the start of the job, blocking for new ones.
+
+        Yields (None, None) every `keepalive` seconds of silence so the caller can
+        send a comment line and detect dropped clients.
+        """
+        index = 0
+        while True:
+            with self._cond:
+                if index >= len(self._events):
+                    if self.is_finished():
+                        return
+                    self._cond.wait(keepalive)
+                pending = self._events[index:]
+                index += len(pending)
+            if not pending:
+                yield None, None
+            for item in pending:
+                yield item
+                if item[0] == "done":
+                    return
+
+
+class _Tenant:
+    """Scheduling state of one account: its waiting jobs, running count and quota usage"""
+
+    def __init__(self, name, max_concurrent, daily_quota, max_pending):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.daily_quota = daily_quota
+        self.max_pending = max_pending
+        self.pending = deque()
+        self.running = 0
+        self.last_served = 0.0
+        self.day = time.strftime("%Y-%m-%d")
+        self.applied_today = 0
+        self.reserved = 0
+        self.submitted = 0
+        self.waits = deque(maxlen=200)
+
+    def _roll_day(self):
+        today = time.strftime("%Y-%m-%d")
+        if today != self.day:
+            self.day = today
+            self.applied_today = 0
+
+    def remaining_quota(self):
+        """Applications still allowed today (None = unlimited); jobs in flight hold a reservation"""
+        self._roll_day()
+        if not self.daily_quota:
+            return None
+        return max(0, self.daily_quota - self.applied_today - self.reserved)
+
+    def can_start(self):
+        remaining = self.remaining_quota()
+        return bool(self.pending) and self.running < self.max_concurrent and remaining != 0
+
+    def waiting_for_quota(self):
+        """Jobs waiting that only the daily quota holds back (nothing else will wake the queue for them)"""
+        return bool(self.pending) and self.running < self.max_concurrent and self.remaining_quota() == 0
+
+    def stats(self):
+        now = time.time()
+        waits = sorted(self.waits)
+        return {
+            "queued": len(self.pending),
+            "running": self.running,
+            "max_concurrent": self.max_concurrent,
+            "daily_quota": self.daily_quota or None,
+            "applied_today": self.applied_today,
+            "remaining_quota": self.remaining_quota(),
+            "submitted": self.submitted,
+            "oldest_queued_s": round(now - self.pending[0].created_at, 3) if self.pending else 0.0,
+            "avg_wait_s": round(sum(waits) / len(waits), 3) if waits else 0.0,
+            "p95_wait_s": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 3) if waits else 0.0,
+            "max_wait_s": round(waits[-1], 3) if waits else 0.0,
+        }
+
+
+class JobQueue:
+    """Runs application jobs on a bounded worker pool so the API can return immediately.
+
+    Jobs are queued per tenant (account). A free worker takes the next job from the tenant
+    served longest ago among those below their concurrency limit and daily quota, so a
+    tenant with a long backlog cannot starve the others of the shared browsers.
+    """
+
+    def __init__(self, max_workers=2, max_pending=20, retention_seconds=3600,
+                 tenant_max_concurrent=1, tenant_daily_quota=0, tenant_max_pending=5, tenant_limits=None):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retention_seconds = retention_seconds
+        self.tenant_max_concurrent = tenant_max_concurrent
+        self.tenant_daily_quota = tenant_daily_quota
+        self.tenant_max_pending = tenant_max_pending
+        self.tenant_limits = tenant_limits or {}
+        self._jobs = {}
+        self._tenants = {}
+        self._active_runs = {}  # run_id -> id of the job queued or running it
+        self._lock = threading.Condition()
+        self._waits = deque(maxlen=1000)
+        for index in range(max_workers):
+            threading.Thread(target=self._worker, name=f"apply-worker-{index}", daemon=True).start()
+
+    def _tenant(self, name):
+        tenant = self._tenants.get(name)
+        if tenant is None:
+            limits = self.tenant_limits.get(name, {})
+            tenant = self._tenants[name] = _Tenant(
+                name,
+                max_concurrent=max(1, limits.get("max_concurrent", self.tenant_max_concurrent)),
+                daily_quota=limits.get("daily_quota", self.tenant_daily_quota),
+                max_pending=limits.get("max_pending", self.tenant_max_pending),
+            )
+        return tenant
+
+    def submit(self, params, runner, on_finish=None, tenant="default"):
+        """Queue runner(params, progress_callback) for tenant and return the ApplicationJob tracking it"""
+        self._prune()
+        with self._lock:
+            pending = sum(len(t.pending) for t in self._tenants.values())
+            if pending >= self.max_pending:
+                raise QueueFullError(f"{pending} applications already waiting")
+            state = self._tenant(tenant)
+            if state.max_pending and len(state.pending) >= state.max_pending:
+                raise QueueFullError(f"{len(state.pending)} applications already waiting for {tenant}")
+            if state.remaining_quota() == 0:
+                raise QuotaExceededError(f"{tenant} has used its daily quota of {state.daily_quota} applications")
+            run_id = params.get("run_id")
+            if run_id and run_id in self._active_runs:
+                # Two jobs on one checkpoint would apply to its pending jobs twice
+                raise RunActiveError(f"run {run_id} is already in progress as job {self._active_runs[run_id]}")
+            job = ApplicationJob(params, tenant)
+            job._runner, job._on_finish = runner, on_finish
+            self._jobs[job.id] = job
+            if run_id:
+                self._active_runs[run_id] = job.id
+            state.pending.append(job)
+            state.submitted += 1
+            self._lock.notify()
+        logger.info(f"Queued application job {job.id} for '{params.get('search_term')}' (tenant {tenant})")
+        return job
+
+    def _next_job(self):
+        """Block until some tenant may start a job; take it from the least recently served one"""
+        with self._lock:
+            while True:
+                ready = [t for t in self._tenants.values() if t.can_start()]
+                if ready:
+                    break
+                # Quotas reset at midnight without any submit or finished job to notify us
+                quota_blocked = any(t.waiting_for_quota() for t in self._tenants.values())
+                self._lock.wait(timeout=_seconds_until_midnight() + 1 if quota_blocked else None)
+            tenant = min(ready, key=lambda t: (t.last_served, t.pending[0].created_at))
+            job = tenant.pending.popleft()
+            tenant.running += 1
+            tenant.last_served = time.monotonic()
+            remaining = tenant.remaining_quota()
+            if remaining is not None:
+                # Never let one run apply past the quota; the unused part is returned when it ends
+                job.params["max_jobs"] = min(job.params.get("max_jobs") or remaining, remaining)
+                job.quota_reserved = job.params["max_jobs"]
+                tenant.reserved += job.quota_reserved
+            job.mark_running()
+            wait = job.started_at - job.created_at
+            tenant.waits.append(wait)
+            self._waits.append(wait)
+            return job
+
+    def _finished(self, job):
+        with self._lock:
+            tenant = self._tenants[job.tenant]
+            tenant.running -= 1
+            tenant.reserved -= job.quota_reserved
+            tenant._roll_day()
+            tenant.applied_today += job.counts()["applied_count"]
+            self._active_runs.pop(job.params.get("run_id"), None)
+            self._lock.notify_all()
+
+    def _worker(self):
+        while True:
+            job = self._next_job()
+            try:
+                self._run(job, job._runner, job._on_finish)
+            finally:
+                self._finished(job)
+
+    def _run(self, job, runner, on_finish):
+        try:
+            results = runner(job.params, job.add_result)
+            job.mark_finished(results=results)
+            logger.info(f"Job {job.id} completed: {job.counts()}")
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            job.mark_finished(error=f"Application failed: {str(e)}")
+        finally:
+            if on_finish:
+                try:
+                    on_finish(job)
+                except Exception as e:
+                    logger.error(f"Cleanup for job {job.id} failed: {e}")
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def active_runs(self):
+        """run_ids of the jobs queued or running now"""
+        with self._lock:
+            return set(self._active_runs)
+
+    def _prune(self):
+        cutoff = time.time() - self.retention_seconds
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job.is_finished() and job.finished_at < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    def stats(self):
+        with self._lock:
+            states = [job.status for job in self._jobs.values()]
+            waits = list(self._waits)
+            tenants = len(self._tenants)
+        return {
+            "workers": self.max_workers,
+            "tenants": tenants,
+            "queued": states.count("queued"),
+            "running": states.count("running"),
+            "completed": states.count("completed"),
+            "failed": states.count("failed"),
+            "avg_wait_s": round(sum(waits) / len(waits), 3) if waits else 0.0,
+            "max_wait_s": round(max(waits), 3) if waits else 0.0,
+        }
+
+    def tenant_stats(self):
+        """Queue depth, wait times and quota usage per tenant"""
+        with self._lock:
+            return {name: tenant.stats() for name, tenant in self._tenants.items()}
+
+
+def _seconds_until_midnight():
+    now = time.localtime()
+    return 86400 - (now.tm_hour * 3600 + now.tm_min * 60 + now.tm_sec)
+
+
+def sse_format(event, data):
+    """Encode one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def load_tenant_limits(path):
+    """Per-tenant overrides ({"account": {"max_concurrent": 2, "daily_quota": 100}}) from a JSON file"""
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not load tenant limits from {path}: {e}")
+        return {}
+
+
+def create_job_queue():
+    """Build the API's job queue from the environment (see config.env)"""
+    return JobQueue(
+        max_workers=int(os.getenv("APPLY_WORKERS", os.getenv("DRIVER_POOL_MAX", "2"))),
+        max_pending=int(os.getenv("APPLY_QUEUE_LIMIT", "20")),
+        retention_seconds=int(os.getenv("APPLY_JOB_RETENTION_SECONDS", "3600")),
+        tenant_max_concurrent=int(os.getenv("TENANT_MAX_CONCURRENT", "1")),
+        tenant_daily_quota=int(os.getenv("TENANT_DAILY_QUOTA", "0")),
+        tenant_max_pending=int(os.getenv("TENANT_MAX_PENDING", "5")),
+        tenant_limits=load_tenant_limits(os.getenv("TENANT_LIMITS_PATH")),
+    )
@@ -0,0 +1,98 @@
+import re
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+_LINKEDIN_VIEW_RE = re.compile(r"/jobs/view/(?:[^/]*?-)?(\d+)")
+
+
+def extract_job_id(url):
+    """Return (platform, job_id) for LinkedIn /jobs/view/<id>/ and Indeed jk= links, else None"""
+    if not url:
+        return None
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    query = parse_qs(parsed.query)
+
+    if "linkedin." in host:
+        match = _LINKEDIN_VIEW_RE.search(parsed.path)
+        if match:
+            return "linkedin", match.group(1)
+        # Search result pages carry the selected job in currentJobId
+        if query.get("currentJobId"):
+            return "linkedin", query["currentJobId"][0]
+        return None
+
+    if "indeed." in host:
+        for param in ("jk", "vjk"):
+            if query.get(param):
+                return "indeed", query[param][0].lower()
+        return None
+
+    return None
+
+
+def job_key(url):
+    """Stable key for a posting: 'platform:id' when the ID is known, else the URL without its query"""
+    extracted = extract_job_id(url)
+    if extracted:
+        return f"{extracted[0]}:{extracted[1]}"
+    parsed = urlparse(url or "")
+    return f"url:{parsed.netloc.lower()}{parsed.path.rstrip('/')}"
+
+
+# Query parameters that only carry tracking/session state and never change the posting
+TRACKING_PARAMS = {
+    "ebp", "refid", "trackingid", "trk", "trkinfo", "lipi", "lici", "originalsubdomain",
+    "from", "tk", "advn", "adid", "ad", "sjdu", "acatk", "pub", "camk", "xkcb", "xpse", "xfps",
+    "fccid", "vjs", "bb", "cmp", "sponsored", "ref", "src", "position", "pagenum",
+}
+
+
+def canonicalize_job_url(url):
+    """Strip tracking noise from a job link.
+
+    LinkedIn and Indeed postings collapse to one URL per job ID; other links keep
+    their non-tracking query parameters (sorted) and lose the fragment.
+    """
+    if not url:
+        return url
+    parsed = urlparse(url)
+    extracted = extract_job_id(url)
+    if extracted:
+        platform, job_id = extracted
+        if platform == "linkedin":
+            return f"https://www.linkedin.com/jobs/view/{job_id}/"
+        host = parsed.netloc.lower() or "www.indeed.com"
+        return f"https://{host}/viewjob?jk={job_id}"
+
+    query = parse_qs(parsed.query, keep_blank_values=True)
+    kept = sorted((key, value) for key, values in query.items()
+                  if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+                  for value in values)
+    clean_query = urlencode(kept)
+    return urlunparse((parsed.scheme or "https", parsed.netloc.lower(), parsed.path, "", clean_query, ""))
+
+
+class DedupIndex:
+    """Tracks which postings a run has already queued, by canonical job key"""
+
+    def __init__(self):
+        self._seen = set()
+        self.duplicates = 0
+
+    def add(self, url):
+        """Register url; returns False (and counts a duplicate) if its posting was already seen"""
+        key = job_key(url)
+        if key in self._seen:
+            self.duplicates += 1
+            return False
+        self._seen.add(key)
+        return True
+
+    def __contains__(self, url):
+        return job_key(url) in self._seen
+
+    def __len__(self):
+        return len(self._seen)
+
+    def stats(self):
+        return {"unique": len(self._seen), "duplicates_avoided": self.duplicates}
@@ -0,0 +1,128 @@
+import os
+import time
+import threading
+
+
+class Pacer:
+    """Token bucket that spaces out applications for one platform account and adapts its rate.
+
+    Tokens refill at `rate` applications per hour, up to `burst`. Every normal page lets the
+    rate creep back up towards max_rate; a captcha/throttle signal halves it and imposes a
+    cool-down that doubles with each consecutive signal (capped at max_backoff seconds).
+    Shared by every worker applying with the same account, so parallel browsers pace together.
+    """
+
+    def __init__(self, platform, account=None, rate=240, min_rate=20, max_rate=600, burst=2,
+                 speedup=1.1, backoff=30, max_backoff=900):
+        self.platform = platform
+        self.account = account
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.speedup = speedup
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._strikes = 0
+
+        self._started_at = None
+        self._applications = 0
+        self._throttle_events = 0
+        self._waited = 0.0
+        self._last_signal = None
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate / 3600)
+        self._refilled_at = now
+
+    def acquire(self):
+        """Block until the next application may start; returns the seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if self._started_at is None:
+                    self._started_at = now
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    self._waited += waited
+                    return waited
+                delay = max(self._blocked_until - now, (1 - self._tokens) * 3600 / self.rate)
+            time.sleep(delay)
+            waited += delay
+
+    def record(self, signal=None):
+        """Feed back one finished application: signal is detect_throttle()'s result (None = page was fine)"""
+        with self._lock:
+            self._applications += 1
+            if signal is None:
+                self._strikes = 0
+                self.rate = min(self.max_rate, self.rate * self.speedup)
+                return 0.0
+            self._throttle_events += 1
+            self._strikes += 1
+            self._last_signal = signal
+            self.rate = max(self.min_rate, self.rate / 2)
+            cooldown = min(self.max_backoff, self.backoff * 2 ** (self._strikes - 1))
+            self._blocked_until = max(self._blocked_until, time.monotonic() + cooldown)
+            self._tokens = 0.0
+            return cooldown
+
+    def stats(self):
+        with self._lock:
+            elapsed = time.monotonic() - self._started_at if self._started_at is not None else 0.0
+            return {
+                "platform": self.platform,
+                "account": self.account or "default",
+                "applications": self._applications,
+                "applications_per_hour": round(self._applications * 3600 / elapsed, 1) if elapsed else 0.0,
+                "current_rate_per_hour": round(self.rate, 1),
+                "throttle_events": self._throttle_events,
+                "last_signal": self._last_signal,
+                "waited_s": round(self._waited, 1),
+                "cooling_down_s": round(max(0.0, self._blocked_until - time.monotonic()), 1),
+            }
+
+
+_pacers = {}
+_pacers_lock = threading.Lock()
+
+
+def get_pacer(platform, account=None):
+    """The shared pacer for a platform account, configured from the environment (see config.env)"""
+    key = (platform or "other", account)
+    with _pacers_lock:
+        if key not in _pacers:
+            _pacers[key] = Pacer(
+                key[0], account,
+                rate=float(os.getenv("PACING_START_RATE_PER_HOUR", "240")),
+                min_rate=float(os.getenv("PACING_MIN_RATE_PER_HOUR", "20")),
+                max_rate=float(os.getenv("PACING_MAX_RATE_PER_HOUR", "600")),
+                burst=int(os.getenv("PACING_BURST", "2")),
+                backoff=float(os.getenv("PACING_BACKOFF_SECONDS", "30")),
+                max_backoff=float(os.getenv("PACING_MAX_BACKOFF_SECONDS", "900")),
+            )
+        return _pacers[key]
+
+
+def get_pacing_stats():
+    with _pacers_lock:
+        pacers = list(_pacers.values())
+    return [pacer.stats() for pacer in pacers]
+
+
+def print_pacing_summary():
+    stats = [entry for entry in get_pacing_stats() if entry["applications"]]
+    if not stats:
+        return
+    print("\n=== Pacing Summary ===")
+    for entry in stats:
+        print(f"{entry['platform']:>10}/{entry['account']:<12} {entry['applications']:>4} applications  "
+              f"{entry['applications_per_hour']:>7.1f}/h achieved  rate now {entry['current_rate_per_hour']:.0f}/h  "
+              f"throttled {entry['throttle_events']}x  waited {entry['waited_s']:.0f}s")
@@ -0,0 +1,350 @@
+import os
+import json
+from urllib.parse import urljoin
+
+from selector_registry import get_selector_registry
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+_table_cache = {}
+
+
+def _load_table(path):
+    if path not in _table_cache:
+        with open(path, encoding="utf-8") as file:
+            _table_cache[path] = json.load(file)
+    return _table_cache[path]
+
+
+def load_success_indicators(path=None):
+    """Load (and cache) the success/failure indicator table from data/success_indicators.json"""
+    return _load_table(path or os.path.join(DATA_DIR, "success_indicators.json"))
+
+
+def load_card_selectors(path=None):
+    """Load (and cache) the per-platform job card selector table from data/card_selectors.json"""
+    return _load_table(path or os.path.join(DATA_DIR, "card_selectors.json"))
+
+
+# Evaluates every indicator XPath in the page and reports matches with their visibility.
+# arguments[0] is the indicator table from success_indicators.json.
+_APPLICATION_RESULT_JS = """
+const table = arguments[0];
+const isVisible = el => {
+    if (!el.getClientRects().length) return false;
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+};
+const evaluate = indicator => {
+    let snapshot;
+    try {
+        snapshot = document.evaluate(indicator.xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    } catch (e) {
+        return null;
+    }
+    let visible = 0;
+    for (let i = 0; i < snapshot.snapshotLength; i++) {
+        if (isVisible(snapshot.snapshotItem(i))) visible++;
+    }
+    return {id: indicator.id, count: snapshot.snapshotLength, visible: visible, confidence: indicator.confidence};
+};
+const collect = list => (list || []).map(evaluate).filter(m => m && m.count > 0);
+
+const successes = collect(table.indicators);
+const failures = collect(table.failure_indicators);
+
+// The apply button itself flips to "Applied" on LinkedIn
+const button = table.apply_button;
+if (button) {
+    const snapshot = document.evaluate(button.xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < snapshot.snapshotLength; i++) {
+        const el = snapshot.snapshotItem(i);
+        const text = ((el.innerText || '') + ' ' + (el.getAttribute('aria-label') || '')).toLowerCase();
+        if (text.indexOf('applied') !== -1) {
+            successes.push({id: button.id, count: 1, visible: isVisible(el) ? 1 : 0, confidence: button.confidence});
+            break;
+        }
+    }
+}
+return {successes: successes, failures: failures};
+"""
+
+
+def _best(matches, visible_only=True):
+    candidates = [m for m in matches if m["visible"] > 0 or not visible_only]
+    return max(candidates, key=lambda m: m["confidence"]) if candidates else None
+
+
+def detect_application_result(driver, indicators=None):
+    """Evaluate every success/failure indicator in a single execute_script call.
+
+    Returns a verdict dict: status ('success', 'failure' or 'unknown'), the indicator
+    that decided it, whether it was visible, its confidence, and all raw matches.
+    """
+    table = indicators or load_success_indicators()
+    probe = driver.execute_script(_APPLICATION_RESULT_JS, table) or {}
+    successes = probe.get("successes", [])
+    failures = probe.get("failures", [])
+
+    best_success = _best(successes)
+    best_failure = _best(failures)
+    if best_success:
+        status, decided_by = "success", best_success
+    elif best_failure:
+        status, decided_by = "failure", best_failure
+    else:
+        # Nothing visible - report the strongest hidden match, if any, for debugging
+        status, decided_by = "unknown", _best(successes + failures, visible_only=False)
+
+    return {
+        "status": status,
+        "success": status == "success",
+        "indicator": decided_by["id"] if decided_by else None,
+        "visible": bool(decided_by and decided_by["visible"]),
+        "confidence": decided_by["confidence"] if decided_by and status != "unknown" else 0.0,
+        "matches": successes + failures,
+    }
+
+
+# Serializes every form control with its label, visibility and enablement.
+# Returns {fields: [...], elements: [...]} - elements[i] is the WebElement for fields[i].
+_FORM_SNAPSHOT_JS = """
+const root = arguments[0] || document;
+const isVisible = el => {
+    if (!el.getClientRects().length) return false;
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+};
+const labelFor = el => {
+    const parts = [];
+    if (el.id) {
+        const label = root.querySelector("label[for='" + CSS.escape(el.id) + "']");
+        if (label) parts.push(label.innerText);
+    }
+    const wrapping = el.closest('label');
+    if (wrapping) parts.push(wrapping.innerText);
+    if (el.getAttribute('aria-label')) parts.push(el.getAttribute('aria-label'));
+    const labelledBy = el.getAttribute('aria-labelledby');
+    if (labelledBy) {
+        labelledBy.split(/\\s+/).forEach(id => {
+            const node = document.getElementById(id);
+            if (node) parts.push(node.innerText);
+        });
+    }
+    return parts.join(' ').trim();
+};
+const elements = Array.from(root.querySelectorAll('input, select, textarea'));
+const fields = elements.map((el, index) => ({
+    index: index,
+    tag: el.tagName.toLowerCase(),
+    type: (el.getAttribute('type') || '').toLowerCase(),
+    id: el.id || '',
+    name: el.getAttribute('name') || '',
+    placeholder: el.getAttribute('placeholder') || '',
+    label: labelFor(el),
+    value: el.type === 'file' ? '' : (el.value || ''),
+    checked: !!el.checked,
+    visible: isVisible(el),
+    enabled: !el.disabled && !el.readOnly,
+    options: el.tagName === 'SELECT' ? Array.from(el.options).map(o => o.text.trim()) : []
+}));
+return {fields: fields, elements: elements};
+"""
+
+# Fills a batch of fields in one call. arguments[0] is [[element, action, value], ...]
+# where action is 'text', 'select' or 'check'. Uses the native value setter and fires
+# input/change events so React-managed inputs (LinkedIn Easy Apply) register the value.
+_FILL_FIELDS_JS = """
+const setNativeValue = (el, value) => {
+    const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    const setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+    setter.call(el, value);
+};
+const fire = (el, type) => el.dispatchEvent(new Event(type, {bubbles: true}));
+return arguments[0].map(([el, action, value]) => {
+    try {
+        if (action === 'check') {
+            if (!el.checked) el.click();
+            return el.checked;
+        }
+        if (action === 'select') {
+            const option = Array.from(el.options).find(o => o.text.trim().toLowerCase() === value.toLowerCase())
+                || Array.from(el.options).find(o => o.text.toLowerCase().indexOf(value.toLowerCase()) !== -1);
+            if (!option) return false;
+            el.value = option.value;
+            fire(el, 'change');
+            return true;
+        }
+        el.focus();
+        setNativeValue(el, value);
+        fire(el, 'input');
+        fire(el, 'change');
+        el.blur();
+        return el.value === value;
+    } catch (e) {
+        return false;
+    }
+});
+"""
+
+
+def snapshot_form(driver, root=None):
+    """Serialize all inputs, selects and textareas (with labels and state) in one round-trip.
+
+    Returns a list of field dicts; each carries its WebElement under "element".
+    """
+    snapshot = driver.execute_script(_FORM_SNAPSHOT_JS, root) or {"fields": [], "elements": []}
+    fields = snapshot["fields"]
+    for field, element in zip(fields, snapshot["elements"]):
+        field["element"] = element
+    return fields
+
+
+def match_form_fields(fields, field_mapping):
+    """Pair snapshot fields with field_mapping values, purely in Python.
+
+    A field matches the first mapping key found in its id, name, placeholder or label.
+    Returns (field, action, value) tuples; visible unchecked checkboxes are ticked.
+    """
+    planned = []
+    for field in fields:
+        if not field["visible"] or not field["enabled"]:
+            continue
+        if field["type"] in ("file", "hidden", "submit", "button", "radio"):
+            continue
+        if field["type"] == "checkbox":
+            # Usually terms agreement
+            if not field["checked"]:
+                planned.append((field, "check", True))
+            continue
+
+        haystack = " ".join((field["id"], field["name"], field["placeholder"], field["label"])).lower()
+        for key, value in field_mapping.items():
+            if key in haystack:
+                action = "select" if field["tag"] == "select" else "text"
+                planned.append((field, action, value))
+                break  # First match only, to avoid duplicate fills
+    return planned
+
+
+def fill_planned_fields(driver, planned):
+    """Apply every planned fill in one execute_script call; returns per-field success flags"""
+    if not planned:
+        return []
+    batch = [[field["element"], action, value] for field, action, value in planned]
+    return driver.execute_script(_FILL_FIELDS_JS, batch) or []
+
+
+# Reads every job card on a results page in one call. arguments[0] is one platform's
+# entry from card_selectors.json: the first card XPath that matches wins, then each field
+# takes the first non-empty value among its candidates (attr 'text' means innerText, 'href' the
+# resolved link). Returns {cards: [...], elements: [...], matched: card XPath, url: page URL} -
+# elements[i] is the WebElement for cards[i].
+_CARD_EXTRACT_JS = """
+const table = arguments[0];
+const snapshot = (xpath, context) => {
+    try {
+        return document.evaluate(xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    } catch (e) {
+        return null;
+    }
+};
+const read = (node, attr) => {
+    if (attr === 'text') return (node.innerText || node.textContent || '').trim();
+    // The browser resolves href against the page's own URL (and any <base>), wherever it is served from
+    if (attr === 'href' && typeof node.href === 'string' && node.getAttribute('href')) return node.href;
+    return (node.getAttribute(attr) || '').trim();
+};
+const field = (card, candidates) => {
+    for (const candidate of candidates || []) {
+        const nodes = snapshot(candidate.xpath, card);
+        if (!nodes) continue;
+        for (let i = 0; i < nodes.snapshotLength; i++) {
+            const value = read(nodes.snapshotItem(i), candidate.attr || 'text');
+            if (candidate.contains) {
+                if (value.toLowerCase().indexOf(candidate.contains) !== -1) return value;
+                continue;
+            }
+            // Like find_element, only the first match of a candidate is considered
+            if (value) return value;
+            break;
+        }
+    }
+    return '';
+};
+
+let elements = [];
+let matched = null;
+for (const xpath of table.cards) {
+    const nodes = snapshot(xpath, document);
+    if (nodes && nodes.snapshotLength) {
+        for (let i = 0; i < nodes.snapshotLength; i++) elements.push(nodes.snapshotItem(i));
+        matched = xpath;
+        break;
+    }
+}
+const cards = elements.map(card => ({
+    title: field(card, table.fields.title),
+    company: field(card, table.fields.company),
+    link: field(card, table.fields.link),
+    location: field(card, table.fields.location),
+    snippet: field(card, table.fields.snippet),
+    easy_apply: field(card, table.fields.easy_apply) !== ''
+}));
+return {cards: cards, elements: elements, matched: matched, url: location.href};
+"""
+
+
+def extract_cards(driver, platform, selectors=None):
+    """Title, company, link, location, snippet and Easy Apply flag for every result card, in one round-trip.
+
+    Returns a list of card dicts in page order; each carries its WebElement under "element".
+    Links are absolute, resolved against the results page's own URL (so LINKEDIN_BASE_URL /
+    INDEED_BASE_URL mirrors keep their host); link is None when the card has not rendered one yet.
+    """
+    registry = get_selector_registry()
+    table = dict((selectors or load_card_selectors())[platform])
+    # Card XPaths in the order that has matched most often (selector_registry.py)
+    table["cards"] = registry.ordered(platform, "results", "cards", table["cards"])
+    snapshot = driver.execute_script(_CARD_EXTRACT_JS, table) or {"cards": [], "elements": []}
+    if snapshot.get("matched"):
+        registry.record_match(platform, "results", "cards", table["cards"], snapshot["matched"])
+    cards = snapshot["cards"]
+    for card, element in zip(cards, snapshot["elements"]):
+        card["title"] = card["title"] or "Unknown Title"
+        card["company"] = card["company"] or "Unknown Company"
+        card["link"] = urljoin(snapshot.get("url") or "", card["link"]) if card["link"] else None
+        card["element"] = element
+    return cards
+
+
+# Looks for the signs of a platform pushing back: a challenge/captcha page or widget, an
+# HTTP 429 page, or rate-limit wording on a short page. Returns the first signal found, or null.
+_THROTTLE_JS = """
+const url = location.href.toLowerCase();
+for (const marker of ['/checkpoint/challenge', '/authwall', 'captcha', '/sorry/']) {
+    if (url.includes(marker)) return {signal: 'challenge', detail: marker};
+}
+const frames = document.querySelectorAll(
+    "iframe[src*='recaptcha'], iframe[src*='hcaptcha'], iframe[src*='arkoselabs'], iframe[src*='funcaptcha'], " +
+    "iframe[src*='challenges.cloudflare.com'], #captcha-internal, .g-recaptcha, .h-captcha");
+if (frames.length) return {signal: 'captcha', detail: frames[0].tagName.toLowerCase()};
+const title = document.title.toLowerCase();
+if (/\\b429\\b|too many requests/.test(title)) return {signal: 'throttled', detail: document.title};
+// Block pages are short; scanning only those keeps job descriptions from tripping the phrases
+const text = (document.body ? document.body.innerText : '').toLowerCase();
+if (text.length > 3000) return null;
+for (const phrase of ['unusual activity', 'too many requests', "you've reached the", 'slow down',
+                      'temporarily restricted', 'verify you are human', 'are you a robot']) {
+    if (text.includes(phrase)) return {signal: 'throttled', detail: phrase};
+}
+return null;
+"""
+
+
+def detect_throttle(driver):
+    """Captcha/throttle signal on the current page in one execute_script call: {signal, detail} or None"""
+    try:
+        return driver.execute_script(_THROTTLE_JS)
+    except Exception:
+        return None
@@ -0,0 +1,167 @@
+import os
+import time
+import queue
+import threading
+from urllib.parse import urlparse
+
+from danish_job_bot import setup_driver, apply_for_job, pacer_for, record_pacing
+from driver_metrics import begin_job, end_job
+from session_store import restore_session, clear_session
+from run_checkpoint import tracking
+
+
+def copy_cookies(cookies, driver):
+    """Load cookies captured from another session into driver, one visit per cookie domain"""
+    by_domain = {}
+    for cookie in cookies:
+        by_domain.setdefault(cookie.get("domain", "").lstrip("."), []).append(cookie)
+
+    for domain, domain_cookies in by_domain.items():
+        if not domain:
+            continue
+        try:
+            # add_cookie only accepts cookies for the page currently loaded
+            driver.get(f"https://{domain}/robots.txt")
+            for cookie in domain_cookies:
+                if cookie.get("sameSite") not in (None, "Strict", "Lax", "None"):
+                    cookie = {k: v for k, v in cookie.items() if k != "sameSite"}
+                try:
+                    driver.add_cookie(cookie)
+                except Exception:
+                    continue
+        except Exception as e:
+            print(f"⚠️ Could not share cookies for {domain}: {str(e)[:100]}")
+
+
+class DomainLimiter:
+    """Caps how many workers may be applying on the same host at once"""
+
+    def __init__(self, per_domain_limit):
+        self.per_domain_limit = per_domain_limit
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def slot(self, url):
+        """Semaphore to hold while applying to url"""
+        domain = urlparse(url).netloc.lower()
+        with self._lock:
+            if domain not in self._semaphores:
+                self._semaphores[domain] = threading.BoundedSemaphore(self.per_domain_limit)
+            return self._semaphores[domain]
+
+
+def apply_in_parallel(jobs, resume_path, workers=3, primary_driver=None, pool=None,
+                      per_domain_limit=None, on_result=None, checkout_timeout=30, checkpoint=None):
+    """Apply to already-collected jobs on several browsers at once.
+
+    Worker 0 reuses primary_driver (the one that ran the search) when given; the other
+    workers borrow drivers from pool, or launch their own with setup_driver, and are
+    seeded with primary_driver's cookies so they share its login. Results come back in
+    the same order as jobs, whatever order the workers finish in. With a checkpoint,
+    each worker journals the steps its applications reach.
+    """
+    if per_domain_limit is None:
+        per_domain_limit = int(os.getenv("APPLY_PER_DOMAIN_LIMIT", "2"))
+    workers = max(1, min(workers, len(jobs)))
+    limiter = DomainLimiter(per_domain_limit)
+    cookies = []
+    # The primary's login, if it came from the session store, is restored straight from there
+    shared_session = getattr(primary_driver, "_session_key", None) if primary_driver is not None else None
+    if primary_driver is not None and shared_session is None:
+        try:
+            cookies = primary_driver.get_cookies()
+        except Exception:
+            cookies = []
+
+    work = queue.Queue()
+    for index, job in enumerate(jobs):
+        work.put((index, job))
+
+    results = [None] * len(jobs)
+    results_lock = threading.Lock()
+    applied = [0]
+
+    def acquire_driver(worker_id):
+        if worker_id == 0 and primary_driver is not None:
+            return primary_driver
+        try:
+            driver = pool.checkout(timeout=checkout_timeout) if pool is not None else setup_driver()
+        except Exception as e:
+            print(f"⚠️ Worker {worker_id} could not get a browser: {str(e)[:100]}")
+            return None
+        if shared_session is not None:
+            if getattr(driver, "_session_key", None) != shared_session:
+                # Sign out whichever account the pooled browser had; the primary just validated
+                # this session, so skip the probe
+                clear_session(driver)
+                restore_session(driver, *shared_session, validate=False)
+        elif cookies:
+            clear_session(driver)
+            copy_cookies(cookies, driver)
+        return driver
+
+    def release_driver(worker_id, driver, jobs_done):
+        if driver is primary_driver:
+            if pool is not None:
+                pool.record_jobs(driver, jobs_done)
+            return
+        if pool is not None:
+            pool.checkin(driver, jobs_completed=jobs_done)
+        else:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def worker(worker_id):
+        driver = acquire_driver(worker_id)
+        if driver is None:
+            return
+        jobs_done = 0
+        try:
+            while True:
+                try:
+                    index, job = work.get_nowait()
+                except queue.Empty:
+                    return
+                # Workers on the same account share one pacer, so they slow down together
+                pacer = pacer_for(driver, job["link"])
+                pacer.acquire()
+                begin_job(driver)
+                try:
+                    print(f"\n🔶 [worker {worker_id}] Job {index+1}: {job['title']} at {job['company']}")
+                    with limiter.slot(job["link"]), tracking(checkpoint, job["link"]):
+                        status = apply_for_job(driver, job["link"], resume_path)
+                except Exception as e:
+                    status = f"Error: {str(e)[:100]}"
+                webdriver_summary = end_job(driver)
+                record_pacing(driver, pacer)
+                jobs_done += 1
+                result = {**job, "status": status}
+                if webdriver_summary:
+                    result["webdriver"] = webdriver_summary
+                with results_lock:
+                    results[index] = result
+                    if "Applied successfully" in status:
+                        applied[0] += 1
+                if on_result:
+                    on_result(result)
+                print(f"📊 [worker {worker_id}] Status: {status}")
+        finally:
+            release_driver(worker_id, driver, jobs_done)
+
+    started = time.time()
+    threads = [threading.Thread(target=worker, args=(worker_id,), name=f"apply-{worker_id}", daemon=True)
+               for worker_id in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Jobs no worker could take (e.g. every browser failed to start) are reported, not dropped
+    merged = [result if result is not None else {**job, "status": "Error: no browser available"}
+              for job, result in zip(jobs, results)]
+    elapsed = time.time() - started
+    print(f"\n✅ Applied to {applied[0]} out of {len(merged)} processed jobs "
+          f"with {workers} browsers in {elapsed:.0f}s")
+    return merged
@@ -0,0 +1,174 @@
+import os
+import re
+import math
+import time
+import heapq
+from functools import lru_cache
+from collections import Counter
+
+from resume_profile import load_resume_profile
+
+# Card fields that are scored, with the weight of a term found in each (ascending, so a term
+# found in several fields keeps its highest weight)
+CARD_FIELDS = (("company", 0.5), ("snippet", 1.0), ("title", 2.0))
+
+# Resume profile parts the query is built from, with the weight of their terms
+PROFILE_WEIGHTS = {"skills": 1.0, "search_term": 1.0, "headline": 0.5, "experience": 0.5}
+
+# Cards read per job still wanted before a batch is ranked: enough to choose between, few enough
+# that the first application starts on the first results page (RELEVANCE_WINDOW caps it)
+CARDS_PER_JOB = 3
+
+STOPWORDS = frozenset((
+    "a", "an", "and", "or", "the", "of", "in", "for", "with", "to", "at", "on", "by", "from", "as",
+    "is", "are", "be", "we", "our", "you", "your", "m", "f", "d", "w", "x", "i", "ii", "iii",
+))
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+
+def terms(text):
+    """Lower-cased word tokens plus adjacent-word bigrams, so 'Machine Learning' matches as a phrase"""
+    words = [word for word in _TOKEN_RE.findall((text or "").lower()) if word not in STOPWORDS]
+    return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+
+@lru_cache(maxsize=16384)
+def _field_terms(text):
+    # Titles and company names repeat across result pages and searches; tokenize each once
+    return tuple(terms(text))
+
+
+def profile_query(profile, search_term=None):
+    """{term: weight} for what the applicant is looking for: resume skills, headline, past titles, search"""
+    query = Counter()
+    parts = {
+        "skills": profile.get("skills", []) if profile else [],
+        "search_term": [search_term or ""],
+        "headline": [profile.get("headline") or ""] if profile else [],
+        "experience": [entry["title"] for entry in profile.get("experience", [])] if profile else [],
+    }
+    for part, texts in parts.items():
+        for text in texts:
+            for term in set(terms(text)):
+                query[term] = max(query[term], PROFILE_WEIGHTS[part])
+    return dict(query)
+
+
+class RelevanceScorer:
+    """TF-IDF cosine similarity between job cards and a resume profile, a whole batch at a time.
+
+    Each card becomes a sparse vector over the terms of its title, snippet and company
+    (weighted per CARD_FIELDS); IDF is taken over the batch being scored, so terms that
+    every card shares ('developer' in a developer search) count for little and the cards
+    are told apart by the skills they mention. Scoring is one pass over the batch's terms:
+    document frequencies first, then each card's dot product against the fixed query.
+    """
+
+    def __init__(self, query):
+        self.query = query
+
+    @classmethod
+    def for_profile(cls, profile, search_term=None):
+        return cls(profile_query(profile, search_term))
+
+    def card_terms(self, card):
+        weights = {}
+        for field, weight in CARD_FIELDS:
+            weights.update(dict.fromkeys(_field_terms(card.get(field) or ""), weight))
+        return weights
+
+    def score(self, cards):
+        """Similarity in [0, 1] for every card, in order"""
+        if not cards or not self.query:
+            return [0.0] * len(cards)
+        vectors = [self.card_terms(card) for card in cards]
+        frequency = Counter()
+        for vector in vectors:
+            frequency.update(vector.keys())
+        total = len(vectors) + 1
+        idf = {term: math.log(total / (frequency[term] + 1)) + 1.0
+               for term in frequency.keys() | self.query.keys()}
+        query = {term: weight * idf[term] for term, weight in self.query.items()}
+        query_norm = math.sqrt(sum(value * value for value in query.values()))
+
+        scores = []
+        for vector in vectors:
+            shared = vector.keys() & query.keys()
+            if not shared:
+                scores.append(0.0)  # Most poor fits share no term at all; no norm needed
+                continue
+            dot = sum(vector[term] * idf[term] * query[term] for term in shared)
+            norm = math.sqrt(sum((weight * idf[term]) ** 2 for term, weight in vector.items()))
+            scores.append(dot / (norm * query_norm))
+        return scores
+
+    def select(self, cards, top_k=None, threshold=0.0):
+        """(cards scoring at least threshold, best first and at most top_k, the rest); each gets 'relevance'"""
+        scores = self.score(cards)
+        for card, score in zip(cards, scores):
+            card["relevance"] = round(score, 4)
+        passing = [index for index, score in enumerate(scores) if score >= threshold]
+        if top_k is not None and top_k < len(passing):
+            best = heapq.nlargest(top_k, passing, key=lambda index: (scores[index], -index))
+        else:
+            best = sorted(passing, key=lambda index: (-scores[index], index))
+        chosen = set(best)
+        return [cards[index] for index in best], [card for index, card in enumerate(cards) if index not in chosen]
+
+
+def rank_jobs(jobs, scorer, threshold=0.0, window=100, top_k=None):
+    """Re-order a (lazy) stream of discovered jobs best match first, dropping those below threshold.
+
+    Jobs are read and scored a batch at a time: CARDS_PER_JOB cards for each of the top_k jobs
+    still wanted, at most window, so applying starts after a page or so rather than after the
+    whole search, and no further pages are fetched once top_k jobs have been selected.
+    window=0 scores the entire search in one batch, which makes top_k an exact top-K over
+    everything discovered.
+    """
+    jobs = iter(jobs)
+    remaining = top_k
+    while remaining is None or remaining > 0:
+        size = window
+        if window and remaining is not None:
+            size = min(window, CARDS_PER_JOB * remaining)
+        batch = []
+        for job in jobs:
+            batch.append(job)
+            if size and len(batch) >= size:
+                break
+        if not batch:
+            return
+        started = time.perf_counter()
+        selected, skipped = scorer.select(batch, remaining, threshold)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"🎯 Scored {len(batch)} cards in {elapsed_ms:.1f} ms: {len(selected)} selected, "
+              f"{len(skipped)} below {threshold:g} or outside the top {remaining if remaining is not None else 'all'}")
+        for job in skipped:
+            if job["relevance"] < threshold:
+                print(f"⏭️ Skipping poor fit ({job['relevance']:.2f}): {job['title']} at {job['company']}")
+        for job in selected:
+            yield job
+        if remaining is not None:
+            remaining -= len(selected)
+        if not size or len(batch) < size:
+            return
+
+
+def relevance_settings():
+    """(enabled, threshold, window) from RELEVANCE_FILTER / RELEVANCE_MIN_SCORE / RELEVANCE_WINDOW in config.env"""
+    enabled = os.getenv("RELEVANCE_FILTER", "on").strip().lower() not in ("0", "off", "false", "no")
+    return enabled, float(os.getenv("RELEVANCE_MIN_SCORE", "0.05")), int(os.getenv("RELEVANCE_WINDOW", "100"))
+
+
+def filter_relevant_jobs(jobs, resume_path, search_term=None, top_k=None):
+    """Wrap a discovery stream with rank_jobs using the resume's cached profile; unchanged when
+    RELEVANCE_FILTER is off or the resume could not be parsed"""
+    enabled, threshold, window = relevance_settings()
+    if not enabled:
+        return jobs
+    profile = load_resume_profile(resume_path)
+    if not profile or not profile["skills"]:
+        print("⚠️ No skills parsed from the resume; applying to jobs in discovery order")
+        return jobs
+    return rank_jobs(jobs, RelevanceScorer.for_profile(profile, search_term), threshold, window, top_k)
@@ -0,0 +1,245 @@
+import os
+import re
+import json
+import fnmatch
+import threading
+from urllib.parse import urlparse
+
+RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "resource_filters.json")
+
+PLATFORMS = ("linkedin", "indeed")
+
+_rules = None
+_stats_lock = threading.Lock()
+_pages = []
+_baselines = {}
+
+
+def _flag(name, default):
+    return os.getenv(name, default).strip().lower() not in ("0", "off", "false", "no")
+
+
+def is_enabled():
+    """RESOURCE_FILTER=off turns blocking off (pages are still measured, as the unfiltered baseline)"""
+    return _flag("RESOURCE_FILTER", "on")
+
+
+def stats_enabled():
+    return _flag("RESOURCE_FILTER_STATS", "on")
+
+
+def load_rules(path=None):
+    """Allow/deny rule sets from data/resource_filters.json (or RESOURCE_FILTER_RULES)"""
+    global _rules
+    if path is None and _rules is not None:
+        return _rules
+    with open(path or os.getenv("RESOURCE_FILTER_RULES") or RULES_PATH, encoding="utf-8") as file:
+        rules = json.load(file)
+    if path is None:
+        _rules = rules
+    return rules
+
+
+def platform_for_url(url):
+    lowered = (url or "").lower()
+    for platform in PLATFORMS:
+        if platform in lowered:
+            return platform
+    return None
+
+
+def page_kind(url):
+    """URL path with id-bearing segments wildcarded, so all job pages of a site share one kind"""
+    segments = ["*" if re.search(r"\d", segment) else segment
+                for segment in urlparse(url).path.split("/") if segment]
+    return "/" + "/".join(segments)
+
+
+def blocked_patterns(platform=None, rules=None):
+    """The default deny list plus the platform's, minus every pattern an allow rule covers"""
+    rules = rules or load_rules()
+    deny, allow = [], []
+    for section in ("default", platform):
+        entry = rules.get(section) or {}
+        deny += entry.get("deny", [])
+        allow += entry.get("allow", [])
+    patterns = []
+    for pattern in deny:
+        if pattern not in patterns and not any(fnmatch.fnmatchcase(pattern, rule) for rule in allow):
+            patterns.append(pattern)
+    return patterns
+
+
+# ----- installing the filter -----
+
+def enable_performance_log(options):
+    """Ask chromedriver for the DevTools network log that collect_pages() reads"""
+    if stats_enabled():
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def _set_blocked_urls(driver, patterns):
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        print(f"⚠️ Could not update the resource filter: {e}")
+        return False
+    driver._blocked_patterns = patterns
+    return True
+
+
+def apply_filter(driver, platform=None):
+    """Block the platform's deny list on driver; skips the DevTools calls if it is already active"""
+    patterns = blocked_patterns(platform) if is_enabled() else []
+    if getattr(driver, "_blocked_patterns", None) == patterns:
+        return patterns
+    return patterns if _set_blocked_urls(driver, patterns) else None
+
+
+def apply_filter_for_url(driver, url):
+    return apply_filter(driver, platform_for_url(url))
+
+
+def disable_filter(driver):
+    """Stop blocking anything on driver (e.g. to measure an unfiltered baseline)"""
+    if getattr(driver, "_blocked_patterns", None):
+        _set_blocked_urls(driver, [])
+
+
+# ----- per-page bytes / load-time counters -----
+
+def collect_pages(driver):
+    """Turn the DevTools network log gathered since the last call into per-page records.
+
+    Each page gets the bytes it transferred, its load time, the requests the filter blocked
+    and the bytes and milliseconds saved. Savings are measured against unfiltered loads of the
+    same kind of page when there are any (RESOURCE_FILTER=off, or the benchmark's baseline
+    pass); otherwise bytes saved is estimated from typical_bytes per blocked resource type.
+    """
+    if not stats_enabled():
+        return []
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return []
+
+    filtered = bool(getattr(driver, "_blocked_patterns", None))
+    typical_bytes = load_rules().get("typical_bytes", {})
+    pages = []
+    by_request = {}
+    current = None
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        method = message.get("method")
+        params = message.get("params", {})
+
+        if method == "Network.requestWillBeSent":
+            url = params.get("request", {}).get("url", "")
+            # A new top-level document once the previous page has finished loading
+            if (params.get("type") == "Document" and url.startswith("http")
+                    and (current is None or current["load_ms"] is not None)):
+                current = {
+                    "url": url,
+                    "platform": platform_for_url(url),
+                    "kind": page_kind(url),
+                    "filtered": filtered,
+                    "started": params.get("timestamp", 0.0),
+                    "requests": 0,
+                    "bytes": 0,
+                    "blocked": 0,
+                    "blocked_by_type": {},
+                    "blocked_bytes_estimate": 0,
+                    "load_ms": None,
+                }
+                pages.append(current)
+            if current is not None:
+                by_request[params.get("requestId")] = current
+                current["requests"] += 1
+        elif method == "Network.loadingFinished":
+            page = by_request.get(params.get("requestId"))
+            if page is not None:
+                page["bytes"] += int(params.get("encodedDataLength") or 0)
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            page = by_request.get(params.get("requestId"), current)
+            if page is not None:
+                kind = params.get("type") or "Other"
+                page["blocked"] += 1
+                page["blocked_by_type"][kind] = page["blocked_by_type"].get(kind, 0) + 1
+                page["blocked_bytes_estimate"] += typical_bytes.get(kind, typical_bytes.get("Other", 0))
+        elif method == "Page.loadEventFired" and current is not None and current["load_ms"] is None:
+            current["load_ms"] = round((params.get("timestamp", 0.0) - current["started"]) * 1000, 1)
+
+    for page in pages:
+        del page["started"]
+        _record(page)
+    return pages
+
+
+def _record(page):
+    key = (page["platform"], page["kind"])
+    with _stats_lock:
+        baseline = _baselines.get(key)
+        if not page["filtered"]:
+            if page["load_ms"] is not None:
+                baseline = _baselines.setdefault(key, {"pages": 0, "bytes": 0, "load_ms": 0.0})
+                baseline["pages"] += 1
+                baseline["bytes"] += page["bytes"]
+                baseline["load_ms"] += page["load_ms"]
+            page["bytes_saved"] = 0
+            page["load_ms_saved"] = 0.0
+        elif baseline:
+            page["bytes_saved"] = round(baseline["bytes"] / baseline["pages"]) - page["bytes"]
+            page["load_ms_saved"] = (round(baseline["load_ms"] / baseline["pages"] - page["load_ms"], 1)
+                                     if page["load_ms"] is not None else None)
+        else:
+            page["bytes_saved"] = page["blocked_bytes_estimate"]
+            page["load_ms_saved"] = None
+        _pages.append(page)
+
+
+def get_filter_stats():
+    """Totals per (platform, page kind) plus overall bytes and load time saved"""
+    with _stats_lock:
+        pages = list(_pages)
+    kinds = {}
+    for page in pages:
+        label = f"{page['platform'] or 'other'} {page['kind']}"
+        entry = kinds.setdefault(label, {"pages": 0, "filtered_pages": 0, "blocked": 0, "bytes": 0,
+                                         "bytes_saved": 0, "load_ms": 0.0, "load_ms_saved": 0.0})
+        entry["pages"] += 1
+        entry["blocked"] += page["blocked"]
+        entry["bytes"] += page["bytes"]
+        entry["load_ms"] += page["load_ms"] or 0.0
+        if page["filtered"]:
+            entry["filtered_pages"] += 1
+            entry["bytes_saved"] += page["bytes_saved"]
+            entry["load_ms_saved"] += page["load_ms_saved"] or 0.0
+    return {
+        "pages": kinds,
+        "total_blocked": sum(entry["blocked"] for entry in kinds.values()),
+        "total_bytes_saved": sum(entry["bytes_saved"] for entry in kinds.values()),
+        "total_load_ms_saved": round(sum(entry["load_ms_saved"] for entry in kinds.values()), 1),
+    }
+
+
+def reset_filter_stats(baselines=False):
+    with _stats_lock:
+        _pages.clear()
+        if baselines:
+            _baselines.clear()
+
+
+def print_filter_summary():
+    stats = get_filter_stats()
+    if not stats["pages"]:
+        return
+    print("\n=== Resource Filter Summary ===")
+    for label, entry in sorted(stats["pages"].items()):
+        print(f"{label:>32}: {entry['pages']:>3} pages  blocked {entry['blocked']:>4}  "
+              f"saved {entry['bytes_saved'] / 1024:>8.0f} KB / {entry['load_ms_saved'] / 1000:>6.2f}s")
+    print(f"🧹 Blocked {stats['total_blocked']} requests, saved ~{stats['total_bytes_saved'] / (1024 * 1024):.1f} MB "
+          f"and {stats['total_load_ms_saved'] / 1000:.1f}s of page load")
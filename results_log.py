@@ -0,0 +1,263 @@
+import os
+import sys
+import csv
+import json
+import time
+import atexit
+import threading
+from collections import deque
+
+from resource_filter import platform_for_url
+
+DEFAULT_RESULTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "application_results.jsonl")
+
+# Columns of a CSV log; a JSONL log carries the same keys
+FIELDS = ("time", "run_id", "search_term", "platform", "title", "company", "link", "status",
+          "succeeded", "webdriver_calls")
+
+GROUPINGS = ("run", "day", "platform", "search_term", "company", "status")
+
+
+def _is_csv(path):
+    return path.lower().endswith(".csv")
+
+
+def to_record(result, run_id=None, search_term=None):
+    """Flatten one result dict from the apply loop into a log record"""
+    status = result.get("status", "")
+    return {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "run_id": run_id or "",
+        "search_term": search_term or "",
+        "platform": platform_for_url(result.get("link")) or "",
+        "title": result.get("title", ""),
+        "company": result.get("company", ""),
+        "link": result.get("link", ""),
+        "status": status,
+        "succeeded": "Applied successfully" in status,
+        "webdriver_calls": (result.get("webdriver") or {}).get("calls", ""),
+    }
+
+
+class ResultsWriter:
+    """Append-only log of application results, written as each job finishes.
+
+    Every record is flushed to the OS straight away; fsync is batched (every fsync_every
+    records or fsync_seconds, whichever comes first) so a busy run is not bound by disk
+    syncs. Once the file reaches max_bytes it is rotated to <path>.1 ... <path>.<backups>.
+    Paths ending in .csv get CSV with a header row, anything else JSON lines.
+    """
+
+    def __init__(self, path=DEFAULT_RESULTS_PATH, fsync_every=10, fsync_seconds=5.0,
+                 max_bytes=10 * 1024 * 1024, backups=5):
+        self.path = path
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_seconds = fsync_seconds
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.records = 0
+        self.syncs = 0
+        self.rotations = 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._csv = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _open(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8", newline="")
+        if _is_csv(self.path):
+            self._csv = csv.DictWriter(self._file, fieldnames=FIELDS)
+            if self._file.tell() == 0:
+                self._csv.writeheader()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self.syncs += 1
+
+    def _rotate(self):
+        self._sync()
+        self._file.close()
+        self._file = None
+        if self.backups > 0:
+            for index in range(self.backups - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.rotations += 1
+        self._open()
+
+    def write(self, record):
+        with self._lock:
+            if self._file is None:
+                self._open()
+            elif self.max_bytes and self._file.tell() >= self.max_bytes:
+                self._rotate()
+            if self._csv is not None:
+                self._csv.writerow(record)
+            else:
+                self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+            self.records += 1
+            self._unsynced += 1
+            if (self._unsynced >= self.fsync_every
+                    or time.monotonic() - self._last_sync >= self.fsync_seconds):
+                self._sync()
+
+    def write_result(self, result, run_id=None, search_term=None):
+        self.write(to_record(result, run_id, search_term))
+
+    def flush(self):
+        """fsync anything written since the last batch"""
+        with self._lock:
+            if self._file is not None and self._unsynced:
+                self._sync()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                if self._unsynced:
+                    self._sync()
+                self._file.close()
+                self._file = None
+                self._csv = None
+
+    def stats(self):
+        return {"path": self.path, "records": self.records, "syncs": self.syncs, "rotations": self.rotations}
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_results_writer():
+    """Return the process-wide writer (RESULTS_LOG_* settings from config.env), or None if RESULTS_LOG=off"""
+    global _writer
+    if os.getenv("RESULTS_LOG", "on").strip().lower() in ("0", "off", "false", "no"):
+        return None
+    with _writer_lock:
+        if _writer is None:
+            _writer = ResultsWriter(
+                path=os.getenv("RESULTS_LOG_PATH") or DEFAULT_RESULTS_PATH,
+                fsync_every=int(os.getenv("RESULTS_LOG_FSYNC_EVERY", "10")),
+                fsync_seconds=float(os.getenv("RESULTS_LOG_FSYNC_SECONDS", "5")),
+                max_bytes=int(float(os.getenv("RESULTS_LOG_MAX_MB", "10")) * 1024 * 1024),
+                backups=int(os.getenv("RESULTS_LOG_BACKUPS", "5")),
+            )
+            atexit.register(_writer.close)
+        return _writer
+
+
+# ----- reading the log back -----
+
+def log_files(path=None):
+    """The log and its rotated copies, oldest first"""
+    path = path or os.getenv("RESULTS_LOG_PATH") or DEFAULT_RESULTS_PATH
+    files = []
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        files.append(f"{path}.{index}")
+        index += 1
+    files.reverse()
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def iter_records(path=None, since=None):
+    """Yield records one at a time across all rotated files; since is an ISO date or datetime prefix"""
+    for file_path in log_files(path):
+        with open(file_path, encoding="utf-8", newline="") as file:
+            rows = csv.DictReader(file) if _is_csv(file_path) else _json_lines(file)
+            for record in rows:
+                if since and record.get("time", "") < since:
+                    continue
+                if isinstance(record.get("succeeded"), str):
+                    record["succeeded"] = record["succeeded"] == "True"
+                yield record
+
+
+def _json_lines(file):
+    for line in file:
+        try:
+            yield json.loads(line)
+        except ValueError:
+            continue  # A torn last line from a crash
+
+
+def _group_key(record, by):
+    if by == "run":
+        return record.get("run_id") or "(no run id)"
+    if by == "day":
+        return record.get("time", "")[:10]
+    return record.get(by) or "(none)"
+
+
+def summarize(records, by="run"):
+    """Success counts per group in one pass; memory grows with the number of groups, not records"""
+    if by not in GROUPINGS:
+        raise ValueError(f"Unknown grouping '{by}' (expected one of: {', '.join(GROUPINGS)})")
+    groups = {}
+    for record in records:
+        entry = groups.setdefault(_group_key(record, by), {"total": 0, "succeeded": 0,
+                                                           "first": record.get("time"), "last": None})
+        entry["total"] += 1
+        entry["succeeded"] += 1 if record.get("succeeded") else 0
+        entry["last"] = record.get("time")
+    for entry in groups.values():
+        entry["success_rate"] = round(entry["succeeded"] / entry["total"], 3)
+    return groups
+
+
+def main():
+    usage = ("Usage: python results_log.py [summary [--by run|day|platform|search_term|company|status] "
+             "[--since YYYY-MM-DD] | tail [N]] [--path FILE]")
+    args = sys.argv[1:]
+    if not args or args[0] not in ("summary", "tail"):
+        print(usage)
+        return
+
+    def option(name, default=None):
+        if name in args:
+            try:
+                return args[args.index(name) + 1]
+            except IndexError:
+                return None
+        return default
+
+    path = option("--path")
+    if args[0] == "tail":
+        try:
+            count = int(args[1]) if len(args) > 1 and not args[1].startswith("--") else 20
+        except ValueError:
+            print(usage)
+            return
+        for record in deque(iter_records(path), maxlen=count):
+            print(f"{record['time']}  {record['title']} at {record['company']}: {record['status']}")
+        return
+
+    by = option("--by", "run")
+    if by not in GROUPINGS:
+        print(usage)
+        return
+    groups = summarize(iter_records(path, option("--since")), by)
+    if not groups:
+        print("No results logged yet")
+        return
+    total = sum(entry["total"] for entry in groups.values())
+    succeeded = sum(entry["succeeded"] for entry in groups.values())
+    for key, entry in sorted(groups.items(), key=lambda item: item[1]["first"] or ""):
+        print(f"{key:>32}: {entry['succeeded']:>4}/{entry['total']:<4} applied ({entry['success_rate']:.0%})")
+    print(f"📈 {succeeded}/{total} applications succeeded overall ({succeeded / total:.0%}) across {len(groups)} groups")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+import io
+import os
+import re
+import uuid
+import hashlib
+import zipfile
+import threading
+from collections import OrderedDict
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resume_cache")
+
+CHUNK_SIZE = 64 * 1024
+
+EXTENSIONS = (".pdf", ".docx", ".doc", ".rtf", ".txt")
+
+_HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class UploadTooLargeError(Exception):
+    """Raised while streaming an upload once it passes the size limit.
+
+    Not a ValueError: werkzeug's form parser silently drops ValueErrors raised mid-parse.
+    """
+
+
+def detect_extension(path, filename=None):
+    """The file's real type from its first bytes, falling back to filename's extension"""
+    with open(path, "rb") as file:
+        head = file.read(8)
+    if head.startswith(b"%PDF"):
+        return ".pdf"
+    if head.startswith(b"PK\x03\x04"):
+        try:
+            with zipfile.ZipFile(path) as archive:
+                if "word/document.xml" in archive.namelist():
+                    return ".docx"
+        except zipfile.BadZipFile:
+            pass
+    if head.startswith(b"\xd0\xcf\x11\xe0"):
+        return ".doc"
+    if head.startswith(b"{\\rtf"):
+        return ".rtf"
+    extension = os.path.splitext(filename or "")[1].lower()
+    return extension if extension in EXTENSIONS else ".pdf"
+
+
+def _safe_name(filename, extension, default_stem):
+    """Keep the uploader's file name (employers see it) but only with safe characters and the real extension"""
+    stem = os.path.splitext(os.path.basename(filename or ""))[0]
+    stem = re.sub(r"[^A-Za-z0-9._ -]+", "_", stem).strip(" ._") or default_stem
+    return stem[:100] + extension
+
+
+class CacheSpool(io.RawIOBase):
+    """Writable file in the cache directory that hashes what is written and enforces a size limit.
+
+    Uploads are streamed into a spool chunk by chunk and then committed to the cache under
+    their hash (ResumeCache.commit); closing an uncommitted spool deletes it.
+    """
+
+    def __init__(self, directory, filename=None, limit=None):
+        super().__init__()
+        self.filename = filename
+        self.limit = limit
+        self.size = 0
+        self.path = os.path.join(directory, f".upload-{uuid.uuid4().hex}")
+        self._sha256 = hashlib.sha256()
+        self._file = open(self.path, "w+b")
+
+    def writable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def write(self, data):
+        self.size += len(data)
+        if self.limit and self.size > self.limit:
+            raise UploadTooLargeError(f"upload exceeds {self.limit / (1024 * 1024):g} MB")
+        self._sha256.update(data)
+        return self._file.write(data)
+
+    def readinto(self, buffer):
+        return self._file.readinto(buffer)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self._file.seek(offset, whence)
+
+    def tell(self):
+        return self._file.tell()
+
+    def hexdigest(self):
+        return self._sha256.hexdigest()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        super().close()
+
+
+class ResumeCache:
+    """Content-addressed store for uploaded resumes and cover letters.
+
+    Each file lives at <directory>/<sha256>/<original name>, so a CV uploaded once can be
+    referenced by its hash in later requests and is never written twice. The cache is
+    bounded by max_bytes; the least recently used files are evicted first, except those
+    pinned by a queued or running application.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=200 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._pins = {}
+        os.makedirs(directory, exist_ok=True)
+        self._scan()
+
+    def _scan(self):
+        """Rebuild the LRU order from disk; last use is kept as each file's mtime"""
+        found = []
+        for digest in os.listdir(self.directory):
+            folder = os.path.join(self.directory, digest)
+            if not _HASH_RE.match(digest) or not os.path.isdir(folder):
+                continue
+            names = os.listdir(folder)
+            if not names:
+                continue
+            path = os.path.join(folder, names[0])
+            found.append((os.path.getmtime(path), digest, path, os.path.getsize(path)))
+        for _, digest, path, size in sorted(found):
+            self._entries[digest] = (path, size)
+
+    @property
+    def total_bytes(self):
+        return sum(size for _, size in self._entries.values())
+
+    def _touch(self, digest):
+        self._entries.move_to_end(digest)
+        try:
+            os.utime(self._entries[digest][0])
+        except OSError:
+            pass
+
+    def _evict(self, keep):
+        total = self.total_bytes
+        for digest in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            if digest == keep or self._pins.get(digest):
+                continue
+            path, size = self._entries.pop(digest)
+            try:
+                os.remove(path)
+                os.rmdir(os.path.dirname(path))
+            except OSError:
+                pass
+            total -= size
+            self.evictions += 1
+
+    def spool(self, filename=None, limit=None):
+        return CacheSpool(self.directory, filename, limit)
+
+    def commit(self, spool, default_stem="resume"):
+        """Move a fully written spool into the cache (or drop it if the content is already there)"""
+        digest = spool.hexdigest()
+        spool._file.close()
+        try:
+            with self._lock:
+                if digest in self._entries and os.path.exists(self._entries[digest][0]):
+                    self.hits += 1
+                    self._touch(digest)
+                    return digest, self._entries[digest][0]
+                self.misses += 1
+                name = _safe_name(spool.filename, detect_extension(spool.path, spool.filename), default_stem)
+                folder = os.path.join(self.directory, digest)
+                os.makedirs(folder, exist_ok=True)
+                path = os.path.join(folder, name)
+                os.replace(spool.path, path)
+                self._entries[digest] = (path, os.path.getsize(path))
+                self._evict(keep=digest)
+                return digest, path
+        finally:
+            spool.close()
+
+    def put_stream(self, stream, filename=None, default_stem="resume", limit=None):
+        """Copy stream into the cache in chunks while hashing it; returns (digest, path)"""
+        spool = self.spool(filename, limit)
+        try:
+            for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+                spool.write(chunk)
+        except BaseException:
+            spool.close()
+            raise
+        return self.commit(spool, default_stem)
+
+    def put_bytes(self, data, filename=None, default_stem="resume", limit=None):
+        return self.put_stream(io.BytesIO(data), filename, default_stem, limit)
+
+    def path_for(self, digest):
+        """The cached file for a hash (marking it recently used), or None"""
+        digest = (digest or "").lower()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None or not os.path.exists(entry[0]):
+                self._entries.pop(digest, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touch(digest)
+            return entry[0]
+
+    def digest_of(self, path):
+        """The hash a path is cached under, or None for files outside the cache"""
+        if not path or os.path.dirname(os.path.dirname(os.path.abspath(path))) != os.path.abspath(self.directory):
+            return None
+        digest = os.path.basename(os.path.dirname(path))
+        return digest if digest in self._entries else None
+
+    def pin(self, *paths):
+        """Protect cached files from eviction while an application uses them"""
+        with self._lock:
+            for digest in filter(None, map(self.digest_of, paths)):
+                self._pins[digest] = self._pins.get(digest, 0) + 1
+
+    def unpin(self, *paths):
+        with self._lock:
+            for digest in filter(None, map(self.digest_of, paths)):
+                if self._pins.get(digest, 0) > 1:
+                    self._pins[digest] -= 1
+                else:
+                    self._pins.pop(digest, None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "pinned": len(self._pins),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_resume_cache():
+    """Return the process-wide cache (RESUME_CACHE_DIR / RESUME_CACHE_MAX_MB from config.env)"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResumeCache(
+                directory=os.getenv("RESUME_CACHE_DIR") or DEFAULT_CACHE_DIR,
+                max_bytes=int(float(os.getenv("RESUME_CACHE_MAX_MB", "200")) * 1024 * 1024),
+            )
+        return _cache
@@ -0,0 +1,448 @@
+import os
+import re
+import sys
+import json
+import hashlib
+import zipfile
+import threading
+import xml.etree.ElementTree as ET
+
+from resume_cache import detect_extension, CHUNK_SIZE
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SECTIONS_PATH = os.path.join(DATA_DIR, "resume_sections.json")
+DEFAULT_PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resume_profiles")
+
+# Bumped whenever parsing changes, so profiles cached by an older parser are parsed again
+PARSER_VERSION = 1
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Bullet glyphs as they come out of PDFs (Word's Symbol-font bullets land in the private use area)
+BULLETS = "•●▪■◦‣∙*\uf0b7\uf0a7\uf076\uf0d8\uf0fc"
+
+_MONTH = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s+)?(?:19|20)\d{{2}}"
+DATE_RANGE_RE = re.compile(rf"{_DATE}\s*(?:–|—|-|to)\s*(?:{_DATE}|present|current|now|today)", re.I)
+DATE_RE = re.compile(rf"\b{_DATE}\b", re.I)
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_RE = re.compile(r"\+?\d[\d ()./-]{7,}\d")
+LINKEDIN_RE = re.compile(r"(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/in/[\w%-]+/?", re.I)
+GITHUB_RE = re.compile(r"(?:https?://)?github\.com/[\w-]+/?", re.I)
+
+_section_aliases = None
+
+
+def _load_section_aliases():
+    """Heading text -> section name, from data/resume_sections.json"""
+    global _section_aliases
+    if _section_aliases is None:
+        with open(SECTIONS_PATH, encoding="utf-8") as file:
+            table = json.load(file)
+        _section_aliases = {alias: section for section, aliases in table.items() for alias in aliases}
+    return _section_aliases
+
+
+def _clean(line):
+    return re.sub(r"\s+", " ", line).strip().lstrip(BULLETS).strip()
+
+
+# ----- text extraction -----
+
+def _docx_blocks(path):
+    """Paragraphs of a .docx as lists of lines (line breaks inside a paragraph start a new line)"""
+    with zipfile.ZipFile(path) as archive:
+        root = ET.fromstring(archive.read("word/document.xml"))
+    blocks = []
+    for paragraph in root.iter(f"{_W}p"):
+        parts = []
+        for node in paragraph.iter():
+            if node.tag == f"{_W}t":
+                parts.append(node.text or "")
+            elif node.tag == f"{_W}tab":
+                parts.append("\t")
+            elif node.tag in (f"{_W}br", f"{_W}cr"):
+                parts.append("\n")
+        lines = [line for line in map(_clean, "".join(parts).split("\n")) if line]
+        if lines:
+            blocks.append(lines)
+    return blocks
+
+
+def _pdf_text(path):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        try:
+            from PyPDF2 import PdfReader
+        except ImportError:
+            raise ValueError("reading PDF resumes needs the 'pypdf' package (pip install pypdf)")
+    return "\n".join(page.extract_text() or "" for page in PdfReader(path).pages)
+
+
+def _line_blocks(text):
+    """Lines of PDF or plain text grouped into paragraph-like blocks, as a .docx already has them.
+
+    A bullet, a heading or a blank line starts a new block, and a line the PDF wrapped at the
+    page width (the previous line is nearly full width, ends in a comma, or this one starts in
+    lower case) is joined back onto the line before it.
+    """
+    raw = [line.strip() for line in text.splitlines()]
+    width = max((len(line) for line in raw), default=0)
+    blocks = []
+    previous = ""
+    for line in raw:
+        cleaned = _clean(line)
+        if not cleaned:
+            previous = ""
+            continue
+        if not previous or line[0] in BULLETS or _section_name(cleaned) or _section_name(previous):
+            blocks.append([cleaned])
+        elif len(previous) >= 0.75 * width or previous.endswith(",") or cleaned[0].islower():
+            blocks[-1][-1] += " " + cleaned
+        else:
+            blocks[-1].append(cleaned)
+        previous = cleaned
+    return blocks
+
+
+# ----- structure -----
+
+def _section_name(line, after_heading=True):
+    """The section a heading line starts, or None for ordinary lines.
+
+    Known headings come from data/resume_sections.json; any other short all-caps line after
+    the first heading starts a section of its own name.
+    """
+    if len(line) > 50:
+        return None
+    key = " ".join(re.sub(r"[^a-z ]", " ", line.lower().replace("&", " and ")).split())
+    section = _load_section_aliases().get(key)
+    if section:
+        return section
+    if after_heading and line.isupper() and len(line.split()) <= 4 and not re.search(r"\d", line):
+        return key.replace(" ", "_")
+    return None
+
+
+def _split_sections(blocks):
+    """(blocks before the first heading, {section: [blocks]})"""
+    header, sections, current = [], {}, None
+    for block in blocks:
+        section = _section_name(block[0], after_heading=current is not None)
+        if section:
+            current = section
+            sections.setdefault(section, [])
+            if block[1:]:
+                sections[section].append(block[1:])
+        elif current:
+            sections[current].append(block)
+        else:
+            header.append(block)
+    return header, sections
+
+
+def _split_items(text):
+    """'Python, Java (Basic); C++' -> ['Python', 'Java', 'C++']"""
+    text = re.sub(r"\([^)]*\)", "", text)
+    items = (item.strip(" .:-–") for item in re.split(r"[,;|•·\t]", text))
+    return [item for item in items if item and len(item) <= 50]
+
+
+def _dedupe(items):
+    seen = set()
+    return [item for item in items if not (item.lower() in seen or seen.add(item.lower()))]
+
+
+def _skills(blocks):
+    """(all skills, {group label: skills}) from 'Label: a, b, c' lines or plain lists"""
+    skills, groups = [], {}
+    for line in (line for block in blocks for line in block):
+        label, colon, rest = line.partition(":")
+        if colon and rest.strip() and len(label.split()) <= 4:
+            items = _split_items(rest)
+            groups.setdefault(label.strip(), []).extend(items)
+        else:
+            items = _split_items(line)
+        skills.extend(items)
+    return _dedupe(skills), {label: _dedupe(items) for label, items in groups.items()}
+
+
+def _entries(blocks, split_on_dates):
+    """Experience / education entries: a heading (first block or one with a date range) and its details.
+
+    Without date ranges in the section every block is an entry of its own.
+    """
+    split_on_dates = split_on_dates and any(DATE_RANGE_RE.search(" ".join(block)) for block in blocks)
+    entries = []
+    for block in blocks:
+        text = " ".join(block)
+        if entries and split_on_dates and not DATE_RANGE_RE.search(text):
+            entries[-1]["details"].append(text)
+            continue
+        dates = DATE_RANGE_RE.search(text) or DATE_RE.search(text)
+        entries.append({
+            "title": block[0],
+            "heading": " | ".join(block),
+            "dates": dates.group(0) if dates else None,
+            "details": [],
+        })
+    return entries
+
+
+def _contact(lines):
+    text = "\n".join(lines)
+    phones = [match for match in PHONE_RE.findall(text) if len(re.sub(r"\D", "", match)) >= 9]
+    email = EMAIL_RE.search(text)
+    linkedin = LINKEDIN_RE.search(text)
+    github = GITHUB_RE.search(text)
+    location = None
+    for line in lines:
+        for segment in re.split(r"[|•·\t]", line):
+            segment = segment.strip()
+            label, colon, value = segment.partition(":")
+            if colon and label.strip().lower() in ("location", "address", "city"):
+                segment = value.strip()
+            if ("," in segment and len(segment.split()) <= 5 and not re.search(r"[\d@/]", segment)):
+                location = location or segment
+    return {
+        "email": email.group(0) if email else None,
+        "phone": phones[0].strip() if phones else None,
+        "linkedin": linkedin.group(0) if linkedin else None,
+        "github": github.group(0) if github else None,
+        "location": location,
+    }
+
+
+def _is_contact_line(line):
+    return bool(EMAIL_RE.search(line) or PHONE_RE.search(line) or LINKEDIN_RE.search(line)
+                or GITHUB_RE.search(line))
+
+
+def build_profile(blocks):
+    """Structured profile from a resume's text blocks"""
+    header, sections = _split_sections(blocks)
+    header_lines = [line for block in header for line in block]
+    contact_lines = [line for block in sections.get("contact", []) for line in block]
+    texts = {section: [" ".join(block) for block in section_blocks]
+             for section, section_blocks in sections.items()}
+
+    name = header_lines[0] if header_lines and not _is_contact_line(header_lines[0]) else None
+    if name and name.isupper():
+        name = name.title()
+    headline = None
+    if len(header_lines) > 1 and not _is_contact_line(header_lines[1]) and "," not in header_lines[1]:
+        headline = header_lines[1]
+
+    skills, skill_groups = _skills(sections.get("skills", []))
+    known = ("summary", "contact", "skills", "soft_skills", "experience", "education", "projects",
+             "certifications", "languages", "interests")
+    return {
+        "parser_version": PARSER_VERSION,
+        "name": name,
+        "headline": headline,
+        "contact": _contact(header_lines + contact_lines),
+        "summary": " ".join(texts.get("summary", [])),
+        "skills": skills,
+        "skill_groups": skill_groups,
+        "soft_skills": _skills(sections.get("soft_skills", []))[0],
+        "experience": _entries(sections.get("experience", []), split_on_dates=True),
+        "education": _entries(sections.get("education", []), split_on_dates=False),
+        "projects": texts.get("projects", []),
+        "certifications": texts.get("certifications", []),
+        "languages": _dedupe(item for text in texts.get("languages", []) for item in _split_items(text)),
+        "interests": _dedupe(item for text in texts.get("interests", []) for item in _split_items(text)),
+        "other_sections": {section: lines for section, lines in texts.items() if section not in known},
+    }
+
+
+def parse_resume(path):
+    """Parse a PDF, DOCX or plain-text resume into a profile dict (raises ValueError if it can't)"""
+    extension = detect_extension(path, path)
+    if extension == ".docx":
+        blocks = _docx_blocks(path)
+    elif extension == ".pdf":
+        blocks = _line_blocks(_pdf_text(path))
+    elif extension == ".txt":
+        with open(path, encoding="utf-8", errors="replace") as file:
+            blocks = _line_blocks(file.read())
+    else:
+        raise ValueError(f"unsupported resume format '{extension}' (PDF, DOCX or TXT)")
+    if not blocks:
+        raise ValueError("no text found (a scanned PDF?)")
+    profile = build_profile(blocks)
+    profile["file_type"] = extension[1:]
+    return profile
+
+
+def profile_field_mapping(profile):
+    """Application form values taken from a profile, in the key order match_form_fields tries them"""
+    if not profile:
+        return {}
+    contact = profile["contact"]
+    location = contact.get("location") or ""
+    parts = [part.strip() for part in location.split(",") if part.strip()]
+    first, _, last = (profile.get("name") or "").partition(" ")
+    mapping = {
+        "email": contact.get("email"),
+        "phone": contact.get("phone"),
+        "mobile": contact.get("phone"),
+        "linkedin": contact.get("linkedin"),
+        "github": contact.get("github"),
+        "city": parts[0] if parts else None,
+        "country": parts[-1] if len(parts) > 1 else None,
+        "location": location,
+        # Before "name", which is a substring of all of these
+        "first name": first,
+        "firstname": first,
+        "last name": last,
+        "lastname": last,
+        "name": profile.get("name"),
+    }
+    return {key: value for key, value in mapping.items() if value}
+
+
+# ----- cache -----
+
+class ProfileCache:
+    """Parsed resume profiles keyed by the file's SHA-256.
+
+    A resume is parsed once per content: profiles are kept in memory and written to
+    <directory>/<sha256>.json, so form filling and job filtering reuse them across jobs,
+    requests and restarts. Profiles from an older PARSER_VERSION are parsed again.
+    """
+
+    def __init__(self, directory=DEFAULT_PROFILE_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._profiles = {}
+        self._digests = {}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def digest(self, path):
+        """SHA-256 of a file, hashed once per (path, size, mtime)"""
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._digests.get(key)
+        if digest is None:
+            sha256 = hashlib.sha256()
+            with open(path, "rb") as file:
+                for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+                    sha256.update(chunk)
+            digest = sha256.hexdigest()
+            with self._lock:
+                self._digests[key] = digest
+        return digest
+
+    def _read(self, digest):
+        if not self.directory:
+            return None
+        try:
+            with open(os.path.join(self.directory, f"{digest}.json"), encoding="utf-8") as file:
+                profile = json.load(file)
+        except (OSError, ValueError):
+            return None
+        return profile if profile.get("parser_version") == PARSER_VERSION else None
+
+    def _write(self, digest, profile):
+        if not self.directory:
+            return
+        path = os.path.join(self.directory, f"{digest}.json")
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(profile, file, indent=1, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"⚠️ Could not save parsed resume profile: {e}")
+
+    def get(self, path, digest=None):
+        """The profile for the resume at path; digest skips hashing when the caller already knows it"""
+        digest = digest or self.digest(path)
+        with self._lock:
+            profile = self._profiles.get(digest)
+        if profile is None:
+            profile = self._read(digest)
+        if profile is not None:
+            with self._lock:
+                self.hits += 1
+                self._profiles[digest] = profile
+            return profile
+
+        profile = parse_resume(path)
+        profile["sha256"] = digest
+        with self._lock:
+            self.misses += 1
+            self._profiles[digest] = profile
+        self._write(digest, profile)
+        return profile
+
+    def stats(self):
+        with self._lock:
+            return {"profiles": len(self._profiles), "hits": self.hits, "misses": self.misses}
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_profile_cache():
+    """Return the process-wide profile cache (RESUME_PROFILE_DIR from config.env; 'off' keeps it in memory)"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            directory = os.getenv("RESUME_PROFILE_DIR") or DEFAULT_PROFILE_DIR
+            _cache = ProfileCache(None if directory.lower() == "off" else directory)
+        return _cache
+
+
+def load_resume_profile(path, digest=None):
+    """The cached profile for a resume, or None (with a warning) if it cannot be parsed"""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        return get_profile_cache().get(path, digest)
+    except Exception as e:
+        print(f"⚠️ Could not parse resume {os.path.basename(path)}: {e}")
+        return None
+
+
+def print_profile(profile):
+    contact = profile["contact"]
+    print(f"👤 {profile['name'] or '(no name found)'}" + (f" — {profile['headline']}" if profile["headline"] else ""))
+    print("   " + " | ".join(value for value in contact.values() if value))
+    print(f"\n🛠️ Skills ({len(profile['skills'])}): {', '.join(profile['skills'])}")
+    for label, skills in profile["skill_groups"].items():
+        print(f"   {label}: {', '.join(skills)}")
+    if profile["experience"]:
+        print("\n💼 Experience:")
+        for entry in profile["experience"]:
+            print(f"   {entry['heading']}  ({len(entry['details'])} details)")
+    if profile["education"]:
+        print("\n🎓 Education:")
+        for entry in profile["education"]:
+            print(f"   {entry['heading']}")
+
+
+def main():
+    args = sys.argv[1:]
+    paths = [arg for arg in args if not arg.startswith("--")]
+    if not paths:
+        print("Usage: python resume_profile.py <resume.pdf|resume.docx> [--json]")
+        return
+    profile = load_resume_profile(paths[0])
+    if profile is None:
+        print(f"❌ No profile for {paths[0]}")
+        return
+    if "--json" in args:
+        print(json.dumps(profile, indent=2, ensure_ascii=False))
+    else:
+        print_profile(profile)
+
+
+if __name__ == "__main__":
+    main()
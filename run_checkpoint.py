@@ -0,0 +1,200 @@
+import os
+import glob
+import json
+import time
+import uuid
+import threading
+from contextlib import contextmanager
+
+DEFAULT_CHECKPOINT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "checkpoints")
+
+# Steps whose presence means the application may already have reached the employer
+SUBMITTED_STEPS = ("submit_clicked",)
+
+INTERRUPTED_AFTER_SUBMIT = "Interrupted after submitting - not re-applied, check manually"
+
+
+def checkpoint_dir():
+    return os.getenv("RUN_CHECKPOINT_DIR") or DEFAULT_CHECKPOINT_DIR
+
+
+def checkpoint_path(run_id, directory=None):
+    return os.path.join(directory or checkpoint_dir(), f"{run_id}.jsonl")
+
+
+class RunCheckpoint:
+    """Append-only JSONL journal of one search-and-apply run.
+
+    Records, in order: the run's parameters, each job as discovery yields it, the steps an
+    application reaches, and each job's result. Results are fsync'd, so after a crash the
+    file says exactly which jobs still need applying. Opening an existing file replays it.
+    """
+
+    def __init__(self, path, params=None, append=True):
+        self.path = path
+        self.run_id = os.path.splitext(os.path.basename(path))[0]
+        self.params = {}
+        self.jobs = {}
+        self.results = {}
+        self.steps = {}
+        self.discovery_done = False
+        self.finished = False
+        self.resumes = 0
+        self._lock = threading.Lock()
+
+        self._file = None
+        if os.path.exists(path):
+            self._replay()
+        if not append:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        if params is not None and not self.params:
+            self.params = dict(params)
+            self._append({"type": "run", "run_id": self.run_id, "params": self.params}, sync=True)
+        elif self.params:
+            self.resumes += 1
+            self._append({"type": "resume"}, sync=True)
+
+    @classmethod
+    def create(cls, params, run_id=None, directory=None):
+        run_id = run_id or f"run_{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        return cls(checkpoint_path(run_id, directory), params)
+
+    def _replay(self):
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # A torn last line from the crash
+                kind = record.get("type")
+                if kind == "run":
+                    self.params = record.get("params", {})
+                elif kind == "job":
+                    self.jobs.setdefault(record["job"]["link"], record["job"])
+                elif kind == "step":
+                    self.steps[record["link"]] = record["step"]
+                elif kind == "result":
+                    self.results[record["result"]["link"]] = record["result"]
+                elif kind == "discovery_done":
+                    self.discovery_done = True
+                elif kind == "resume":
+                    self.resumes += 1
+                elif kind == "done":
+                    self.finished = True
+
+    def _append(self, record, sync=False):
+        record["at"] = round(time.time(), 3)
+        with self._lock:
+            if self._file is None or self._file.closed:
+                return
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+            if sync:
+                os.fsync(self._file.fileno())
+
+    # ----- journal entries -----
+
+    def record_job(self, job):
+        job = {key: value for key, value in job.items() if key != "element"}
+        if job["link"] not in self.jobs:
+            self.jobs[job["link"]] = job
+            self._append({"type": "job", "job": job})
+
+    def record_step(self, link, step):
+        self.steps[link] = step
+        self._append({"type": "step", "link": link, "step": step})
+
+    def record_result(self, result):
+        result = {key: value for key, value in result.items() if key != "webdriver"}
+        self.results[result["link"]] = result
+        self._append({"type": "result", "result": result}, sync=True)
+
+    def track_discovery(self, jobs):
+        """Pass jobs through, journalling each one; notes when discovery ran out of postings.
+
+        Jobs this run already discovered (a resumed run searching again) are dropped, so they are
+        never applied to twice.
+        """
+        for job in jobs:
+            if job["link"] in self.jobs:
+                continue
+            self.record_job(job)
+            yield job
+        self._append({"type": "discovery_done"}, sync=True)
+        self.discovery_done = True
+
+    def finish(self):
+        self._append({"type": "done"}, sync=True)
+        self.finished = True
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None and not self._file.closed:
+                self._file.close()
+
+    # ----- resuming -----
+
+    def pending_jobs(self):
+        """Discovered jobs without a result whose application never got as far as submitting"""
+        return [job for link, job in self.jobs.items()
+                if link not in self.results and self.steps.get(link) not in SUBMITTED_STEPS]
+
+    def interrupted_after_submit(self):
+        return [job for link, job in self.jobs.items()
+                if link not in self.results and self.steps.get(link) in SUBMITTED_STEPS]
+
+    def ordered_results(self):
+        return [self.results[link] for link in self.jobs if link in self.results]
+
+    def summary(self):
+        return {
+            "run_id": self.run_id,
+            "path": self.path,
+            "search_term": self.params.get("search_term"),
+            "platform": self.params.get("platform"),
+            "discovered": len(self.jobs),
+            "processed": len(self.results),
+            "pending": len(self.pending_jobs()),
+            "discovery_done": self.discovery_done,
+            "finished": self.finished,
+            "resumes": self.resumes,
+        }
+
+
+def unfinished_runs(directory=None, active=()):
+    """Summaries of every checkpoint that never reached 'done', newest first; run_ids in active
+    (still queued or running) are left out, as they are not resumable"""
+    runs = []
+    for path in sorted(glob.glob(os.path.join(directory or checkpoint_dir(), "*.jsonl")),
+                       key=os.path.getmtime, reverse=True):
+        if os.path.splitext(os.path.basename(path))[0] in active:
+            continue
+        checkpoint = RunCheckpoint(path, append=False)
+        if not checkpoint.finished and checkpoint.params:
+            runs.append(checkpoint.summary())
+    return runs
+
+
+# ----- which job an application step belongs to (per thread, so parallel workers work) -----
+
+_local = threading.local()
+
+
+@contextmanager
+def tracking(checkpoint, link):
+    """Attribute mark_step() calls on this thread to link's entry in checkpoint"""
+    _local.current = (checkpoint, link) if checkpoint is not None else None
+    try:
+        yield
+    finally:
+        _local.current = None
+
+
+def mark_step(step):
+    """Journal how far the current application got (no-op outside tracking())"""
+    current = getattr(_local, "current", None)
+    if current is not None:
+        current[0].record_step(current[1], step)
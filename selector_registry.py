@@ -0,0 +1,208 @@
+import os
+import json
+import atexit
+import threading
+
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+from selenium.webdriver.common.by import By
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SELECTORS_PATH = os.path.join(DATA_DIR, "selectors.json")
+DEFAULT_STATS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "selector_stats.json")
+
+# Counts are halved past this many tries, so a selector that starts failing loses its place
+# within a few hundred lookups however long its record is
+MAX_TRIES = 200
+
+# Learned ordering is written out every this many lookups (and at exit)
+SAVE_EVERY = 25
+
+
+def selector_key(platform, page, name):
+    return f"{platform or 'default'}/{page}/{name}"
+
+
+def clickable(element):
+    return element.is_displayed() and element.is_enabled()
+
+
+def clickable_with_text(element):
+    return clickable(element) and bool(element.text.strip())
+
+
+class SelectorRegistry:
+    """Fallback XPaths per platform, page and element, tried most-successful first.
+
+    Candidates come from data/selectors.json (a platform's entry, else the default one) or are
+    passed in by the caller. Every lookup records a hit for the selector that found the element
+    and a miss for each one tried before it; candidates are ordered by their smoothed hit rate,
+    ties keeping file order. The counts are saved to selector_stats.json, so the order learned
+    in one run is where the next run starts.
+
+    A page's "catch_all" entries (e.g. any footer button) are broad enough to match on pages the
+    specific selectors rightly miss, so they would soon win on hit rate alone; they are always
+    tried last, in file order, and never recorded.
+    """
+
+    def __init__(self, table=None, stats_path=DEFAULT_STATS_PATH):
+        self.table = table if table is not None else _load_json(SELECTORS_PATH, {})
+        self.stats_path = stats_path
+        self._lock = threading.Lock()
+        self._counts = {}
+        self._unsaved = 0
+        if stats_path:
+            self._counts = _load_json(stats_path, {}).get("selectors", {})
+
+    def candidates(self, platform, page, name):
+        for section in (platform, "default"):
+            xpaths = self.table.get(section or "default", {}).get(page, {}).get(name)
+            if xpaths:
+                return xpaths
+        raise KeyError(f"No selectors for {page}/{name}")
+
+    def catch_alls(self, platform, page, name):
+        for section in (platform, "default"):
+            xpaths = self.table.get(section or "default", {}).get(page, {}).get("catch_all", {}).get(name)
+            if xpaths:
+                return xpaths
+        return []
+
+    def ordered(self, platform, page, name, candidates=None):
+        """Candidates in learned order (catch-alls excluded)"""
+        candidates = candidates or self.candidates(platform, page, name)
+        with self._lock:
+            counts = self._counts.get(selector_key(platform, page, name), {})
+
+            def score(xpath):
+                hits, tries = counts.get(xpath, (0, 0))
+                return (hits + 1) / (tries + 2)
+            return sorted(candidates, key=score, reverse=True)
+
+    def record(self, platform, page, name, xpath, hit):
+        with self._lock:
+            counts = self._counts.setdefault(selector_key(platform, page, name), {})
+            hits, tries = counts.get(xpath, (0, 0))
+            hits, tries = hits + (1 if hit else 0), tries + 1
+            if tries > MAX_TRIES:
+                hits, tries = hits / 2, tries / 2
+            counts[xpath] = (hits, tries)
+            self._unsaved += 1
+            save = self._unsaved >= SAVE_EVERY
+        if save:
+            self.save()
+
+    def find(self, driver, platform, page, name, usable=None):
+        """The first element, across candidates in learned order then catch-alls, for which usable(element) holds"""
+        for xpath in self.ordered(platform, page, name):
+            element = _first_usable(driver, xpath, usable)
+            self.record(platform, page, name, xpath, element is not None)
+            if element is not None:
+                return element
+        for xpath in self.catch_alls(platform, page, name):
+            element = _first_usable(driver, xpath, usable)
+            if element is not None:
+                return element
+        return None
+
+    def find_clickable(self, driver, platform, page, name, with_text=False):
+        """find() restricted to displayed, enabled elements (and with visible text, if asked)"""
+        return self.find(driver, platform, page, name, usable=clickable_with_text if with_text else clickable)
+
+    def find_all(self, driver, platform, page, name, candidates=None):
+        """All matches of the first candidate, in learned order, that matches anything"""
+        for xpath in self.ordered(platform, page, name, candidates):
+            elements = driver.find_elements(By.XPATH, xpath)
+            self.record(platform, page, name, xpath, bool(elements))
+            if elements:
+                return elements
+        return []
+
+    def record_match(self, platform, page, name, ordered, matched):
+        """Book a lookup done elsewhere (e.g. in-page): misses up to matched, a hit for it"""
+        for xpath in ordered:
+            self.record(platform, page, name, xpath, xpath == matched)
+            if xpath == matched:
+                break
+
+    def stats(self):
+        """Per lookup: each selector's hits, tries and hit rate, in the order they are tried"""
+        with self._lock:
+            counts = {key: dict(value) for key, value in self._counts.items()}
+        stats = {}
+        for key, per_xpath in counts.items():
+            rows = [{"xpath": xpath, "hits": round(hits, 1), "tries": round(tries, 1),
+                     "rate": round(hits / tries, 3) if tries else None}
+                    for xpath, (hits, tries) in per_xpath.items()]
+            stats[key] = sorted(rows, key=lambda row: (row["hits"] + 1) / (row["tries"] + 2), reverse=True)
+        return stats
+
+    def save(self):
+        if not self.stats_path:
+            return
+        with self._lock:
+            document = {"selectors": {key: dict(value) for key, value in self._counts.items()}}
+            self._unsaved = 0
+        temp_path = f"{self.stats_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(document, file, indent=1)
+            os.replace(temp_path, self.stats_path)
+        except OSError as e:
+            print(f"⚠️ Could not save selector statistics: {e}")
+
+
+def _first_usable(driver, xpath, usable):
+    try:
+        elements = driver.find_elements(By.XPATH, xpath)
+    except WebDriverException:
+        return None
+    for element in elements:
+        try:
+            if usable is None or usable(element):
+                return element
+        except StaleElementReferenceException:
+            continue
+    return None
+
+
+def _load_json(path, default):
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return default
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_selector_registry():
+    """Return the process-wide registry (SELECTOR_STATS_PATH from config.env; 'off' keeps nothing on disk)"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            stats_path = os.getenv("SELECTOR_STATS_PATH") or DEFAULT_STATS_PATH
+            _registry = SelectorRegistry(stats_path=None if stats_path.lower() == "off" else stats_path)
+            atexit.register(_registry.save)
+        return _registry
+
+
+def print_selector_summary():
+    """Lookups where a fallback has overtaken the first-listed selector, or the best one keeps missing"""
+    registry = get_selector_registry()
+    lines = []
+    for key, rows in sorted(registry.stats().items()):
+        platform, page, name = key.split("/")
+        try:
+            first_listed = registry.candidates(None if platform == "default" else platform, page, name)[0]
+        except KeyError:
+            first_listed = None  # Caller-supplied candidates (e.g. card selectors)
+        best = rows[0]
+        promoted = first_listed is not None and best["xpath"] != first_listed
+        if promoted or (best["rate"] is not None and best["rate"] < 0.5):
+            lines.append(f"{key:>32}: best {best['hits']:.0f}/{best['tries']:.0f} hits"
+                         f"{'  (fallback promoted)' if promoted else ''}  {best['xpath'][:70]}")
+    if lines:
+        print("\n=== Selector Fallbacks ===")
+        print("\n".join(lines))
@@ -0,0 +1,310 @@
+import os
+import sys
+import json
+import time
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sessions.enc")
+
+# Per platform: where its site lives, the cookie a signed-in browser always carries (if any),
+# a members-only page that redirects to the sign-in flow once the session has lapsed and the
+# setting naming the account the "default" one stands for
+PLATFORM_SESSIONS = {
+    "linkedin": {"base_url_env": "LINKEDIN_BASE_URL", "base_url": "https://www.linkedin.com",
+                 "auth_cookie": "li_at", "probe_path": "/feed/", "account_env": "LINKEDIN_ACCOUNT"},
+    "indeed": {"base_url_env": "INDEED_BASE_URL", "base_url": "https://www.indeed.com",
+               "auth_cookie": None, "probe_path": "/account/view", "account_env": None},
+}
+
+_LOCAL_STORAGE_JS = """
+var items = {};
+for (var i = 0; i < localStorage.length; i++) {
+  var key = localStorage.key(i);
+  items[key] = localStorage.getItem(key);
+}
+return {origin: location.origin, items: items};
+"""
+
+_RESTORE_LOCAL_STORAGE_JS = """
+var items = arguments[0];
+for (var key in items) { localStorage.setItem(key, items[key]); }
+"""
+
+# Same-origin fetch that does not follow redirects: a members-only page answering 200 means
+# the cookies still authenticate, an opaque redirect means they no longer do
+_PROBE_JS = """
+var done = arguments[arguments.length - 1];
+fetch(arguments[0], {credentials: 'include', redirect: 'manual'})
+  .then(function (response) { done({status: response.status, type: response.type}); })
+  .catch(function (error) { done({error: String(error)}); });
+"""
+
+
+def base_url(platform):
+    config = PLATFORM_SESSIONS[platform]
+    return os.getenv(config["base_url_env"], config["base_url"]).rstrip("/")
+
+
+def session_account(platform, account=None):
+    """The name a platform account's session is kept under.
+
+    None and "default" (the API's tenant for the server's own login) are the same account: the
+    one the CLI saves under, e.g. LINKEDIN_ACCOUNT, or "default" when that is not set.
+    """
+    if account and account != "default":
+        return account
+    account_env = PLATFORM_SESSIONS.get(platform, {}).get("account_env")
+    return (os.getenv(account_env) if account_env else None) or "default"
+
+
+def session_key(platform, account=None):
+    return f"{platform}:{session_account(platform, account)}"
+
+
+class SessionStore:
+    """Authenticated cookies and localStorage per platform account, kept in one encrypted file.
+
+    The file is a Fernet token (cryptography package) over a JSON document. The key comes from
+    SESSION_STORE_KEY or a key file created next to the store with owner-only permissions.
+    Without the cryptography package nothing is saved or loaded.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH, key=None, max_age_days=14):
+        self.path = path
+        self.max_age_days = max_age_days
+        self._lock = threading.Lock()
+        self._fernet = self._load_fernet(key)
+        self._data = None
+        self._mtime = None
+
+    @property
+    def enabled(self):
+        return self._fernet is not None
+
+    def _load_fernet(self, key):
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError:
+            logger.warning("Session store disabled: install the 'cryptography' package to keep logins between runs")
+            return None
+        key = key or os.getenv("SESSION_STORE_KEY")
+        if not key:
+            key_path = self.path + ".key"
+            if os.path.exists(key_path):
+                with open(key_path, "rb") as file:
+                    key = file.read().strip()
+            else:
+                key = Fernet.generate_key()
+                descriptor = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+                with os.fdopen(descriptor, "wb") as file:
+                    file.write(key)
+        return Fernet(key)
+
+    def _read(self):
+        """The decrypted document, re-read only when the file changed (another process saved)"""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return {}
+        if self._data is not None and mtime == self._mtime:
+            return self._data
+        from cryptography.fernet import InvalidToken
+        try:
+            with open(self.path, "rb") as file:
+                data = json.loads(self._fernet.decrypt(file.read()))
+        except (InvalidToken, ValueError, OSError) as e:
+            print(f"⚠️ Could not read saved sessions ({type(e).__name__}); logging in afresh")
+            data = {}
+        self._data, self._mtime = data, mtime
+        return data
+
+    def _write(self, data):
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(self._fernet.encrypt(json.dumps(data).encode("utf-8")))
+        os.replace(temp_path, self.path)
+        self._data, self._mtime = data, os.path.getmtime(self.path)
+
+    def get(self, platform, account=None):
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._read().get(session_key(platform, account))
+        if entry and self.max_age_days and time.time() - entry["saved_at"] > self.max_age_days * 86400:
+            return None
+        return entry
+
+    def put(self, platform, account, cookies, local_storage=None, origin=None):
+        if not self.enabled:
+            return False
+        with self._lock:
+            data = dict(self._read())
+            data[session_key(platform, account)] = {
+                "platform": platform,
+                "account": session_account(platform, account),
+                "cookies": cookies,
+                "local_storage": local_storage or {},
+                "origin": origin,
+                "saved_at": time.time(),
+            }
+            self._write(data)
+        return True
+
+    def delete(self, platform, account=None):
+        if not self.enabled:
+            return False
+        with self._lock:
+            data = dict(self._read())
+            if data.pop(session_key(platform, account), None) is None:
+                return False
+            self._write(data)
+        return True
+
+    def entries(self):
+        if not self.enabled:
+            return []
+        with self._lock:
+            return list(self._read().values())
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_session_store():
+    """Return the process-wide store (SESSION_STORE_PATH / SESSION_MAX_AGE_DAYS from config.env)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SessionStore(
+                path=os.getenv("SESSION_STORE_PATH") or DEFAULT_STORE_PATH,
+                max_age_days=float(os.getenv("SESSION_MAX_AGE_DAYS", "14")),
+            )
+        return _store
+
+
+# ----- moving sessions in and out of a browser -----
+
+def _has_auth_cookie(platform, cookies):
+    name = PLATFORM_SESSIONS[platform]["auth_cookie"]
+    if name is None:
+        return True
+    now = time.time()
+    return any(cookie["name"] == name and cookie.get("expiry", now + 1) > now for cookie in cookies)
+
+
+def capture_session(driver, platform, account=None, store=None):
+    """Save the cookies and localStorage of the signed-in browser; call it while on the platform's site"""
+    store = store or get_session_store()
+    if not store.enabled:
+        return False
+    try:
+        cookies = driver.get_cookies()
+        storage = driver.execute_script(_LOCAL_STORAGE_JS) or {}
+    except Exception as e:
+        print(f"⚠️ Could not capture the {platform} session: {str(e)[:100]}")
+        return False
+    if not _has_auth_cookie(platform, cookies):
+        print(f"⚠️ No {platform} login found in this browser, nothing saved")
+        return False
+    store.put(platform, account, cookies, storage.get("items"), storage.get("origin"))
+    print(f"🔐 Saved {platform} session for {account or 'default'} ({len(cookies)} cookies)")
+    return True
+
+
+def _to_cdp_cookie(cookie):
+    converted = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly")
+                 if key in cookie}
+    if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+        converted["sameSite"] = cookie["sameSite"]
+    if "expiry" in cookie:
+        converted["expires"] = cookie["expiry"]
+    return converted
+
+
+def probe_session(driver, platform):
+    """True if the browser's cookies still open a members-only page (one in-page fetch)"""
+    url = base_url(platform) + PLATFORM_SESSIONS[platform]["probe_path"]
+    try:
+        result = driver.execute_async_script(_PROBE_JS, url) or {}
+    except Exception:
+        return False
+    return result.get("status") == 200 and result.get("type") != "opaqueredirect"
+
+
+def clear_session(driver):
+    """Sign a browser out of every platform: cookies plus each platform origin's storage.
+
+    Pooled browsers keep their logins between borrowers; this runs before one is handed to a
+    different account, so it never applies through the previous account's session.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for platform in PLATFORM_SESSIONS:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                   {"origin": base_url(platform), "storageTypes": "all"})
+        # sessionStorage lives with the tab rather than the origin's storage
+        driver.execute_script("try { sessionStorage.clear(); localStorage.clear(); } catch (e) {}")
+    except Exception as e:
+        print(f"⚠️ Could not clear the browser session: {str(e)[:100]}")
+        return False
+    driver._session_key = None
+    return True
+
+
+def restore_session(driver, platform, account=None, store=None, validate=True):
+    """Load a saved session into driver; False if there is none or it no longer authenticates.
+
+    Cookies go in with a single Network.setCookies call; localStorage needs the site's origin
+    loaded, so the browser visits robots.txt (the cheapest page there is) first.
+    """
+    store = store or get_session_store()
+    entry = store.get(platform, account)
+    if entry is None or not _has_auth_cookie(platform, entry["cookies"]):
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_to_cdp_cookie(c) for c in entry["cookies"]]})
+        if entry["local_storage"] or validate:
+            driver.get(f"{base_url(platform)}/robots.txt")
+        if entry["local_storage"] and entry["origin"] == driver.execute_script("return location.origin"):
+            driver.execute_script(_RESTORE_LOCAL_STORAGE_JS, entry["local_storage"])
+    except Exception as e:
+        print(f"⚠️ Could not restore the {platform} session: {str(e)[:100]}")
+        return False
+    if validate and not probe_session(driver, platform):
+        print(f"⚠️ Saved {platform} session for {entry['account']} no longer signs in")
+        return False
+    # The same key ensure_session() compares against, whatever spelling of the account the caller used
+    driver._session_key = (platform, session_account(platform, account))
+    driver._session_checked_at = time.time()
+    return True
+
+
+def main():
+    usage = "Usage: python session_store.py [list | forget PLATFORM [ACCOUNT]]"
+    args = sys.argv[1:]
+    if not args or args[0] not in ("list", "forget") or (args[0] == "forget" and len(args) < 2):
+        print(usage)
+        return
+
+    store = get_session_store()
+    if args[0] == "list":
+        for entry in store.entries():
+            age_hours = (time.time() - entry["saved_at"]) / 3600
+            print(f"🔐 {entry['platform']}:{entry['account']}  {len(entry['cookies'])} cookies, "
+                  f"{len(entry['local_storage'])} localStorage items, saved {age_hours:.1f}h ago")
+        return
+
+    account = args[2] if len(args) > 2 else None
+    if store.delete(args[1], account):
+        print(f"✓ Forgot the {args[1]} session for {account or 'default'}")
+    else:
+        print(f"No saved {args[1]} session for {account or 'default'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,13 @@
-from docx import Document
+import sys
 
-# Load the resume file
-doc_path = "Hitesh_CV (1) (2) (1).docx"  # Change this to the correct file path
-doc = Document(doc_path)
+from resume_profile import load_resume_profile
 
-# Extract text from the document
-text = "\n".join([para.text for para in doc.paragraphs])
+# Parsing and caching live in resume_profile; this prints just the skills of a resume
+doc_path = sys.argv[1] if len(sys.argv) > 1 else "Danish_CV.pdf"
+profile = load_resume_profile(doc_path)
 
-# Find the "SKILLS" section and extract skills
-import re
-
-match = re.search(r"SKILLS\s*\n([\s\S]+?)\n\n", text)  # Look for skills between "SKILLS" and next empty line
-if match:
-    skills = match.group(1).strip().replace("\n", ", ")  # Formatting skills as a comma-separated list
+if profile and profile["skills"]:
+    skills = ", ".join(profile["skills"])  # Formatting skills as a comma-separated list
     print("Extracted Skills:", skills)
 else:
     print("Skills section not found!")
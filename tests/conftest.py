@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The bot is a set of top-level modules, not a package; make them importable from tests/
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
@@ -0,0 +1,59 @@
+import pytest
+
+from applied_store import AppliedJobsStore
+
+LINK = "https://www.linkedin.com/jobs/view/12345/?trk=feed"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AppliedJobsStore(path=str(tmp_path / "applied.db"), max_attempts=2)
+    yield store
+    store.close()
+
+
+def result(status, link=LINK):
+    return {"title": "Python Developer", "company": "Acme", "link": link, "status": status}
+
+
+def test_unknown_posting_is_not_skipped(store):
+    assert store.get(LINK) is None
+    assert not store.should_skip(LINK)
+
+
+def test_success_is_skipped_under_any_link_to_the_same_posting(store):
+    store.record(result("Applied successfully!"))
+    assert store.should_skip("https://www.linkedin.com/jobs/view/python-developer-at-acme-12345")
+    assert store.should_skip("https://www.linkedin.com/jobs/search/?currentJobId=12345")
+
+
+def test_failures_are_retried_until_attempts_run_out(store):
+    store.record(result("Failed to find apply button"))
+    assert not store.should_skip(LINK)
+    store.record(result("Failed to find apply button"))
+    assert store.get(LINK)["attempts"] == 2
+    assert store.should_skip(LINK)
+
+
+def test_success_is_never_undone_by_a_later_failure(store):
+    store.record(result("Applied successfully!"))
+    store.record(result("Error: timeout"))
+    entry = store.get(LINK)
+    assert entry["succeeded"]
+    assert entry["status"] == "Error: timeout"
+
+
+def test_final_uses_up_attempts_without_counting_a_success(store):
+    store.record(result("Interrupted after submit"), final=True)
+    entry = store.get(LINK)
+    assert entry["attempts"] == 2
+    assert not entry["succeeded"]
+    assert store.should_skip(LINK)
+
+
+def test_compact_drops_only_stale_failures(store):
+    store.record(result("Applied successfully!"))
+    store.record(result("Error: timeout", link="https://www.linkedin.com/jobs/view/999/"))
+    assert store.compact(older_than_days=-1) == 1
+    assert store.get(LINK) is not None
+    assert store.stats()["total"] == 1
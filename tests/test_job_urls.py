@@ -0,0 +1,51 @@
+import pytest
+
+from job_urls import extract_job_id, job_key, canonicalize_job_url, DedupIndex
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.linkedin.com/jobs/view/12345/", ("linkedin", "12345")),
+    ("https://dk.linkedin.com/jobs/view/python-developer-at-acme-12345?trk=public_jobs", ("linkedin", "12345")),
+    ("https://www.linkedin.com/jobs/search/?keywords=python&currentJobId=12345", ("linkedin", "12345")),
+    ("https://dk.indeed.com/viewjob?jk=ABC123&tk=1h2", ("indeed", "abc123")),
+    ("https://www.indeed.com/jobs?q=python&vjk=abc123", ("indeed", "abc123")),
+    ("https://www.linkedin.com/feed/", None),
+    ("https://careers.example.com/jobs/42", None),
+    ("", None),
+])
+def test_extract_job_id(url, expected):
+    assert extract_job_id(url) == expected
+
+
+def test_tracking_variants_of_a_posting_share_one_key_and_url():
+    variants = [
+        "https://www.linkedin.com/jobs/view/12345/",
+        "https://www.linkedin.com/jobs/view/12345/?refId=abc&trackingId=xyz",
+        "https://dk.linkedin.com/jobs/view/python-developer-at-acme-12345",
+        "https://www.linkedin.com/jobs/search/?currentJobId=12345&keywords=python",
+    ]
+    assert {job_key(url) for url in variants} == {"linkedin:12345"}
+    assert {canonicalize_job_url(url) for url in variants} == {"https://www.linkedin.com/jobs/view/12345/"}
+
+
+def test_indeed_postings_keep_their_host():
+    assert canonicalize_job_url("https://DK.indeed.com/rc/clk?jk=Abc123&from=serp") == "https://dk.indeed.com/viewjob?jk=abc123"
+
+
+def test_other_links_lose_tracking_params_and_fragment_only():
+    url = "https://Careers.Example.com/jobs/42?utm_source=x&lang=en&trk=1&id=7#apply"
+    assert canonicalize_job_url(url) == "https://careers.example.com/jobs/42?id=7&lang=en"
+
+
+def test_key_of_unknown_links_ignores_query_and_trailing_slash():
+    assert job_key("https://careers.example.com/jobs/42/?utm_source=x") == job_key("https://careers.example.com/jobs/42")
+
+
+def test_dedup_index_counts_repeats_of_a_posting():
+    index = DedupIndex()
+    assert index.add("https://www.linkedin.com/jobs/view/1/")
+    assert not index.add("https://www.linkedin.com/jobs/view/1/?trk=abc")
+    assert index.add("https://www.linkedin.com/jobs/view/2/")
+    assert "https://www.linkedin.com/jobs/search/?currentJobId=2" in index
+    assert len(index) == 2
+    assert index.stats() == {"unique": 2, "duplicates_avoided": 1}
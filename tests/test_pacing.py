@@ -0,0 +1,65 @@
+import pytest
+
+import pacing
+from pacing import Pacer
+
+THROTTLED = {"signal": "captcha", "detail": "challenge iframe"}
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping just moves the clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(pacing, "time", clock)
+    return clock
+
+
+def test_burst_starts_immediately_then_waits_for_the_rate(clock):
+    pacer = Pacer("linkedin", rate=360, burst=2)  # one token every 10 s
+    assert pacer.acquire() == 0.0
+    assert pacer.acquire() == 0.0
+    assert pacer.acquire() == pytest.approx(10.0)
+
+
+def test_clean_pages_speed_up_to_max_rate(clock):
+    pacer = Pacer("linkedin", rate=500, max_rate=600, speedup=1.1)
+    for _ in range(5):
+        assert pacer.record() == 0.0
+    assert pacer.rate == 600
+
+
+def test_throttle_halves_rate_and_blocks_for_a_cooldown(clock):
+    pacer = Pacer("linkedin", rate=240, min_rate=20, burst=2, backoff=30)
+    assert pacer.record(THROTTLED) == 30
+    assert pacer.rate == 120
+    assert pacer.acquire() == pytest.approx(30.0)
+    assert pacer.stats()["throttle_events"] == 1
+
+
+def test_consecutive_signals_double_the_cooldown_up_to_the_cap(clock):
+    pacer = Pacer("linkedin", rate=240, min_rate=20, backoff=30, max_backoff=100)
+    assert [pacer.record(THROTTLED) for _ in range(4)] == [30, 60, 100, 100]
+    assert pacer.rate == 20
+    pacer.record()
+    assert pacer.record(THROTTLED) == 30  # a clean page resets the strikes
+
+
+def test_get_pacer_shares_one_pacer_per_platform_account(monkeypatch):
+    monkeypatch.setattr(pacing, "_pacers", {})
+    assert pacing.get_pacer("linkedin", "alice") is pacing.get_pacer("linkedin", "alice")
+    assert pacing.get_pacer("linkedin", "alice") is not pacing.get_pacer("linkedin", "bob")
+    assert pacing.get_pacer("linkedin", "alice") is not pacing.get_pacer("indeed", "alice")
@@ -0,0 +1,69 @@
+import pytest
+
+from relevance import RelevanceScorer, rank_jobs, terms, CARDS_PER_JOB
+
+QUERY = {"python": 1.0, "django": 1.0, "machine learning": 1.0}
+
+
+def card(title, snippet=""):
+    return {"title": title, "company": "Acme", "snippet": snippet, "link": title}
+
+
+def counted(cards, read):
+    """A lazy discovery stream that notes how many cards were read"""
+    for item in cards:
+        read.append(item)
+        yield item
+
+
+@pytest.fixture
+def scorer():
+    return RelevanceScorer(QUERY)
+
+
+def test_terms_include_bigrams_and_drop_stopwords():
+    assert terms("Head of Machine Learning") == ["head", "machine", "learning", "head machine", "machine learning"]
+
+
+def test_scores_rank_matching_cards_first(scorer):
+    cards = [card("Registered Nurse"), card("Python Developer", "Django, REST"), card("Python Tester")]
+    scores = scorer.score(cards)
+    assert scores[0] == 0.0
+    assert scores[1] > scores[2] > 0.0
+    assert all(0.0 <= score <= 1.0 for score in scores)
+
+
+def test_select_keeps_the_best_above_threshold(scorer):
+    cards = [card("Nurse"), card("Python Tester"), card("Python Django Developer")]
+    selected, skipped = scorer.select(cards, top_k=1, threshold=0.01)
+    assert [item["title"] for item in selected] == ["Python Django Developer"]
+    assert {item["title"] for item in skipped} == {"Nurse", "Python Tester"}
+    assert all("relevance" in item for item in cards)
+
+
+def test_rank_jobs_drops_poor_fits(scorer):
+    cards = [card("Nurse"), card("Python Developer"), card("Accountant"), card("Django Developer")]
+    ranked = list(rank_jobs(iter(cards), scorer, threshold=0.01, window=0))
+    assert [item["title"] for item in ranked] == ["Python Developer", "Django Developer"]
+
+
+def test_batches_are_sized_from_the_jobs_still_wanted(scorer):
+    cards = [card("Python Developer") if number % 2 else card("Nurse") for number in range(200)]
+    read = []
+    ranked = list(rank_jobs(counted(cards, read), scorer, threshold=0.01, window=100, top_k=5))
+    assert len(ranked) == 5
+    # One batch of CARDS_PER_JOB per wanted job, well under the 100-card window
+    assert len(read) == CARDS_PER_JOB * 5
+
+
+def test_window_caps_the_batch_size(scorer):
+    read = []
+    stream = rank_jobs(counted([card("Python Developer")] * 50, read), scorer, threshold=0.01, window=4, top_k=10)
+    next(stream)
+    assert len(read) == 4
+
+
+def test_short_batches_keep_reading_until_top_k_or_the_end(scorer):
+    cards = [card("Nurse")] * 30 + [card("Python Developer")] * 2
+    ranked = list(rank_jobs(iter(cards), scorer, threshold=0.01, window=100, top_k=3))
+    assert len(ranked) == 2
@@ -0,0 +1,79 @@
+import os
+import hashlib
+
+import pytest
+
+from resume_cache import ResumeCache, UploadTooLargeError
+
+PDF = b"%PDF-1.4 " + b"x" * 91  # 100 bytes
+
+
+def pdf(tag):
+    return PDF[:-1] + tag
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResumeCache(directory=str(tmp_path / "cache"), max_bytes=250)
+
+
+def test_files_are_stored_once_by_content_hash(cache):
+    digest, path = cache.put_bytes(PDF, filename="My CV.docx")
+    assert digest == hashlib.sha256(PDF).hexdigest()
+    # The real type wins over the uploaded name's extension
+    assert os.path.basename(path) == "My CV.pdf"
+    assert cache.put_bytes(PDF, filename="other.pdf") == (digest, path)
+    assert cache.stats()["entries"] == 1 and cache.hits == 1
+    assert cache.path_for(digest.upper()) == path
+
+
+def test_unsafe_file_names_are_cleaned(cache):
+    _, path = cache.put_bytes(PDF, filename="../../etc/pa$$wd.pdf")
+    assert os.path.basename(path) == "pa_wd.pdf"
+    assert os.path.dirname(os.path.dirname(path)) == cache.directory
+
+
+def test_least_recently_used_file_is_evicted_first(cache):
+    first, _ = cache.put_bytes(pdf(b"1"))
+    second, _ = cache.put_bytes(pdf(b"2"))
+    cache.path_for(first)  # now the most recently used
+    third, _ = cache.put_bytes(pdf(b"3"))
+    assert cache.path_for(second) is None
+    assert cache.path_for(first) and cache.path_for(third)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_pinned_files_survive_eviction_until_unpinned(cache):
+    first, first_path = cache.put_bytes(pdf(b"1"))
+    cache.pin(first_path)
+    cache.put_bytes(pdf(b"2"))
+    cache.put_bytes(pdf(b"3"))
+    assert cache.path_for(first) == first_path
+    cache.unpin(first_path)
+    cache.put_bytes(pdf(b"4"))
+    assert cache.stats()["pinned"] == 0
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+
+def test_lru_order_survives_a_restart(cache):
+    first, _ = cache.put_bytes(pdf(b"1"))
+    second, second_path = cache.put_bytes(pdf(b"2"))
+    os.utime(second_path, (1, 1))  # used long ago
+    reopened = ResumeCache(directory=cache.directory, max_bytes=250)
+    reopened.put_bytes(pdf(b"3"))
+    assert reopened.path_for(second) is None
+    assert reopened.path_for(first)
+
+
+def test_oversized_upload_leaves_nothing_behind(cache):
+    with pytest.raises(UploadTooLargeError):
+        cache.put_bytes(PDF * 3, limit=150)
+    assert os.listdir(cache.directory) == []
+
+
+def test_paths_outside_the_cache_are_never_pinned(cache, tmp_path):
+    outside = tmp_path / "cv.pdf"
+    outside.write_bytes(PDF)
+    cache.pin(str(outside))
+    assert cache.digest_of(str(outside)) is None
+    assert cache.stats()["pinned"] == 0
@@ -0,0 +1,151 @@
+import json
+
+import pytest
+
+import danish_job_bot
+from applied_store import AppliedJobsStore
+from run_checkpoint import (RunCheckpoint, INTERRUPTED_AFTER_SUBMIT, checkpoint_path, tracking, mark_step,
+                            unfinished_runs)
+
+PARAMS = {"search_term": "python", "max_jobs": 4, "platform": "linkedin", "resume_path": "cv.pdf"}
+
+
+def job(number):
+    return {"title": f"Job {number}", "company": "Acme", "link": f"https://www.linkedin.com/jobs/view/{number}/"}
+
+
+def interrupted_run(directory):
+    """A run that discovered jobs 1-3 and crashed: 1 applied, 2 clicked submit, 3 never started"""
+    checkpoint = RunCheckpoint.create(PARAMS, run_id="run_test", directory=str(directory))
+    for number in (1, 2, 3):
+        checkpoint.record_job(job(number))
+    checkpoint.record_result({**job(1), "status": "Applied successfully!"})
+    checkpoint.record_step(job(2)["link"], "submit_clicked")
+    checkpoint.close()
+    return checkpoint.path
+
+
+# ----- the journal -----
+
+def test_replay_restores_the_run(tmp_path):
+    checkpoint = RunCheckpoint(interrupted_run(tmp_path), append=False)
+    assert checkpoint.params == PARAMS
+    assert list(checkpoint.jobs) == [job(number)["link"] for number in (1, 2, 3)]
+    assert checkpoint.ordered_results()[0]["status"] == "Applied successfully!"
+    assert [entry["link"] for entry in checkpoint.pending_jobs()] == [job(3)["link"]]
+    assert [entry["link"] for entry in checkpoint.interrupted_after_submit()] == [job(2)["link"]]
+    assert not checkpoint.discovery_done and not checkpoint.finished
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    path = interrupted_run(tmp_path)
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(json.dumps({"type": "result", "result": {**job(3), "status": "ok"}})[:25])
+    assert [entry["link"] for entry in RunCheckpoint(path, append=False).pending_jobs()] == [job(3)["link"]]
+
+
+def test_reopening_counts_a_resume_and_keeps_the_params(tmp_path):
+    path = interrupted_run(tmp_path)
+    checkpoint = RunCheckpoint(path, {"search_term": "ignored"})
+    checkpoint.close()
+    replayed = RunCheckpoint(path, append=False)
+    assert replayed.resumes == 1
+    assert replayed.params == PARAMS
+
+
+def test_element_is_never_journalled(tmp_path):
+    checkpoint = RunCheckpoint.create(PARAMS, run_id="run_test", directory=str(tmp_path))
+    checkpoint.record_job({**job(1), "element": object()})
+    checkpoint.close()
+    assert "element" not in RunCheckpoint(checkpoint.path, append=False).jobs[job(1)["link"]]
+
+
+def test_track_discovery_drops_known_jobs_and_notes_exhaustion(tmp_path):
+    checkpoint = RunCheckpoint(interrupted_run(tmp_path))
+    found = list(checkpoint.track_discovery(iter([job(2), job(4), job(3), job(5)])))
+    assert [entry["link"] for entry in found] == [job(4)["link"], job(5)["link"]]
+    assert checkpoint.discovery_done
+    checkpoint.close()
+    assert RunCheckpoint(checkpoint.path, append=False).discovery_done
+
+
+def test_discovery_stopped_early_is_not_done(tmp_path):
+    checkpoint = RunCheckpoint(interrupted_run(tmp_path))
+    discovery = checkpoint.track_discovery(iter([job(4), job(5)]))
+    next(discovery)
+    assert not checkpoint.discovery_done
+    checkpoint.close()
+
+
+def test_mark_step_journals_against_the_tracked_job(tmp_path):
+    checkpoint = RunCheckpoint(interrupted_run(tmp_path))
+    mark_step("ignored")  # outside tracking(): no-op
+    with tracking(checkpoint, job(3)["link"]):
+        mark_step("submit_clicked")
+    checkpoint.close()
+    replayed = RunCheckpoint(checkpoint.path, append=False)
+    assert replayed.steps == {job(2)["link"]: "submit_clicked", job(3)["link"]: "submit_clicked"}
+    assert replayed.pending_jobs() == []
+
+
+def test_unfinished_runs_skip_finished_and_active_runs(tmp_path):
+    interrupted_run(tmp_path)
+    done = RunCheckpoint.create(PARAMS, run_id="run_done", directory=str(tmp_path))
+    done.finish()
+    assert [run["run_id"] for run in unfinished_runs(str(tmp_path))] == ["run_test"]
+    assert unfinished_runs(str(tmp_path), active={"run_test"}) == []
+
+
+# ----- resuming (danish_job_bot.resume_run) with the browser work stubbed out -----
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    """Stub the browser side of resume_run; records what was applied to and searched for"""
+    calls = {"applied": [], "searched": []}
+
+    def apply_for_job(driver, link, resume_path):
+        calls["applied"].append(link)
+        return "Applied successfully!"
+
+    def search(driver, search_term, resume_path, max_jobs, **kwargs):
+        calls["searched"].append(max_jobs)
+        return []
+
+    store = AppliedJobsStore(path=str(tmp_path / "applied.db"))
+    monkeypatch.setenv("RESULTS_LOG", "off")
+    monkeypatch.setattr(danish_job_bot, "apply_for_job", apply_for_job)
+    monkeypatch.setattr(danish_job_bot, "search_and_apply_for_jobs", search)
+    monkeypatch.setattr(danish_job_bot, "pacer_for", lambda driver, link: type("Pacer", (), {"acquire": lambda self: 0})())
+    monkeypatch.setattr(danish_job_bot, "record_pacing", lambda driver, pacer: None)
+    monkeypatch.setattr(danish_job_bot, "get_applied_store", lambda: store)
+    calls["store"] = store
+    yield calls
+    store.close()
+
+
+def test_resume_applies_only_pending_jobs_and_never_retries_submitted_ones(tmp_path, bot):
+    path = interrupted_run(tmp_path)
+    results = danish_job_bot.resume_run(object(), RunCheckpoint(path))
+    assert bot["applied"] == [job(3)["link"]]
+    assert [result["status"] for result in results] == ["Applied successfully!", INTERRUPTED_AFTER_SUBMIT,
+                                                        "Applied successfully!"]
+    assert bot["store"].should_skip(job(2)["link"])
+    # Four jobs wanted, three discovered: the search runs again for the last one
+    assert bot["searched"] == [1]
+
+
+def test_second_resume_applies_nothing_twice(tmp_path, bot):
+    path = interrupted_run(tmp_path)
+    danish_job_bot.resume_run(object(), RunCheckpoint(path))
+    bot["applied"].clear()
+    danish_job_bot.resume_run(object(), RunCheckpoint(path))
+    assert bot["applied"] == []
+
+
+def test_quota_caps_a_resume_and_leaves_the_run_resumable(tmp_path, bot):
+    path = interrupted_run(tmp_path)
+    checkpoint = RunCheckpoint(path)
+    danish_job_bot.resume_run(object(), checkpoint, max_jobs=0)
+    assert bot["applied"] == [] and bot["searched"] == []
+    assert not RunCheckpoint(path, append=False).finished
+    assert RunCheckpoint(checkpoint_path("run_test", str(tmp_path)), append=False).pending_jobs()
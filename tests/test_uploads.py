@@ -0,0 +1,139 @@
+import io
+import os
+import json
+import base64
+
+import pytest
+from flask import Flask, request
+
+import uploads
+from resume_cache import ResumeCache, UploadTooLargeError
+from uploads import Base64StreamDecoder, read_upload_request, streaming_request_class
+
+PDF = b"%PDF-1.4\n" + bytes(range(256)) * 40
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResumeCache(directory=str(tmp_path / "cache"))
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # Odd-sized chunks put field, quote, escape and base64 boundaries everywhere
+    monkeypatch.setattr(uploads, "CHUNK_SIZE", 7)
+
+
+def cache_files(cache):
+    return sorted(name for name in os.listdir(cache.directory))
+
+
+def read_json(cache, body, limit=10 * 1024 * 1024):
+    return uploads._read_json_upload(io.BytesIO(body), cache, limit)
+
+
+# ----- base64 decoding -----
+
+@pytest.mark.parametrize("slice_size", [1, 2, 3, 5, 64])
+def test_decoder_matches_b64decode_for_any_slicing(slice_size):
+    encoded = b"data:application/pdf;base64," + base64.b64encode(PDF)
+    encoded = encoded[:60] + b"\n  " + encoded[60:]
+    decoder = Base64StreamDecoder()
+    decoded = b"".join(decoder.feed(encoded[start:start + slice_size])
+                       for start in range(0, len(encoded), slice_size))
+    decoder.finish()
+    assert decoded == PDF
+
+
+def test_decoder_rejects_truncated_and_invalid_data():
+    decoder = Base64StreamDecoder()
+    decoder.feed(base64.b64encode(PDF)[:-2])
+    with pytest.raises(ValueError):
+        decoder.finish()
+    with pytest.raises(ValueError):
+        Base64StreamDecoder().feed(b"not*base64")
+
+
+# ----- JSON bodies -----
+
+def test_json_upload_streams_base64_fields_into_the_cache(cache):
+    body = json.dumps({
+        "search_term": "python \"developer\"",
+        "resume_file": base64.b64encode(PDF).decode(),
+        "resume_filename": "Jane Doe.pdf",
+        "filters": {"resume_file": "not a top-level field"},
+        "max_jobs": 3,
+    }).encode()
+    fields, paths = read_json(cache, body)
+    assert fields["search_term"] == 'python "developer"'
+    assert fields["resume_file"] is None
+    assert fields["filters"] == {"resume_file": "not a top-level field"}
+    assert fields["max_jobs"] == 3
+    assert os.path.basename(paths["resume_path"]) == "Jane Doe.pdf"
+    with open(paths["resume_path"], "rb") as file:
+        assert file.read() == PDF
+
+
+def test_json_upload_accepts_escaped_slashes_in_base64(cache):
+    encoded = base64.b64encode(PDF).decode().replace("/", "\\/")
+    _, paths = read_json(cache, ('{"resume_file": "%s"}' % encoded).encode())
+    with open(paths["resume_path"], "rb") as file:
+        assert file.read() == PDF
+
+
+def test_empty_base64_field_is_no_upload(cache):
+    fields, paths = read_json(cache, b'{"resume_file": "", "search_term": "x"}')
+    assert paths == {} and fields["search_term"] == "x"
+    assert cache_files(cache) == []
+
+
+@pytest.mark.parametrize("body", [
+    b'{"resume_file": "JVBERi0',            # body ends inside the base64 value
+    b'{"resume_file": "JVB*ERi0"}',         # not base64
+    b'["resume_file"]',                     # not an object
+    b'{"search_term": }',                   # not JSON
+])
+def test_malformed_json_bodies_leave_nothing_behind(cache, body):
+    with pytest.raises(ValueError):
+        read_json(cache, body)
+    assert cache_files(cache) == []
+
+
+def test_oversized_base64_upload_is_rejected_while_streaming(cache):
+    body = json.dumps({"resume_file": base64.b64encode(PDF).decode()}).encode()
+    with pytest.raises(UploadTooLargeError):
+        read_json(cache, body, limit=len(PDF) // 2)
+    assert cache_files(cache) == []
+
+
+def test_huge_plain_fields_are_refused(cache):
+    body = json.dumps({"search_term": "x" * (uploads.MAX_JSON_FIELDS_BYTES + 1)}).encode()
+    with pytest.raises(UploadTooLargeError):
+        read_json(cache, body)
+
+
+# ----- multipart bodies through the streaming request class -----
+
+def multipart_request(cache, data):
+    app = Flask(__name__)
+    app.request_class = streaming_request_class(cache)
+    return app.test_request_context("/apply", method="POST", data=data, content_type="multipart/form-data")
+
+
+def test_multipart_files_are_spooled_straight_into_the_cache(cache):
+    data = {"search_term": "python", "resume": (io.BytesIO(PDF), "cv.pdf")}
+    with multipart_request(cache, data):
+        fields = read_upload_request(request, cache)
+    assert fields["search_term"] == "python"
+    assert cache.digest_of(fields["resume_path"]) is not None
+    with open(fields["resume_path"], "rb") as file:
+        assert file.read() == PDF
+    # Only the committed file is left: no spool or temp file
+    assert len(cache_files(cache)) == 1
+
+
+def test_multipart_upload_over_the_limit_is_rejected(cache, monkeypatch):
+    monkeypatch.setenv("UPLOAD_MAX_MB", str(len(PDF) / 2 / (1024 * 1024)))
+    with multipart_request(cache, {"resume": (io.BytesIO(PDF), "cv.pdf")}):
+        with pytest.raises(UploadTooLargeError):
+            read_upload_request(request, cache)
@@ -0,0 +1,204 @@
+import os
+import json
+import time
+import itertools
+import threading
+import functools
+
+# Spans are only recorded when tracing is on: TRACE_DIR set in the environment, or enable()
+_enabled = bool(os.getenv("TRACE_DIR"))
+_local = threading.local()
+_lock = threading.Lock()
+_spans = []
+_ids = itertools.count(1)
+_origin = time.perf_counter()
+_origin_wall = time.time()
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def _command_count():
+    return getattr(_local, "commands", 0)
+
+
+def note_command():
+    """Count one WebDriver command against the spans open on the calling thread.
+
+    Called by driver_metrics.InstrumentedDriver for every command it sends.
+    """
+    _local.commands = getattr(_local, "commands", 0) + 1
+
+
+class _Span:
+    __slots__ = ("name", "attrs", "id", "parent_id", "started", "commands")
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+
+    def set(self, **attrs):
+        """Attach attributes discovered while the span is open (e.g. the outcome)"""
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self.id = next(_ids)
+        self.parent_id = stack[-1].id if stack else None
+        stack.append(self)
+        self.commands = _command_count()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        ended = time.perf_counter()
+        _local.stack.pop()
+        record = {
+            "name": self.name,
+            "span_id": self.id,
+            "parent_id": self.parent_id,
+            "thread": threading.current_thread().name,
+            "tid": threading.get_ident(),
+            "start": round(_origin_wall + (self.started - _origin), 6),
+            "duration_ms": round((ended - self.started) * 1000, 3),
+            "webdriver_calls": _command_count() - self.commands,
+            "attrs": self.attrs,
+        }
+        if exc_type is not None:
+            record["error"] = f"{exc_type.__name__}: {str(exc)[:200]}"
+        with _lock:
+            _spans.append(record)
+        return False
+
+
+class _NoopSpan:
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name, **attrs):
+    """Context manager timing one pipeline phase; nests under the span already open on this thread"""
+    if not _enabled:
+        return _NOOP
+    return _Span(name, attrs)
+
+
+def traced(name):
+    """Decorator form of span() for functions that are a phase in themselves"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ----- collected spans -----
+
+def get_spans():
+    with _lock:
+        return list(_spans)
+
+
+def reset_spans():
+    with _lock:
+        _spans.clear()
+
+
+def drain_spans():
+    """Return and forget every finished span"""
+    with _lock:
+        spans = list(_spans)
+        _spans.clear()
+    return spans
+
+
+def export_jsonl(path, spans):
+    """One JSON object per span, in completion order"""
+    with open(path, "w", encoding="utf-8") as file:
+        for record in spans:
+            file.write(json.dumps(record) + "\n")
+
+
+def export_chrome_trace(path, spans):
+    """Chrome trace-event JSON (complete 'X' events), for chrome://tracing, Perfetto or speedscope"""
+    events = [{"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": "job bot"}}]
+    for tid, thread in {(s["tid"], s["thread"]) for s in spans}:
+        events.append({"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": thread}})
+    for record in spans:
+        events.append({
+            "name": record["name"],
+            "cat": record["name"].split(".")[0],
+            "ph": "X",
+            "ts": round(record["start"] * 1e6),
+            "dur": round(record["duration_ms"] * 1000),
+            "pid": os.getpid(),
+            "tid": record["tid"],
+            "args": {**record["attrs"], "webdriver_calls": record["webdriver_calls"],
+                     **({"error": record["error"]} if "error" in record else {})},
+        })
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+
+def export_trace(directory=None, prefix="trace"):
+    """Write the spans collected so far to <prefix>_<timestamp>.jsonl and .trace.json in TRACE_DIR.
+
+    Returns the two paths, or None when there is nothing to write.
+    """
+    directory = directory or os.getenv("TRACE_DIR")
+    spans = drain_spans()
+    if not directory or not spans:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    stem = os.path.join(directory, f"{prefix}_{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}")
+    export_jsonl(stem + ".jsonl", spans)
+    export_chrome_trace(stem + ".trace.json", spans)
+    return stem + ".jsonl", stem + ".trace.json"
+
+
+def summarize(spans):
+    """Per span name: count, total/mean duration and WebDriver calls"""
+    summary = {}
+    for record in spans:
+        entry = summary.setdefault(record["name"], {"count": 0, "total_ms": 0.0, "webdriver_calls": 0})
+        entry["count"] += 1
+        entry["total_ms"] += record["duration_ms"]
+        entry["webdriver_calls"] += record["webdriver_calls"]
+    for entry in summary.values():
+        entry["total_ms"] = round(entry["total_ms"], 3)
+        entry["mean_ms"] = round(entry["total_ms"] / entry["count"], 3)
+    return summary
+
+
+def print_trace_summary(spans=None):
+    spans = get_spans() if spans is None else spans
+    if not spans:
+        return
+    print("\n=== Trace Summary ===")
+    for name, entry in sorted(summarize(spans).items(), key=lambda item: -item[1]["total_ms"]):
+        print(f"{name:>22}: {entry['count']:>3}x  total {entry['total_ms'] / 1000:>7.2f}s  "
+              f"mean {entry['mean_ms']:>8.1f}ms  webdriver calls {entry['webdriver_calls']}")
@@ -0,0 +1,216 @@
+import os
+import json
+import base64
+import binascii
+
+from flask import Request
+
+from resume_cache import CacheSpool, UploadTooLargeError, CHUNK_SIZE
+
+# Upload fields: multipart part / JSON base64 key -> the form field its cached path is stored in
+MULTIPART_FILES = {"resume": "resume_path", "cover_letter": "cover_letter_path"}
+BASE64_FIELDS = {"resume_file": "resume_path", "cover_letter_file": "cover_letter_path"}
+
+# Everything in a JSON upload except the base64 values is read into memory; bound it
+MAX_JSON_FIELDS_BYTES = 256 * 1024
+
+_WHITESPACE = b" \t\r\n"
+
+
+def upload_limit():
+    """Largest accepted file in bytes (UPLOAD_MAX_MB from config.env)"""
+    return int(float(os.getenv("UPLOAD_MAX_MB", "10")) * 1024 * 1024)
+
+
+class Base64StreamDecoder:
+    """Decode base64 fed in arbitrary slices, holding back at most three characters between calls.
+
+    Whitespace and a leading data: URL prefix (as FileReader.readAsDataURL produces) are skipped.
+    """
+
+    def __init__(self):
+        self._pending = b""
+        self._head = b""
+        self._started = False
+
+    def feed(self, data):
+        data = data.translate(None, _WHITESPACE)
+        if not self._started:
+            self._head += data
+            if len(self._head) < 5 and b"data:".startswith(self._head):
+                return b""
+            if self._head.startswith(b"data:"):
+                comma = self._head.find(b",")
+                if comma == -1:
+                    if len(self._head) > 256:
+                        raise ValueError("malformed data URL")
+                    return b""
+                data = self._head[comma + 1:]
+            else:
+                data = self._head
+            self._head, self._started = b"", True
+        data = self._pending + data
+        usable = len(data) - len(data) % 4
+        self._pending = data[usable:]
+        try:
+            return base64.b64decode(data[:usable], validate=True)
+        except binascii.Error as e:
+            raise ValueError(f"invalid base64 data: {e}")
+
+    def finish(self):
+        if self._pending or self._head:
+            raise ValueError("truncated base64 data")
+
+
+class StreamingUploadRequest(Request):
+    """Flask request whose multipart file parts are written straight into the resume cache.
+
+    Werkzeug normally buffers each part in memory (or a temp file past 500 KB) before the view
+    sees it; here every chunk goes to a CacheSpool as the body is parsed, with the size limit
+    enforced on the way.
+    """
+
+    resume_cache = None
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return self.resume_cache.spool(filename, upload_limit())
+
+
+def streaming_request_class(cache):
+    """A StreamingUploadRequest bound to cache, for app.request_class"""
+    return type("StreamingUploadRequest", (StreamingUploadRequest,), {"resume_cache": cache})
+
+
+def _read_json_upload(stream, cache, limit):
+    """Parse a JSON body whose base64 file fields may be megabytes long without holding them in memory.
+
+    The small fields are collected into a skeleton that is parsed with json.loads at the end;
+    each top-level base64 field is replaced there by null and decoded chunk by chunk into a
+    spool in the cache instead. Returns (fields, {form field: cached path}).
+    """
+    skeleton = bytearray()
+    paths = {}
+    depth = 0
+    in_string = escaped = False
+    token = bytearray()
+    last_string = None
+    key = None
+    after_colon = False
+
+    spool = decoder = None
+    target = None
+    value_escaped = False
+
+    try:
+        for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+            position = 0
+            while position < len(chunk):
+                if spool is not None:
+                    # Inside a base64 value: jump straight to the next quote or escape
+                    if value_escaped:
+                        value_escaped = False
+                        escaped_char = chunk[position:position + 1]
+                        if escaped_char == b"/":
+                            spool.write(decoder.feed(b"/"))
+                        elif escaped_char not in (b"n", b"r", b"t"):
+                            raise ValueError("unexpected escape in base64 data")
+                        position += 1
+                        continue
+                    end = len(chunk)
+                    for stop in (chunk.find(b'"', position), chunk.find(b"\\", position)):
+                        if stop != -1:
+                            end = min(end, stop)
+                    spool.write(decoder.feed(chunk[position:end]))
+                    if end == len(chunk):
+                        break
+                    if chunk[end:end + 1] == b"\\":
+                        value_escaped = True
+                    else:
+                        decoder.finish()
+                        if spool.size:
+                            paths[BASE64_FIELDS[target]] = spool
+                        else:
+                            spool.close()
+                        spool = decoder = None
+                        skeleton += b"null"
+                    position = end + 1
+                    continue
+
+                byte = chunk[position:position + 1]
+                position += 1
+                if in_string:
+                    skeleton += byte
+                    if escaped:
+                        escaped = False
+                    elif byte == b"\\":
+                        escaped = True
+                    elif byte == b'"':
+                        in_string = False
+                        last_string = bytes(token)
+                    else:
+                        token += byte
+                    continue
+                if byte == b'"':
+                    if after_colon and depth == 1 and key in BASE64_FIELDS:
+                        # The start of a top-level base64 field: stream it into the cache
+                        target = key
+                        spool = cache.spool(None, limit)
+                        decoder = Base64StreamDecoder()
+                        after_colon = False
+                        continue
+                    in_string, token = True, bytearray()
+                    after_colon = False
+                    skeleton += byte
+                    continue
+                if byte in (b"{", b"["):
+                    depth += 1
+                elif byte in (b"}", b"]"):
+                    depth -= 1
+                if byte == b":":
+                    key, after_colon = last_string.decode("utf-8", "replace") if last_string else None, True
+                elif byte not in (b" ", b"\t", b"\r", b"\n"):
+                    after_colon = False
+                skeleton += byte
+            if len(skeleton) > MAX_JSON_FIELDS_BYTES:
+                raise UploadTooLargeError("request fields too large")
+        if spool is not None:
+            raise ValueError("truncated JSON body")
+        fields = json.loads(bytes(skeleton) or b"{}")
+        if not isinstance(fields, dict):
+            raise ValueError("JSON body must be an object")
+    except BaseException:
+        for open_spool in list(paths.values()) + [spool]:
+            if open_spool is not None:
+                open_spool.close()
+        raise
+
+    for field, pending in list(paths.items()):
+        file_type = field[:-len("_path")]
+        pending.filename = fields.get(f"{file_type}_filename")
+        paths[field] = cache.commit(pending, file_type)[1]
+    return fields, paths
+
+
+def read_upload_request(req, cache):
+    """Form fields of a JSON or multipart /apply-style request, with uploaded files cached on disk.
+
+    Files are streamed into the cache whichever way they arrive, and their cached paths are
+    returned as resume_path / cover_letter_path. Raises UploadTooLargeError past UPLOAD_MAX_MB
+    and ValueError for malformed bodies.
+    """
+    limit = upload_limit()
+    if req.mimetype == "application/json":
+        fields, paths = _read_json_upload(req.stream, cache, limit)
+        fields.update(paths)
+        return fields
+
+    data = req.form.to_dict()
+    for part, field in MULTIPART_FILES.items():
+        upload = req.files.get(part)
+        if upload is None or not upload.filename:
+            continue
+        if isinstance(upload.stream, CacheSpool):
+            data[field] = cache.commit(upload.stream, part)[1]
+        else:
+            data[field] = cache.put_stream(upload.stream, upload.filename, part, limit)[1]
+    return data
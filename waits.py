@@ -0,0 +1,226 @@
+import os
+import time
+import threading
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Per-step timeouts (seconds). A step returns as soon as its readiness predicate holds,
+# so these are upper bounds, not the time actually spent.
+TIMEOUT_PROFILES = {
+    "fast": {
+        "page_load": 8, "search_results": 8, "filters": 4, "filter_option": 2,
+        "easy_apply_modal": 6, "modal_settle": 3, "step_advanced": 4, "file_attached": 3,
+        "field_filled": 1, "upload_retry": 2, "results_scroll": 1.5,
+    },
+    "default": {
+        "page_load": 15, "search_results": 15, "filters": 6, "filter_option": 3,
+        "easy_apply_modal": 10, "modal_settle": 4, "step_advanced": 8, "file_attached": 5,
+        "field_filled": 2, "upload_retry": 3, "results_scroll": 3,
+    },
+    "slow": {
+        "page_load": 30, "search_results": 30, "filters": 12, "filter_option": 6,
+        "easy_apply_modal": 20, "modal_settle": 8, "step_advanced": 15, "file_attached": 10,
+        "field_filled": 4, "upload_retry": 6, "results_scroll": 6,
+    },
+}
+
+POLL_FREQUENCY = 0.1
+
+JOB_CARD_XPATHS = {
+    "linkedin": "//div[contains(@class, 'job-card-container') or contains(@class, 'job-search-card')] | "
+                "//a[contains(@href, '/jobs/view/')] | "
+                "//li[contains(@class, 'job-result-card') or contains(@class, 'jobs-search-result-item')]",
+    "indeed": "//div[contains(@class, 'job_seen_beacon')] | //div[contains(@class, 'slider_container')] | "
+              "//div[contains(@class, 'jobsearch-SerpJobCard')] | //h2[contains(@class, 'jobTitle')]",
+}
+
+
+def get_timeout(step):
+    """Timeout for a step under the active profile (WAIT_PROFILE env var, default 'default')"""
+    profile = TIMEOUT_PROFILES.get(os.getenv("WAIT_PROFILE", "default"), TIMEOUT_PROFILES["default"])
+    return profile.get(step, 10)
+
+
+# ----- time-saved metrics -----
+
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+def _record(step, waited, legacy_sleep, timed_out):
+    with _stats_lock:
+        entry = _stats.setdefault(step, {"count": 0, "waited_s": 0.0, "legacy_sleep_s": 0.0, "timeouts": 0})
+        entry["count"] += 1
+        entry["waited_s"] += waited
+        entry["legacy_sleep_s"] += legacy_sleep
+        if timed_out:
+            entry["timeouts"] += 1
+
+
+def get_wait_stats():
+    """Per-step totals plus the time saved compared with the fixed sleeps the waits replaced"""
+    with _stats_lock:
+        steps = {}
+        for step, entry in _stats.items():
+            steps[step] = {
+                "count": entry["count"],
+                "timeouts": entry["timeouts"],
+                "waited_s": round(entry["waited_s"], 3),
+                "legacy_sleep_s": round(entry["legacy_sleep_s"], 3),
+                "saved_s": round(entry["legacy_sleep_s"] - entry["waited_s"], 3),
+            }
+    return {
+        "steps": steps,
+        "total_waited_s": round(sum(s["waited_s"] for s in steps.values()), 3),
+        "total_saved_s": round(sum(s["saved_s"] for s in steps.values()), 3),
+    }
+
+
+def reset_wait_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def print_wait_summary():
+    stats = get_wait_stats()
+    if not stats["steps"]:
+        return
+    print("\n=== Wait Summary (vs. fixed sleeps) ===")
+    for step, entry in sorted(stats["steps"].items()):
+        print(f"{step:>16}: {entry['count']:>3}x  waited {entry['waited_s']:>7.2f}s  "
+              f"saved {entry['saved_s']:>7.2f}s  timeouts {entry['timeouts']}")
+    print(f"⏱️ Total time saved: {stats['total_saved_s']:.1f}s")
+
+
+# ----- the wait primitive -----
+
+def wait_for(driver, step, condition, legacy_sleep, timeout=None):
+    """Wait until condition(driver) is truthy, recording the time saved vs. legacy_sleep.
+
+    Returns the condition's value, or False if the step timed out.
+    """
+    timeout = get_timeout(step) if timeout is None else timeout
+    started = time.monotonic()
+    try:
+        result = WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY,
+                               ignored_exceptions=(StaleElementReferenceException,)).until(condition)
+        timed_out = False
+    except TimeoutException:
+        result = False
+        timed_out = True
+    _record(step, time.monotonic() - started, legacy_sleep, timed_out)
+    return result
+
+
+# ----- readiness predicates -----
+
+def document_ready(driver):
+    try:
+        return driver.execute_script("return document.readyState") == "complete"
+    except WebDriverException:
+        return False
+
+
+def any_present(xpath):
+    """At least one element matches xpath"""
+    def _predicate(driver):
+        return driver.find_elements(By.XPATH, xpath) or False
+    return _predicate
+
+
+def any_visible(xpath):
+    """At least one element matching xpath is displayed"""
+    def _predicate(driver):
+        for element in driver.find_elements(By.XPATH, xpath):
+            if element.is_displayed():
+                return element
+        return False
+    return _predicate
+
+
+def search_results_present(platform):
+    """The results list for the platform has rendered at least one job card"""
+    return any_present(JOB_CARD_XPATHS[platform])
+
+
+def page_reloaded(old_element, then=document_ready):
+    """old_element has been detached from the DOM and the new page satisfies `then`"""
+    def _predicate(driver):
+        try:
+            old_element.is_enabled()
+            return False
+        except StaleElementReferenceException:
+            return then(driver)
+    return _predicate
+
+
+_MODAL_OPEN_JS = """
+const modal = document.querySelector(
+    "[role='dialog'], .jobs-easy-apply-modal, .artdeco-modal, .ia-BasePage, form[action*='apply']");
+if (modal && modal.offsetParent !== null) return true;
+return window.location.href.indexOf('apply') !== -1 && document.readyState === 'complete';
+"""
+
+
+def easy_apply_modal_open(driver):
+    """The Easy Apply dialog (or an external apply form) is on screen"""
+    try:
+        return bool(driver.execute_script(_MODAL_OPEN_JS))
+    except WebDriverException:
+        return False
+
+
+_STEP_SIGNATURE_JS = """
+const root = document.querySelector("[role='dialog'], .jobs-easy-apply-modal, .artdeco-modal") || document.body;
+const progress = root.querySelector("progress, [role='progressbar']");
+const heading = root.querySelector("h1, h2, h3");
+const buttons = Array.from(root.querySelectorAll('button')).map(b => b.innerText.trim()).join('|');
+return [location.href, progress ? (progress.value || progress.getAttribute('aria-valuenow')) : '',
+        heading ? heading.innerText : '', buttons, root.innerText.length].join('#');
+"""
+
+
+def step_signature(driver):
+    """A cheap fingerprint of the current application step, used to detect that a click advanced it"""
+    try:
+        return driver.execute_script(_STEP_SIGNATURE_JS)
+    except WebDriverException:
+        return None
+
+
+def step_advanced(previous_signature):
+    """The application step differs from the one captured before the click"""
+    def _predicate(driver):
+        signature = step_signature(driver)
+        return signature is not None and signature != previous_signature
+    return _predicate
+
+
+def file_chip_attached(input_element, file_path):
+    """The file input holds a file, or the page shows the uploaded file's name"""
+    file_name = os.path.basename(file_path)
+
+    def _predicate(driver):
+        try:
+            return driver.execute_script(
+                "const el = arguments[0];"
+                "if (el && el.files && el.files.length > 0) return true;"
+                "return document.body.innerText.indexOf(arguments[1]) !== -1;",
+                input_element, file_name)
+        except StaleElementReferenceException:
+            # The input is replaced by a file chip once the upload registers
+            return True
+    return _predicate
+
+
+def field_has_value(element, value):
+    def _predicate(driver):
+        return (element.get_attribute("value") or "") == value
+    return _predicate
+
+
+def element_selected(element):
+    def _predicate(driver):
+        return element.is_selected()
+    return _predicate